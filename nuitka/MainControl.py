@@ -52,11 +52,16 @@ from nuitka.utils.FileOperations import (
 )
 
 from . import ModuleRegistry, Options, TreeXML
-from .build import SconsInterface
+from .build import OptimizationProfiles, SconsInterface
 from .codegen import CodeGeneration, ConstantCodes
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
+from .freezer.DistFiles import installDistFile
 from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
+from .freezer.StartupModules import (
+    getModulesInStartupOrder,
+    getStartupModules
+)
 from .optimizations import Optimization
 from .tree import Building
 
@@ -199,7 +204,7 @@ def cleanSourceDirectory(source_dir):
                 path       = path,
                 extensions = (".c", ".h", ".o", ".os", ".obj",
                               ".bin", ".res", ".rc", ".S", ".cpp",
-                              ".manifest")
+                              ".manifest", ".txt")
             ):
                 deleteFile(path, must_exist = True)
     else:
@@ -265,8 +270,32 @@ def pickSourceFilenames(source_dir, modules):
     return module_filenames
 
 
+def getModuleHeaderFilename(c_filename):
+    return c_filename[:-2] + ".h"
+
+
+def getModulePartFilename(c_filename, count):
+    """ Filename for a part of a module split into several files.
+
+    Module names cannot contain "-", so these never collide with the
+    filenames of other modules.
+    """
+
+    return "%s-part%d.c" % (c_filename[:-2], count)
+
+
+def getOptimizationProfilesFilename(main_module):
+    return os.path.join(
+        getSourceDirectoryPath(main_module),
+        "__optimization_profiles.txt"
+    )
+
+
 standalone_entry_points = []
 
+# Ranges of the constants blob read at startup, to be paged in early.
+startup_blob_ranges = []
+
 
 def makeSourceDirectory(main_module):
     """ Get the full list of modules imported, create code for all of them.
@@ -353,16 +382,57 @@ def makeSourceDirectory(main_module):
             if module is main_module and not Options.shallMakeModule():
                 prepared_modules[c_filename][1].getConstantCode(0)
 
+    if Options.hasCOptimizationProfiles():
+        optimization_profiles = \
+          OptimizationProfiles.getModuleOptimizationProfiles(
+            modules = [
+                module
+                for module in ModuleRegistry.getDoneModules()
+                if module.isCompiledPythonModule()
+            ]
+        )
+    else:
+        optimization_profiles = {}
+
+    # The C files to compile with another optimization profile.
+    profile_c_filenames = []
+
+    # With startup layout, the bytecode of modules imported at startup goes
+    # first into the blob, in the order of import, followed by the constants
+    # of the compiled ones, by generating their code first.
+    if Options.shallUseStartupLayout():
+        startup_modules = getStartupModules(main_module)
+        startup_start = len(ConstantCodes.stream_data.getBytes())
+
+        for module in startup_modules:
+            if module.isUncompiledPythonModule():
+                ConstantCodes.stream_data.getStreamDataOffset(
+                    module.getByteCode()
+                )
+
+        startup_end = len(ConstantCodes.stream_data.getBytes())
+    else:
+        startup_modules = ()
+
+    startup_module_set = set(startup_modules)
+
     # Second pass, generate the actual module code into the files.
-    for module in ModuleRegistry.getDoneModules():
+    for module in getModulesInStartupOrder(
+            modules         = ModuleRegistry.getDoneModules(),
+            startup_modules = startup_modules
+        ):
         if module.isCompiledPythonModule():
             c_filename = module_filenames[module]
 
             template_values, module_context = prepared_modules[c_filename]
 
-            source_code = CodeGeneration.generateModuleCode(
+            source_code, header_code, part_codes = \
+              CodeGeneration.generateModuleCode(
                 module_context  = module_context,
-                template_values = template_values
+                template_values = template_values,
+                header_filename = os.path.basename(
+                    getModuleHeaderFilename(c_filename)
+                )
             )
 
             writeSourceCode(
@@ -370,6 +440,34 @@ def makeSourceDirectory(main_module):
                 source_code = source_code
             )
 
+            if header_code is not None:
+                writeSourceCode(
+                    filename    = getModuleHeaderFilename(c_filename),
+                    source_code = header_code
+                )
+
+            for count, part_code in enumerate(part_codes, 1):
+                writeSourceCode(
+                    filename    = getModulePartFilename(c_filename, count),
+                    source_code = part_code
+                )
+
+            if module in optimization_profiles:
+                profile_c_filenames.append(
+                    (optimization_profiles[module], c_filename)
+                )
+
+                for count in range(1, len(part_codes) + 1):
+                    profile_c_filenames.append(
+                        (
+                            optimization_profiles[module],
+                            getModulePartFilename(c_filename, count)
+                        )
+                    )
+
+            if module in startup_module_set:
+                startup_end = len(ConstantCodes.stream_data.getBytes())
+
             if Options.isShowInclusion():
                 info("Included compiled module '%s'." % module.getFullName())
         elif module.isPythonShlibModule():
@@ -388,9 +486,9 @@ def makeSourceDirectory(main_module):
             if not os.path.isdir(target_dir):
                 makePath(target_dir)
 
-            shutil.copy(
-                module.getFilename(),
-                target_filename
+            installDistFile(
+                source_filename = module.getFilename(),
+                target_filename = target_filename
             )
 
             standalone_entry_points.append(
@@ -405,18 +503,40 @@ def makeSourceDirectory(main_module):
         else:
             assert False, module
 
+    if startup_modules:
+        startup_blob_ranges.append(
+            (startup_start, startup_end - startup_start)
+        )
+
+        # The global constants are all created at startup.
+        constants_start = len(ConstantCodes.stream_data.getBytes())
+
     writeSourceCode(
         filename    = os.path.join(
             source_dir,
             "__constants.c"
         ),
         source_code = ConstantCodes.getConstantsDefinitionCode(
-            context = global_context
+            context         = global_context,
+            module_contexts = [
+                module_context
+                for _template_values, module_context in
+                prepared_modules.values()
+            ]
         )
     )
 
+    if startup_modules:
+        startup_blob_ranges.append(
+            (
+                constants_start,
+                len(ConstantCodes.stream_data.getBytes()) - constants_start
+            )
+        )
+
     helper_decl_code, helper_impl_code = CodeGeneration.generateHelpersCode(
-        ModuleRegistry.getDoneUserModules()
+        other_modules   = ModuleRegistry.getDoneUserModules(),
+        startup_modules = startup_modules
     )
 
     writeSourceCode(
@@ -435,8 +555,18 @@ def makeSourceDirectory(main_module):
         source_code = helper_impl_code
     )
 
+    if Options.hasCOptimizationProfiles():
+        writeSourceCode(
+            filename    = getOptimizationProfilesFilename(main_module),
+            source_code = "".join(
+                "%s %s\n" % (profile, os.path.basename(c_filename))
+                for profile, c_filename in
+                profile_c_filenames
+            )
+        )
 
-def runScons(main_module, quiet):
+
+def runScons(main_module, quiet, pgo_mode = None):
     # Scons gets transported many details, that we express as variables, and
     # have checks for them, leading to many branches, pylint: disable=too-many-branches
 
@@ -483,9 +613,26 @@ def runScons(main_module, quiet):
     if not Options.isRemoveBuildDir() and Utils.getOS() == "Windows":
         options["cache_mode"] = "true"
 
+    if Options.getObjectCacheMode():
+        options["object_cache_mode"] = Options.getObjectCacheMode()
+
+    if Options.shallUseRuntimeLibrary():
+        options["runtime_library_mode"] = "true"
+
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if pgo_mode is not None:
+        options["pgo_mode"] = pgo_mode
+
+    if Options.hasCOptimizationProfiles():
+        options["optimization_profiles"] = \
+          getOptimizationProfilesFilename(main_module)
+
+    if Options.getTypeFeedbackRecordFilename() is not None:
+        options["type_feedback_record"] = \
+          Options.getTypeFeedbackRecordFilename()
+
     if Options.shallDisableConsoleWindow():
         options["win_disable_console"] = "true"
 
@@ -526,6 +673,16 @@ def runScons(main_module, quiet):
     if Options.isProfile():
         options["profile_mode"] = "true"
 
+    if Options.shallCountRuntimeStats():
+        options["runtime_stats_mode"] = "true"
+
+    if Options.getFreelistLimits():
+        options["freelist_limits"] = ','.join(
+            "%s=%d" % (kind, count)
+            for kind, count in
+            Options.getFreelistLimits()
+        )
+
     if "no_warnings" in getPythonFlags():
         options["no_python_warnings"] = "true"
 
@@ -634,6 +791,91 @@ def executeModule(tree, clean_path):
     )
 
 
+def removeProfileData(source_dir):
+    # Profiles of previous training runs would be merged with new ones, but
+    # they may not match the code anymore.
+    for dirpath, _dirnames, filenames in os.walk(source_dir):
+        for filename in filenames:
+            if filename.endswith(".gcda"):
+                os.unlink(os.path.join(dirpath, filename))
+
+
+def populateStandaloneDistFolder(main_module, binary_filename):
+    """ Copy the DLLs and data files used by the binary to the dist folder.
+
+        This is done again for every build of the binary, the PGO training
+        build needs them too, in order to run.
+    """
+
+    entry_points = [
+        (binary_filename, binary_filename, None)
+    ]
+    entry_points += standalone_entry_points
+
+    dist_dir = getStandaloneDirectoryPath(main_module)
+
+    for module in ModuleRegistry.getDoneUserModules():
+        entry_points.extend(
+            Plugins.considerExtraDlls(dist_dir, module)
+        )
+
+    for module in ModuleRegistry.getUncompiledModules():
+        entry_points.extend(
+            Plugins.considerExtraDlls(dist_dir, module)
+        )
+
+    copyUsedDLLs(
+        dist_dir                = dist_dir,
+        standalone_entry_points = entry_points
+    )
+
+    all_data_files = list(data_files)
+
+    for module in ModuleRegistry.getDoneModules():
+        all_data_files.extend(
+            Plugins.considerDataFiles(module)
+        )
+
+    for source_filename, target_filename in all_data_files:
+        target_filename = os.path.join(
+            dist_dir,
+            target_filename
+        )
+
+        makePath(os.path.dirname(target_filename))
+
+        shutil.copy2(
+            source_filename,
+            target_filename
+        )
+
+
+def runPgoTraining(main_module):
+    binary_filename = os.path.abspath(getResultFullpath(main_module))
+
+    info("Running PGO training of '%s'." % binary_filename)
+
+    # We better flush these, the training output will be mixed in.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    if Options.getPgoCommand() is not None:
+        result = subprocess.call(
+            Options.getPgoCommand().replace("{binary}", binary_filename),
+            shell = True
+        )
+    else:
+        result = subprocess.call(
+            [binary_filename] + Options.getPgoArgs()
+        )
+
+    if result != 0:
+        warning(
+            "PGO training exited with error code %d, profile may be incomplete.",
+            result
+        )
+
+
 def compileTree(main_module):
     source_dir = getSourceDirectoryPath(main_module)
 
@@ -643,7 +885,9 @@ def compileTree(main_module):
             main_module = main_module
         )
 
-        frozen_code = generateBytecodeFrozenCode()
+        frozen_code = generateBytecodeFrozenCode(
+            startup_ranges = startup_blob_ranges
+        )
 
         if frozen_code is not None:
             writeSourceCode(
@@ -680,10 +924,39 @@ def compileTree(main_module):
     if Options.shallNotDoExecCCompilerCall():
         return True, {}
 
+    if Options.isPgoMode():
+        # Build an instrumented program first, and train it, so the final
+        # build can use the profile.
+        removeProfileData(source_dir)
+
+        result, options = runScons(
+            main_module = main_module,
+            quiet       = not Options.isShowScons(),
+            pgo_mode    = "generate"
+        )
+
+        if not result:
+            return result, options
+
+        # The training run of a standalone binary needs the DLLs and data
+        # files in the dist folder already.
+        if Options.isStandaloneMode():
+            populateStandaloneDistFolder(
+                main_module     = main_module,
+                binary_filename = options["result_name"] + ".exe"
+            )
+
+        runPgoTraining(main_module)
+
+        pgo_mode = "use"
+    else:
+        pgo_mode = None
+
     # Run the Scons to build things.
     result, options = runScons(
         main_module = main_module,
-        quiet       = not Options.isShowScons()
+        quiet       = not Options.isShowScons(),
+        pgo_mode    = pgo_mode
     )
 
     return result, options
@@ -791,48 +1064,11 @@ def main():
             )
 
         if Options.isStandaloneMode():
-            binary_filename = options["result_name"] + ".exe"
-
-            standalone_entry_points.insert(
-                0,
-                (binary_filename, binary_filename, None)
+            populateStandaloneDistFolder(
+                main_module     = main_module,
+                binary_filename = options["result_name"] + ".exe"
             )
 
-            dist_dir = getStandaloneDirectoryPath(main_module)
-
-            for module in ModuleRegistry.getDoneUserModules():
-                standalone_entry_points.extend(
-                    Plugins.considerExtraDlls(dist_dir, module)
-                )
-
-            for module in ModuleRegistry.getUncompiledModules():
-                standalone_entry_points.extend(
-                    Plugins.considerExtraDlls(dist_dir, module)
-                )
-
-            copyUsedDLLs(
-                dist_dir                = dist_dir,
-                standalone_entry_points = standalone_entry_points
-            )
-
-            for module in ModuleRegistry.getDoneModules():
-                data_files.extend(
-                    Plugins.considerDataFiles(module)
-                )
-
-            for source_filename, target_filename in data_files:
-                target_filename = os.path.join(
-                    getStandaloneDirectoryPath(main_module),
-                    target_filename
-                )
-
-                makePath(os.path.dirname(target_filename))
-
-                shutil.copy2(
-                    source_filename,
-                    target_filename
-                )
-
         # Modules should not be executable, but Scons creates them like it, fix
         # it up here.
         if Utils.getOS() != "Windows" and Options.shallMakeModule():
@@ -43,9 +43,26 @@ done_modules = set()
 # Uncompiled modules
 uncompiled_modules = set()
 
+# Indexes of the above by module name, these are maintained as modules are
+# added and removed, so that looking up a module does not have to scan all of
+# them, as there can be many thousands in standalone mode.
+active_modules_by_name = {}
+done_modules_by_name = {}
+uncompiled_modules_by_name = {}
+
+# Index of root modules by code name, verified on use, as the root modules
+# may also be replaced as a whole.
+root_modules_by_code_name = {}
+
+# Sorted views of the done modules, made on demand, and dropped whenever the
+# done modules change, instead of sorting again on every call.
+done_modules_sorted = None
+done_user_modules_sorted = None
+
 
 def addRootModule(module):
     root_modules.add(module)
+    root_modules_by_code_name[module.getCodeName()] = module
 
 
 def getRootModules():
@@ -70,11 +87,16 @@ def replaceRootModule(old, new):
         new_root_modules.add(module if module is not old else new)
 
     root_modules = new_root_modules
+    root_modules_by_code_name[new.getCodeName()] = new
 
 
 def addUncompiledModule(module):
     uncompiled_modules.add(module)
 
+    uncompiled_modules_by_name.setdefault(module.getFullName(), []).append(
+        module
+    )
+
 
 def getUncompiledModules():
     return sorted(
@@ -130,13 +152,12 @@ def _normalizeModuleFilename(filename):
 
 
 def getUncompiledModule(module_name, module_filename):
-    for uncompiled_module in uncompiled_modules:
-        if module_name == uncompiled_module.getFullName():
-            if areSamePaths(
-                _normalizeModuleFilename(module_filename),
-                _normalizeModuleFilename(uncompiled_module.filename)
-            ):
-                return uncompiled_module
+    for uncompiled_module in uncompiled_modules_by_name.get(module_name, ()):
+        if areSamePaths(
+            _normalizeModuleFilename(module_filename),
+            _normalizeModuleFilename(uncompiled_module.filename)
+        ):
+            return uncompiled_module
 
     return None
 
@@ -144,6 +165,21 @@ def getUncompiledModule(module_name, module_filename):
 def removeUncompiledModule(module):
     uncompiled_modules.remove(module)
 
+    candidates = uncompiled_modules_by_name[module.getFullName()]
+    candidates.remove(module)
+
+    if not candidates:
+        del uncompiled_modules_by_name[module.getFullName()]
+
+
+def _invalidateDoneModulesViews():
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global done_modules_sorted, done_user_modules_sorted
+
+    done_modules_sorted = None
+    done_user_modules_sorted = None
+
 
 def startTraversal():
     # Using global here, as this is really a singleton, in the form of a module,
@@ -153,13 +189,20 @@ def startTraversal():
     active_modules = OrderedSet(root_modules)
     done_modules = set()
 
+    active_modules_by_name.clear()
+    done_modules_by_name.clear()
+    _invalidateDoneModulesViews()
+
     for active_module in active_modules:
+        active_modules_by_name[active_module.getFullName()] = active_module
+
         active_module.startTraversal()
 
 
 def addUsedModule(module):
     if module not in done_modules and module not in active_modules:
         active_modules.add(module)
+        active_modules_by_name[module.getFullName()] = module
 
         module.startTraversal()
 
@@ -169,6 +212,14 @@ def nextModule():
         result = active_modules.pop()
         done_modules.add(result)
 
+        module_name = result.getFullName()
+
+        if active_modules_by_name.get(module_name) is result:
+            del active_modules_by_name[module_name]
+        done_modules_by_name[module_name] = result
+
+        _invalidateDoneModulesViews()
+
         return result
     else:
         return None
@@ -179,32 +230,56 @@ def remainingCount():
 
 
 def getDoneModules():
-    return sorted(
-        done_modules,
-        key = lambda module : module.getFullName()
-    )
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global done_modules_sorted
+
+    if done_modules_sorted is None:
+        done_modules_sorted = tuple(
+            sorted(
+                done_modules,
+                key = lambda module : module.getFullName()
+            )
+        )
+
+    return done_modules_sorted
 
 
 def getDoneUserModules():
-    return sorted(
-        [
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global done_user_modules_sorted
+
+    if done_user_modules_sorted is None:
+        done_user_modules_sorted = tuple(
             module
             for module in
-            done_modules
+            getDoneModules()
             if not module.isInternalModule()
-        ],
-        key = lambda module : module.getFullName()
-    )
+        )
+
+    return done_user_modules_sorted
 
 
 def removeDoneModule(module):
     done_modules.remove(module)
 
+    if done_modules_by_name.get(module.getFullName()) is module:
+        del done_modules_by_name[module.getFullName()]
+
+    _invalidateDoneModulesViews()
+
 
 def getModuleFromCodeName(code_name):
+    module = root_modules_by_code_name.get(code_name)
+
+    if module is not None and module in root_modules:
+        return module
+
     # TODO: We need something to just load modules.
     for module in root_modules:
         if module.getCodeName() == code_name:
+            root_modules_by_code_name[code_name] = module
             return module
 
     assert False, code_name
@@ -221,16 +296,13 @@ def getOwnerFromCodeName(code_name):
 
 
 def getModuleByName(module_name):
-    for module in active_modules:
-        if module.getFullName() == module_name:
-            return module
+    if module_name in active_modules_by_name:
+        return active_modules_by_name[module_name]
 
-    for module in done_modules:
-        if module.getFullName() == module_name:
-            return module
+    if module_name in done_modules_by_name:
+        return done_modules_by_name[module_name]
 
-    for module in uncompiled_modules:
-        if module.getFullName() == module_name:
-            return module
+    if module_name in uncompiled_modules_by_name:
+        return uncompiled_modules_by_name[module_name][0]
 
     return None
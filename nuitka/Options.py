@@ -19,6 +19,7 @@
 
 import logging
 import os
+import shlex
 import sys
 from optparse import SUPPRESS_HELP, OptionGroup, OptionParser
 
@@ -34,6 +35,12 @@ from nuitka.Version import getNuitkaVersion
 # other defaults and work a bit different with parameters.
 is_nuitka_run = os.path.basename(sys.argv[0]).lower().startswith("nuitka-run")
 
+# The free lists of the runtime, that can be given limits.
+freelist_kinds = (
+    "cell", "frame", "function", "generator", "method", "traceback",
+    "coroutine", "asyncgen"
+)
+
 if not is_nuitka_run:
     usage = "usage: %prog [--module] [--execute] [options] main_module.py"
 else:
@@ -370,6 +377,69 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is."""
 )
 
+codegen_group.add_option(
+    "--lazy-module-init",
+    action  = "store_true",
+    dest    = "lazy_module_init",
+    default = False,
+    help    = """\
+Create shared constants only when the first module using them is imported,
+and code objects only when first used by a function or frame. This makes
+startup cheaper for programs that contain many modules, but only import a
+few of them on a given code path. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--startup-layout",
+    action  = "store_true",
+    dest    = "startup_layout",
+    default = False,
+    help    = """\
+Put the bytecode and constants of modules imported at startup first in the
+binary, in the order of their import, and have the program page them in at
+once when it starts. Also lists these modules first for the module loader.
+Makes starting faster, esp. for standalone programs with a cold disk cache.
+Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--module-split-size",
+    action  = "store",
+    dest    = "module_split_size",
+    metavar = "KB",
+    default = "2000",
+    help    = """\
+Split the C code of modules with more than this many kilobytes of function
+code into several files, so that the C compiler can work on them in parallel
+and with less memory. Use 0 to never split. Defaults to 2000."""
+)
+
+codegen_group.add_option(
+    "--type-feedback-record",
+    action  = "store",
+    dest    = "type_feedback_record",
+    metavar = "FILENAME",
+    default = None,
+    help    = """\
+Make the compiled program count the types it sees for operands of binary
+operations, arguments, local variables and attribute look-ups, and append them
+to the given file when it exits. Run it with representative inputs, then
+compile again with "--type-feedback". Default off."""
+)
+
+codegen_group.add_option(
+    "--type-feedback",
+    action  = "store",
+    dest    = "type_feedback",
+    metavar = "FILENAME",
+    default = None,
+    help    = """\
+Use type feedback recorded with "--type-feedback-record" to give binary
+operations, whose operands are expected to have the same built-in type, a fast
+path for it, guarded by a type check and falling back to the generic code.
+Default off."""
+)
+
 parser.add_option_group(codegen_group)
 
 outputdir_group = OptionGroup(
@@ -410,6 +480,20 @@ Do not create a ".pyi" file for extension modules created by Nuitka.
 Defaults to off."""
 )
 
+outputdir_group.add_option(
+    "--dist-link-mode",
+    action  = "store",
+    dest    = "dist_link_mode",
+    choices = ("copy", "hardlink", "reflink"),
+    default = "copy",
+    help    = """\
+How DLLs and extension modules are put into the ".dist" folder in standalone
+mode. With "hardlink" and "reflink", they are kept once in the Nuitka cache
+directory, by hash of their content and the changes needed, e.g. removing the
+"RPATH", and the ".dist" folder only links to them. Copies are made where the
+file system cannot do it. Do not modify hardlinked files. Defaults to "copy"."""
+)
+
 
 
 parser.add_option_group(outputdir_group)
@@ -455,6 +539,32 @@ debug_group.add_option(
 Enable vmprof based profiling of time spent. Defaults to off."""
 )
 
+debug_group.add_option(
+    "--runtime-stats",
+    action  = "store_true",
+    dest    = "runtime_stats",
+    default = False,
+    help    = """\
+Make the compiled program count the work of free lists, fibers and constant
+creation, reported by the "get_stats" function of the built-in module
+"__nuitka_runtime_stats__". Defaults to off."""
+)
+
+debug_group.add_option(
+    "--freelist-limit",
+    action  = "append",
+    dest    = "freelist_limits",
+    metavar = "KIND=COUNT",
+    default = [],
+    help    = """\
+Change the maximum number of objects kept in a free list. Kinds are %s.
+Can be given multiple times. Default empty.""" % ", ".join(
+        "'%s'" % kind
+        for kind in
+        freelist_kinds
+    )
+)
+
 debug_group.add_option(
     "--graph",
     action  = "store_true",
@@ -588,6 +698,102 @@ Use link time optimizations if available and usable (g++ 4.6 and higher).
 Defaults to off."""
 )
 
+c_compiler_group.add_option(
+    "--pgo",
+    action  = "store_true",
+    dest    = "pgo",
+    default = False,
+    help    = """\
+Use profile guided optimization of the C compiler (gcc only). An instrumented
+program is built and run for training, then it is built again in the same
+build directory, using the collected profile. Defaults to off."""
+)
+
+c_compiler_group.add_option(
+    "--pgo-args",
+    action  = "store",
+    dest    = "pgo_args",
+    default = "",
+    help    = """\
+Arguments to run the instrumented program with for training in PGO mode.
+Default empty."""
+)
+
+c_compiler_group.add_option(
+    "--pgo-command",
+    action  = "store",
+    dest    = "pgo_command",
+    default = None,
+    help    = """\
+Shell command to run for training in PGO mode instead of the program itself,
+e.g. a test suite. Use "{binary}" in it for the instrumented program. Default
+is to run the program with "--pgo-args"."""
+)
+
+c_compiler_group.add_option(
+    "--c-optimize-size",
+    action  = "append",
+    dest    = "c_optimize_size",
+    metavar = "MODULE/PACKAGE",
+    default = [],
+    help    = """\
+Compile the C code of that module, or if a package, of the whole package, for
+size, i.e. with "-Os" and no inlining. Good for code only run once, e.g. at
+startup. Can be given multiple times. Default empty."""
+)
+
+c_compiler_group.add_option(
+    "--c-optimize-speed",
+    action  = "append",
+    dest    = "c_optimize_speed",
+    metavar = "MODULE/PACKAGE",
+    default = [],
+    help    = """\
+Compile the C code of that module, or if a package, of the whole package, for
+speed, i.e. with "-O3" and loop unrolling. Takes precedence over the other
+profile options. Can be given multiple times. Default empty."""
+)
+
+c_compiler_group.add_option(
+    "--c-optimize-hot-from",
+    action  = "store",
+    dest    = "c_optimize_hot_from",
+    metavar = "SAMPLES_FILE",
+    default = None,
+    help    = """\
+Samples file of a program built with "--profile". Modules with at least 1%
+of the samples in their own code are compiled for speed, all others for size,
+unless given with "--c-optimize-size" or "--c-optimize-speed". Default is to
+use the normal optimization for modules not given with those."""
+)
+
+c_compiler_group.add_option(
+    "--object-cache",
+    action  = "store",
+    dest    = "object_cache",
+    choices = ("auto", "nuitka", "ccache"),
+    default = None,
+    help    = """\
+Keep compiled C objects in the Nuitka cache directory, to be reused by later
+builds of any program, e.g. the runtime files are the same for all of them.
+With "nuitka", objects are stored by a hash of the preprocessed source, the
+compiler and its flags. With "ccache" that tool is used instead. With "auto",
+ccache is used if available. Statistics are output after the build. Defaults
+to off."""
+)
+
+c_compiler_group.add_option(
+    "--runtime-library",
+    action  = "store_true",
+    dest    = "runtime_library",
+    default = False,
+    help    = """\
+Compile the static runtime files of Nuitka into a library that is kept in the
+Nuitka cache directory, together with a precompiled header for gcc, and link
+against it. Later builds with the same compiler, flags and Python then only
+compile the generated code. Not used with LTO. Defaults to off."""
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(
@@ -817,6 +1023,29 @@ Error, '--recurse-not-to' takes only module names, not directory path '%s'.""" %
                 no_case_module
             )
 
+    if options.type_feedback is not None and \
+       not os.path.isfile(options.type_feedback):
+        sys.exit(
+            "Error, type feedback file '%s' does not exist." % \
+            options.type_feedback
+        )
+
+    for freelist_limit in options.freelist_limits:
+        kind, _sep, count = freelist_limit.partition('=')
+
+        if kind not in freelist_kinds or not count.isdigit():
+            sys.exit(
+                "Error, '--freelist-limit' expects KIND=COUNT, with kinds %s, not '%s'." % (
+                    ", ".join(freelist_kinds),
+                    freelist_limit
+                )
+            )
+
+    if options.pgo and not options.executable:
+        sys.exit("""\
+Error, conflicting options, PGO mode needs to run the program, so it works for
+executables only.""")
+
     scons_python = getPython2PathForScons()
 
     if scons_python is not None and not os.path.exists(scons_python):
@@ -866,6 +1095,45 @@ def getFileReferenceMode():
     return value
 
 
+def shallUseLazyModuleInit():
+    return options.lazy_module_init
+
+
+def shallUseStartupLayout():
+    return options.startup_layout and not shallMakeModule()
+
+
+def shallCountRuntimeStats():
+    return options.runtime_stats
+
+
+def getFreelistLimits():
+    """ Free list kinds with the limits given for them.
+
+    Returns:
+        list of (kind, count) tuples
+    """
+
+    result = []
+
+    for freelist_limit in options.freelist_limits:
+        kind, count = freelist_limit.split('=', 1)
+        result.append((kind, int(count)))
+
+    return result
+
+
+def getTypeFeedbackRecordFilename():
+    if options.type_feedback_record is None:
+        return None
+
+    return os.path.abspath(options.type_feedback_record)
+
+
+def getTypeFeedbackFilename():
+    return options.type_feedback
+
+
 def shallMakeModule():
     return not options.executable
 
@@ -969,6 +1237,12 @@ def isShowScons():
     return options.show_scons
 
 
+def getModuleSplitSize():
+    """ Size of function code in bytes, above which module code is split. """
+
+    return int(options.module_split_size) * 1024
+
+
 def getJobLimit():
     return int(options.jobs)
 
@@ -977,6 +1251,49 @@ def isLto():
     return options.lto
 
 
+def isPgoMode():
+    return options.pgo
+
+
+def getPgoArgs():
+    return shlex.split(options.pgo_args)
+
+
+def getPgoCommand():
+    return options.pgo_command
+
+
+def getCOptimizeSizeModules():
+    return sum([ _splitShellPattern(x) for x in options.c_optimize_size ], [])
+
+
+def getCOptimizeSpeedModules():
+    return sum([ _splitShellPattern(x) for x in options.c_optimize_speed ], [])
+
+
+def getCOptimizeHotFromFilename():
+    if options.c_optimize_hot_from is None:
+        return None
+
+    return os.path.abspath(options.c_optimize_hot_from)
+
+
+def hasCOptimizationProfiles():
+    return bool(
+        options.c_optimize_size or
+        options.c_optimize_speed or
+        options.c_optimize_hot_from
+    )
+
+
+def getObjectCacheMode():
+    return options.object_cache
+
+
+def shallUseRuntimeLibrary():
+    return options.runtime_library
+
+
 def isClang():
     return options.clang
 
@@ -1042,6 +1359,12 @@ def isStandaloneMode():
     return options.is_standalone
 
 
+def getDistLinkMode():
+    """ How DLLs and extension modules get into the dist folder. """
+
+    return options.dist_link_mode
+
+
 def getIconPath():
     return options.icon_path
 
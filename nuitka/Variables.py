@@ -181,6 +181,21 @@ class Variable(object):
         else:
             return bool(self.writers)
 
+    def hasReadOnlyUsagesOnly(self):
+        """ All usages of the variable only read it.
+
+            These are look-ups, checks for contained values, and iteration,
+            so the value neither escapes nor is mutated.
+        """
+        if not complete:
+            return None
+
+        for trace in self.traces:
+            if trace.getNameUsageCount() or not trace.hasReadOnlyUsagesOnly():
+                return False
+
+        return True
+
     def getMatchingAssignTrace(self, assign_node):
         for trace in self.traces:
             if trace.isAssignTrace() and trace.getAssignNode() is assign_node:
@@ -0,0 +1,138 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Optimization profiles of the C compiler for modules.
+
+Most modules are run only once, at startup, while the hot loops are in few of
+them. Cold modules are better compiled for size, which is faster to do too,
+and hot ones for speed. The profiles are given per module or package, or are
+derived from the samples of a run of the program built with "--profile".
+"""
+
+import os
+
+from nuitka import Options
+from nuitka.importing.Recursion import matchesModuleNameToPatterns
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+from nuitka.utils.ProfileSamples import parseFrameLabel, readSamples
+
+# Modules with at least this share of the samples in their own code are hot.
+_hot_module_share = 0.01
+
+
+class _CodeLabelsCollector(VisitorNoopMixin):
+    def __init__(self):
+        self.code_labels = set()
+
+    def onEnterNode(self, node):
+        if node.isStatementsFrame():
+            code_object = node.getCodeObject()
+
+            self.code_labels.add(
+                (code_object.getCodeObjectName(), code_object.getLineNumber())
+            )
+
+
+def _getModuleCodeLabels(module):
+    collector = _CodeLabelsCollector()
+
+    visitTree(module, collector)
+
+    for function_body in module.getUsedFunctions():
+        visitTree(function_body, collector)
+
+    return collector.code_labels
+
+
+def _getHotModules(modules, samples_filename):
+    samples = readSamples(samples_filename)
+
+    modules_by_basename = {}
+
+    for module in modules:
+        modules_by_basename.setdefault(
+            os.path.basename(module.getCompileTimeFilename()),
+            []
+        ).append(module)
+
+    module_code_labels = {}
+    module_counts = {}
+
+    for stack, count in samples.items():
+        frame_label = parseFrameLabel(stack[-1])
+
+        if frame_label is None:
+            continue
+
+        code_name, filename, line_number = frame_label
+
+        candidates = modules_by_basename.get(filename, ())
+
+        # Samples only have the basename of the source file, which is not
+        # unique, e.g. for "__init__.py", then look at the code objects.
+        if len(candidates) > 1:
+            for module in candidates:
+                if module not in module_code_labels:
+                    module_code_labels[module] = _getModuleCodeLabels(module)
+
+            candidates = [
+                module
+                for module in candidates
+                if (code_name, line_number) in module_code_labels[module]
+            ] or candidates
+
+        for module in candidates:
+            module_counts[module] = module_counts.get(module, 0) + count
+
+    total = sum(samples.values())
+
+    return set(
+        module
+        for module, count in module_counts.items()
+        if count >= total * _hot_module_share
+    )
+
+
+def getModuleOptimizationProfiles(modules):
+    """ Decide the optimization profiles of compiled modules.
+
+    Returns a dictionary of modules to "size" or "speed", modules not in it
+    use the normal optimization.
+    """
+
+    size_patterns = Options.getCOptimizeSizeModules()
+    speed_patterns = Options.getCOptimizeSpeedModules()
+    samples_filename = Options.getCOptimizeHotFromFilename()
+
+    if samples_filename is not None:
+        hot_modules = _getHotModules(modules, samples_filename)
+    else:
+        hot_modules = None
+
+    result = {}
+
+    for module in modules:
+        module_name = module.getFullName()
+
+        if matchesModuleNameToPatterns(module_name, speed_patterns)[0]:
+            result[module] = "speed"
+        elif matchesModuleNameToPatterns(module_name, size_patterns)[0]:
+            result[module] = "size"
+        elif hot_modules is not None:
+            result[module] = "speed" if module in hot_modules else "size"
+
+    return result
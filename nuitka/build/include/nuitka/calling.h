@@ -102,4 +102,43 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_KEYARGS( PyObject *func
 // Method call variant with no arguments provided at all.
 extern PyObject *CALL_METHOD_NO_ARGS( PyObject *source, PyObject *attribute );
 
+// Function call variant for star arguments, with fast path for the common
+// case of exact tuple and dict values, see below.
+extern PyObject *CALL_FUNCTION_WITH_STAR_ARGS( PyObject *called, PyObject *positional_args, PyObject *kw, PyObject *star_list, PyObject *star_dict );
+
+// Check if star arguments can be passed directly, without the conversions and
+// error checks done in the complex call helper functions.
+NUITKA_MAY_BE_UNUSED static bool CAN_CALL_WITH_STAR_ARGS( PyObject *kw, PyObject *star_list, PyObject *star_dict )
+{
+    if ( star_list != NULL && !PyTuple_CheckExact( star_list ) )
+    {
+        return false;
+    }
+
+    if ( star_dict != NULL )
+    {
+        if ( !PyDict_CheckExact( star_dict ) )
+        {
+            return false;
+        }
+
+        // Duplicate keywords need to be reported as errors.
+        if ( kw != NULL && DICT_SIZE( star_dict ) != 0 )
+        {
+            Py_ssize_t pos = 0;
+            PyObject *key, *value;
+
+            while ( PyDict_Next( kw, &pos, &key, &value ) )
+            {
+                if ( PyDict_GetItem( star_dict, key ) != NULL )
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    return true;
+}
+
 #endif
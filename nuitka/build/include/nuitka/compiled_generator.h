@@ -74,7 +74,10 @@ struct Nuitka_GeneratorObject {
     Generator_Status m_status;
 
 #if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    // The resume point, 0 for the start, and the storage of local variables,
+    // that must survive the return from the generator function at yields.
     int m_yield_return_index;
+    void *m_heap_storage;
 #else
     Fiber m_yielder_context;
     Fiber m_caller_context;
@@ -116,7 +119,64 @@ static inline PyObject *Nuitka_Generator_GetName( PyObject *object )
     return ((struct Nuitka_GeneratorObject *)object)->m_name;
 }
 
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+
+// The generator function returns the yielded value, and gets called again
+// with the sent value, which is the value of the "yield" expression, unless
+// an exception was thrown into the generator.
+static inline PyObject *GENERATOR_YIELD_RESUME( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+{
+    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+
+    // Check for thrown exception.
+    if (unlikely( generator->m_exception_type ))
+    {
+        RESTORE_ERROR_OCCURRED(
+            generator->m_exception_type,
+            generator->m_exception_value,
+            generator->m_exception_tb
+        );
+
+        generator->m_exception_type = NULL;
+        generator->m_exception_value = NULL;
+        generator->m_exception_tb = NULL;
+
+        return NULL;
+    }
+
+    CHECK_OBJECT( yield_return_value );
+    return yield_return_value;
+}
+
+#if PYTHON_VERSION >= 300
+/* When yielding from an exception handler in Python3, the exception preserved
+ * to the frame is restored, while the current one is put there, and the other
+ * way around when resuming.
+ */
+static inline void GENERATOR_SWAP_HANDLER_EXCEPTION( void )
+{
+    PyThreadState *thread_state = PyThreadState_GET();
+
+    PyObject *saved_exception_type = thread_state->exc_type;
+    PyObject *saved_exception_value = thread_state->exc_value;
+    PyObject *saved_exception_traceback = thread_state->exc_traceback;
+
+    thread_state->exc_type = thread_state->frame->f_exc_type;
+    thread_state->exc_value = thread_state->frame->f_exc_value;
+    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+
+    thread_state->frame->f_exc_type = saved_exception_type;
+    thread_state->frame->f_exc_value = saved_exception_value;
+    thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
+#endif
+
+#if PYTHON_VERSION >= 330
+extern PyObject *GENERATOR_YIELD_FROM_ITERATOR( struct Nuitka_GeneratorObject *generator, PyObject *target );
+extern PyObject *GENERATOR_YIELD_FROM_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result );
+#endif
+
+#else
 
 static inline PyObject *GENERATOR_YIELD( struct Nuitka_GeneratorObject *generator, PyObject *value )
 {
@@ -58,8 +58,9 @@ void _releaseFiber( Fiber *to );
 #endif
 
 // Have centralized assertions as wrappers in debug mode, or directly access
-// the fiber implementions of a given platform.
-#ifdef __NUITKA_NO_ASSERT__
+// the fiber implementions of a given platform. For runtime statistics, the
+// wrappers do the counting.
+#if defined(__NUITKA_NO_ASSERT__) && !_NUITKA_RUNTIME_STATS
 #define initFiber _initFiber
 #define swapFiber _swapFiber
 #define prepareFiber _prepareFiber
@@ -76,6 +77,10 @@ static inline void swapFiber( Fiber *to, Fiber *from )
     assert( to != NULL );
     assert( from != NULL );
 
+#if _NUITKA_RUNTIME_STATS
+    fiber_stats.switches += 1;
+#endif
+
     _swapFiber( to, from );
 }
 
@@ -86,6 +91,10 @@ static inline int prepareFiber( Fiber *to, void *code, uintptr_t arg )
 
     CHECK_OBJECT( (PyObject *)arg );
 
+#if _NUITKA_RUNTIME_STATS
+    fiber_stats.prepared += 1;
+#endif
+
     return _prepareFiber( to, code, arg );
 }
 
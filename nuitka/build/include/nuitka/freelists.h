@@ -19,6 +19,49 @@
 #ifndef __NUITKA_FREELISTS_H__
 #define __NUITKA_FREELISTS_H__
 
+// Maximum sizes of the free lists, can be given at compile time.
+#ifndef MAX_CELL_FREE_LIST_COUNT
+#define MAX_CELL_FREE_LIST_COUNT 1000
+#endif
+#ifndef MAX_FRAME_FREE_LIST_COUNT
+#define MAX_FRAME_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_FUNCTION_FREE_LIST_COUNT
+#define MAX_FUNCTION_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_GENERATOR_FREE_LIST_COUNT
+#define MAX_GENERATOR_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_METHOD_FREE_LIST_COUNT
+#define MAX_METHOD_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_TRACEBACK_FREE_LIST_COUNT
+#define MAX_TRACEBACK_FREE_LIST_COUNT 1000
+#endif
+#ifndef MAX_COROUTINE_FREE_LIST_COUNT
+#define MAX_COROUTINE_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_ASYNCGEN_FREE_LIST_COUNT
+#define MAX_ASYNCGEN_FREE_LIST_COUNT 100
+#endif
+
+#if _NUITKA_RUNTIME_STATS
+#define countFreeListAllocation( free_list, hit )                       \
+    free_list ## _stats.allocations += 1;                               \
+    free_list ## _stats.hits += hit;
+
+#define countFreeListRelease( free_list, deleted )                      \
+    free_list ## _stats.releases += 1;                                  \
+    free_list ## _stats.deletes += deleted;                             \
+    if ( free_list ## _count > free_list ## _stats.high_water )         \
+    {                                                                   \
+        free_list ## _stats.high_water = free_list ## _count;           \
+    }
+#else
+#define countFreeListAllocation( free_list, hit )
+#define countFreeListRelease( free_list, deleted )
+#endif
+
 #define allocateFromFreeList( free_list, object_type, type_type, size ) \
     if ( free_list != NULL )                                            \
     {                                                                   \
@@ -26,6 +69,7 @@
         free_list = *((object_type **)free_list);                       \
         free_list ## _count -= 1;                                       \
         assert( free_list ## _count >= 0 );                             \
+        countFreeListAllocation( free_list, 1 );                        \
                                                                         \
         if ( Py_SIZE( result ) < size )                                 \
         {                                                               \
@@ -41,6 +85,7 @@
             &type_type,                                                 \
             size                                                        \
         );                                                              \
+        countFreeListAllocation( free_list, 0 );                        \
     }                                                                   \
     CHECK_OBJECT( result );
 
@@ -51,6 +96,7 @@
         free_list = *((object_type **)free_list);                       \
         free_list ## _count -= 1;                                       \
         assert( free_list ## _count >= 0 );                             \
+        countFreeListAllocation( free_list, 1 );                        \
                                                                         \
         _Py_NewReference( (PyObject *)result );                         \
     }                                                                   \
@@ -60,6 +106,7 @@
             object_type,                                                \
             &type_type                                                  \
         );                                                              \
+        countFreeListAllocation( free_list, 0 );                        \
     }                                                                   \
     CHECK_OBJECT( result );
 
@@ -70,6 +117,7 @@
         if ( free_list ## _count > max_free_list_count )                \
         {                                                               \
             PyObject_GC_Del( object );                                  \
+            countFreeListRelease( free_list, 1 );                       \
         }                                                               \
         else                                                            \
         {                                                               \
@@ -77,6 +125,7 @@
             free_list = object;                                         \
                                                                         \
             free_list ## _count += 1;                                   \
+            countFreeListRelease( free_list, 0 );                       \
         }                                                               \
     }                                                                   \
     else                                                                \
@@ -87,6 +136,7 @@
         assert( free_list ## _count == 0 );                             \
                                                                         \
         free_list ## _count += 1;                                       \
-    }                                                                   \
+        countFreeListRelease( free_list, 0 );                           \
+    }
 
 #endif
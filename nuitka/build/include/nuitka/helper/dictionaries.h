@@ -301,6 +301,113 @@ NUITKA_MAY_BE_UNUSED static PyObject *DICT_GET_ITEM( PyObject *dict, PyObject *k
     }
 }
 
+// Lookup like "dict.get" does it, giving a borrowed reference or NULL, with
+// an exception set only if hashing or comparing failed.
+NUITKA_MAY_BE_UNUSED static PyObject *DICT_GET_ITEM_WITH_ERROR( PyObject *dict, PyObject *key )
+{
+    CHECK_OBJECT( dict );
+    assert( PyDict_CheckExact( dict ) );
+
+    CHECK_OBJECT( key );
+
+#if PYTHON_VERSION < 300
+    long hash;
+
+    if ( !PyString_CheckExact( key ) || ( hash = ((PyStringObject *)key)->ob_shash ) == -1 )
+    {
+        hash = PyObject_Hash( key );
+
+        if (unlikely( hash == -1 ))
+        {
+            return NULL;
+        }
+    }
+
+    PyDictEntry *entry = ((PyDictObject *)dict)->ma_lookup( (PyDictObject *)dict, key, hash );
+
+    if (unlikely( entry == NULL ))
+    {
+        return NULL;
+    }
+
+    return entry->me_value;
+#else
+    return PyDict_GetItemWithError( dict, key );
+#endif
+}
+
+// For "dict.get" calls of values known to be dictionaries.
+NUITKA_MAY_BE_UNUSED static PyObject *DICT_METHOD_GET( PyObject *dict, PyObject *key, PyObject *default_value )
+{
+    CHECK_OBJECT( dict );
+    CHECK_OBJECT( key );
+
+    if (unlikely( !PyDict_CheckExact( dict ) ))
+    {
+        if ( default_value == NULL )
+        {
+            return PyObject_CallMethod( dict, (char *)"get", (char *)"(O)", key );
+        }
+        else
+        {
+            return PyObject_CallMethod( dict, (char *)"get", (char *)"(OO)", key, default_value );
+        }
+    }
+
+    PyObject *result = DICT_GET_ITEM_WITH_ERROR( dict, key );
+
+    if ( result == NULL )
+    {
+        if (unlikely( ERROR_OCCURRED() ))
+        {
+            return NULL;
+        }
+
+        result = default_value != NULL ? default_value : Py_None;
+    }
+
+    Py_INCREF( result );
+    return result;
+}
+
+// For "dict.setdefault" calls of values known to be dictionaries.
+NUITKA_MAY_BE_UNUSED static PyObject *DICT_METHOD_SETDEFAULT( PyObject *dict, PyObject *key, PyObject *default_value )
+{
+    CHECK_OBJECT( dict );
+    CHECK_OBJECT( key );
+
+    if (unlikely( !PyDict_CheckExact( dict ) ))
+    {
+        if ( default_value == NULL )
+        {
+            return PyObject_CallMethod( dict, (char *)"setdefault", (char *)"(O)", key );
+        }
+        else
+        {
+            return PyObject_CallMethod( dict, (char *)"setdefault", (char *)"(OO)", key, default_value );
+        }
+    }
+
+    PyObject *result = DICT_GET_ITEM_WITH_ERROR( dict, key );
+
+    if ( result == NULL )
+    {
+        if (unlikely( ERROR_OCCURRED() ))
+        {
+            return NULL;
+        }
+
+        result = default_value != NULL ? default_value : Py_None;
+
+        if (unlikely( PyDict_SetItem( dict, key, result ) == -1 ))
+        {
+            return NULL;
+        }
+    }
+
+    Py_INCREF( result );
+    return result;
+}
 
 // Convert to dictionary, helper for built-in "dict" mainly.
 NUITKA_MAY_BE_UNUSED static PyObject *TO_DICT( PyObject *seq_obj, PyObject *dict_obj )
@@ -41,5 +41,24 @@ NUITKA_MAY_BE_UNUSED static PyObject *LIST_COPY( PyObject *list )
     return result;
 }
 
+// For "list.append" calls of values known to be lists.
+NUITKA_MAY_BE_UNUSED static PyObject *LIST_METHOD_APPEND( PyObject *list, PyObject *item )
+{
+    CHECK_OBJECT( list );
+    CHECK_OBJECT( item );
+
+    if (unlikely( !PyList_CheckExact( list ) ))
+    {
+        return PyObject_CallMethod( list, (char *)"append", (char *)"(O)", item );
+    }
+
+    if (unlikely( PyList_Append( list, item ) == -1 ))
+    {
+        return NULL;
+    }
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
 
 #endif
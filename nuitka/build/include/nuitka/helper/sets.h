@@ -0,0 +1,41 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_SETS_H__
+#define __NUITKA_HELPER_SETS_H__
+
+// For "set.add" calls of values known to be sets.
+NUITKA_MAY_BE_UNUSED static PyObject *SET_METHOD_ADD( PyObject *set, PyObject *key )
+{
+    CHECK_OBJECT( set );
+    CHECK_OBJECT( key );
+
+    if (unlikely( Py_TYPE( set ) != &PySet_Type ))
+    {
+        return PyObject_CallMethod( set, (char *)"add", (char *)"(O)", key );
+    }
+
+    if (unlikely( PySet_Add( set, key ) == -1 ))
+    {
+        return NULL;
+    }
+
+    Py_INCREF( Py_None );
+    return Py_None;
+}
+
+#endif
@@ -54,6 +54,12 @@ typedef struct {
 // are just like comments.
 #include "nuitka/tracing.h"
 
+// For use with "--type-feedback-record", operations count operand types.
+#include "nuitka/type_feedback.h"
+
+// For use with "--runtime-stats", free lists and others count their work.
+#include "nuitka/runtime_stats.h"
+
 // For checking values if they changed or not.
 #ifndef __NUITKA_NO_ASSERT__
 extern Py_hash_t DEEP_HASH( PyObject *value );
@@ -436,6 +442,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_VARS( PyObject *source )
 #include "nuitka/helper/slices.h"
 #include "nuitka/helper/rangeobjects.h"
 #include "nuitka/helper/lists.h"
+#include "nuitka/helper/sets.h"
 #include "nuitka/helper/bytearrays.h"
 
 #include "nuitka/builtins.h"
@@ -451,6 +458,11 @@ extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObj
 extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize );
 #endif
 
+// For constant sources compiled at compile time, load the code object from
+// its marshal data on first use, or compile it with the given arguments, if
+// not NULL, when optimization is enabled at run time.
+extern PyObject *LOAD_PRECOMPILED_CODE( PyObject **code_object, char const *data, Py_ssize_t size, PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags );
+
 
 // For quicker built-in open() functionality.
 #if PYTHON_VERSION < 300
@@ -465,6 +477,12 @@ extern PyObject *BUILTIN_CHR( PyObject *value );
 // For quicker built-in ord() functionality.
 extern PyObject *BUILTIN_ORD( PyObject *value );
 
+// For "str.startswith", "str.endswith" and "str.join" calls of values known
+// to be strings.
+extern PyObject *STR_METHOD_STARTSWITH( PyObject *str, PyObject *prefix );
+extern PyObject *STR_METHOD_ENDSWITH( PyObject *str, PyObject *suffix );
+extern PyObject *STR_METHOD_JOIN( PyObject *str, PyObject *iterable );
+
 // For quicker built-in bin() functionality.
 extern PyObject *BUILTIN_BIN( PyObject *value );
 
@@ -516,6 +534,10 @@ extern PyObject *BUILTIN_HASH( PyObject *value );
 extern PyObject *BUILTIN_SUM1( PyObject *sequence );
 extern PyObject *BUILTIN_SUM2( PyObject *sequence, PyObject *start );
 
+// For built-in any() and all() functionality.
+extern PyObject *BUILTIN_ANY( PyObject *iterable );
+extern PyObject *BUILTIN_ALL( PyObject *iterable );
+
 // For built-in bytes() functionality.
 #if PYTHON_VERSION >= 300
 extern PyObject *BUILTIN_BYTES3( PyObject *value, PyObject *encoding, PyObject *errors );
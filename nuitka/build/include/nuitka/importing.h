@@ -35,6 +35,21 @@ extern bool IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *modu
 
 extern PyObject *IMPORT_EMBEDDED_MODULE( PyObject *module_name, char const *name );
 
+// Import of a compiled module of the same binary, with constant arguments,
+// cached per import site.
+extern PyObject *IMPORT_COMPILED_MODULE( PyObject **cache, char const *name, PyObject *module_name, PyObject *top_module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level );
+
+/* For the "NUITKA_IMPORT_TIME" environment variable, embedded module loading
+ * is timed and reported as a tree, similar to "-X importtime" of CPython.
+ * Compiled modules mark the end of their phases before the module body.
+ */
+#define IMPORT_TIME_PHASE_CONSTANTS 0
+#define IMPORT_TIME_PHASE_CODE_OBJECTS 1
+
+extern void startImportTimeTrace( char const *name );
+extern void markImportTimeTrace( int phase );
+extern void stopImportTimeTrace( void );
+
 NUITKA_MAY_BE_UNUSED static PyObject *IMPORT_NAME( PyObject *module, PyObject *import_name )
 {
     CHECK_OBJECT( module );
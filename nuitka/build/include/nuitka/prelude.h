@@ -139,6 +139,7 @@ typedef enum {false, true} bool;
 #define Nuitka_String_AsString_Unchecked PyString_AS_STRING
 #define Nuitka_String_Check PyString_Check
 #define Nuitka_String_CheckExact PyString_CheckExact
+#define Nuitka_String_FromString PyString_FromString
 #define Nuitka_StringObject PyStringObject
 #define Nuitka_StringIntern PyString_InternInPlace
 #else
@@ -149,6 +150,7 @@ typedef enum {false, true} bool;
 #define Nuitka_String_AsString_Unchecked _PyUnicode_AS_STRING
 #define Nuitka_String_Check PyUnicode_Check
 #define Nuitka_String_CheckExact PyUnicode_CheckExact
+#define Nuitka_String_FromString PyUnicode_FromString
 #define Nuitka_StringObject PyUnicodeObject
 #define Nuitka_StringIntern PyUnicode_InternInPlace
 #endif
@@ -206,7 +208,9 @@ typedef long Py_hash_t;
 #endif
 
 /* These two express if a directly called function should be exported (C level)
- * or if it can be local to the file.
+ * or if it can be local to the module. For modules with code split into several
+ * files, the generated header of the module makes the local ones visible to all
+ * of them.
  */
 #define NUITKA_CROSS_MODULE
 #define NUITKA_LOCAL_MODULE static
@@ -0,0 +1,94 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_RUNTIME_STATS_H__
+#define __NUITKA_RUNTIME_STATS_H__
+
+/* Runtime statistics, for "--runtime-stats" builds. The free lists, fibers
+ * and constant creation count what they do, and the built-in module
+ * "__nuitka_runtime_stats__" reports it to Python code.
+ */
+
+#if _NUITKA_RUNTIME_STATS
+
+struct Nuitka_FreeListStats {
+    // All allocations, and how many of these were taken from the free list.
+    unsigned long allocations;
+    unsigned long hits;
+
+    // All releases, and how many of these were deleted, the free list being
+    // full already.
+    unsigned long releases;
+    unsigned long deletes;
+
+    // The most objects held in the free list at once.
+    int high_water;
+};
+
+#define NUITKA_DEFINE_FREE_LIST_STATS( free_list ) \
+    struct Nuitka_FreeListStats free_list ## _stats;
+
+extern struct Nuitka_FreeListStats free_list_cells_stats;
+extern struct Nuitka_FreeListStats free_list_frames_stats;
+extern struct Nuitka_FreeListStats free_list_functions_stats;
+extern struct Nuitka_FreeListStats free_list_generators_stats;
+extern struct Nuitka_FreeListStats free_list_methods_stats;
+extern struct Nuitka_FreeListStats free_list_tracebacks_stats;
+#if PYTHON_VERSION >= 350
+extern struct Nuitka_FreeListStats free_list_coros_stats;
+extern struct Nuitka_FreeListStats free_list_coro_wrappers_stats;
+#endif
+#if PYTHON_VERSION >= 352
+extern struct Nuitka_FreeListStats free_list_coroutine_aiter_wrappers_stats;
+#endif
+#if PYTHON_VERSION >= 360
+extern struct Nuitka_FreeListStats free_list_asyncgens_stats;
+extern struct Nuitka_FreeListStats free_list_asyncgen_value_wrappers_stats;
+extern struct Nuitka_FreeListStats free_list_asyncgen_asends_stats;
+extern struct Nuitka_FreeListStats free_list_asyncgen_athrows_stats;
+#endif
+
+struct Nuitka_FiberStats {
+    // Fibers prepared, each with a stack, and switches between fibers.
+    unsigned long prepared;
+    unsigned long switches;
+};
+
+extern struct Nuitka_FiberStats fiber_stats;
+
+struct Nuitka_ConstantStats {
+    // Values created from the constants stream, and the bytes used for it.
+    unsigned long unstreamed;
+    unsigned long unstreamed_bytes;
+};
+
+extern struct Nuitka_ConstantStats constant_stats;
+
+#define NUITKA_COUNT_UNSTREAM( size ) \
+    constant_stats.unstreamed += 1;   \
+    constant_stats.unstreamed_bytes += size;
+
+extern void registerRuntimeStatsModule( void );
+
+#else
+
+#define NUITKA_DEFINE_FREE_LIST_STATS( free_list )
+#define NUITKA_COUNT_UNSTREAM( size )
+
+#endif
+
+#endif
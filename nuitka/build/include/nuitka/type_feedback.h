@@ -0,0 +1,83 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_TYPE_FEEDBACK_H__
+#define __NUITKA_TYPE_FEEDBACK_H__
+
+/* Type feedback recording, for "--type-feedback-record" builds. Every
+ * site counts the exact built-in types of the values it sees, operands of
+ * operations, arguments, local variables, and attribute look-up results, and
+ * these are appended to a file at exit, to be used by the next compilation.
+ */
+
+#if _NUITKA_TYPE_FEEDBACK
+
+// Kind 0 is for other types, and operands of different kinds.
+#define NUITKA_TYPE_FEEDBACK_KIND_COUNT 8
+
+struct Nuitka_TypeFeedbackSite {
+    char const *site_name;
+    unsigned long counts[ NUITKA_TYPE_FEEDBACK_KIND_COUNT ];
+};
+
+struct Nuitka_TypeFeedbackSites {
+    struct Nuitka_TypeFeedbackSite *sites;
+    int count;
+    struct Nuitka_TypeFeedbackSites *next;
+};
+
+extern void registerTypeFeedbackSites( struct Nuitka_TypeFeedbackSites *sites );
+
+NUITKA_MAY_BE_UNUSED static int getTypeFeedbackKind( PyObject *value )
+{
+    PyTypeObject *type = Py_TYPE( value );
+
+#if PYTHON_VERSION < 300
+    if ( type == &PyInt_Type ) return 1;
+#endif
+    if ( type == &PyLong_Type ) return 2;
+    if ( type == &PyFloat_Type ) return 3;
+    if ( type == &PyBytes_Type ) return 4;
+    if ( type == &PyUnicode_Type ) return 5;
+    if ( type == &PyList_Type ) return 6;
+    if ( type == &PyTuple_Type ) return 7;
+
+    return 0;
+}
+
+NUITKA_MAY_BE_UNUSED static void RECORD_TYPE_FEEDBACK1( struct Nuitka_TypeFeedbackSite *site, PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    site->counts[ getTypeFeedbackKind( value ) ] += 1;
+}
+
+NUITKA_MAY_BE_UNUSED static void RECORD_TYPE_FEEDBACK2( struct Nuitka_TypeFeedbackSite *site, PyObject *operand1, PyObject *operand2 )
+{
+    int kind = getTypeFeedbackKind( operand1 );
+
+    if ( kind != getTypeFeedbackKind( operand2 ) )
+    {
+        kind = 0;
+    }
+
+    site->counts[ kind ] += 1;
+}
+
+#endif
+
+#endif
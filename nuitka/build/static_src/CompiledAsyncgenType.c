@@ -600,9 +600,9 @@ static PyObject *Nuitka_Asyncgen_athrow( struct Nuitka_AsyncgenObject *asyncgen,
     return Nuitka_AsyncgenAthrow_New( asyncgen, args );
 }
 
-#define MAX_ASYNCGEN_FREE_LIST_COUNT 100
 static struct Nuitka_AsyncgenObject *free_list_asyncgens = NULL;
 static int free_list_asyncgens_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_asyncgens )
 
 // TODO: This might have to be finalize actually.
 static void Nuitka_Asyncgen_tp_dealloc( struct Nuitka_AsyncgenObject *asyncgen )
@@ -849,6 +849,7 @@ struct Nuitka_AsyncgenWrappedValueObject {
 
 static struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
 static int free_list_asyncgen_value_wrappers_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_asyncgen_value_wrappers )
 
 static void asyncgen_value_wrapper_tp_dealloc( struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper )
 {
@@ -1012,6 +1013,7 @@ static PyObject *Nuitka_Asyncgen_unwrap_value( struct Nuitka_AsyncgenObject *asy
 
 static struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
 static int free_list_asyncgen_asends_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_asyncgen_asends )
 
 
 static void Nuitka_AsyncgenAsend_tp_dealloc( struct Nuitka_AsyncgenAsendObject *asyncgen_asend )
@@ -1215,6 +1217,7 @@ struct Nuitka_AsyncgenAthrowObject
 
 static struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
 static int free_list_asyncgen_athrows_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_asyncgen_athrows )
 
 
 static void Nuitka_AsyncgenAthrow_dealloc( struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow )
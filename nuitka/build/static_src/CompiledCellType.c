@@ -21,9 +21,9 @@
 #include "nuitka/freelists.h"
 
 
-#define MAX_CELL_FREE_LIST_COUNT 1000
 static struct Nuitka_CellObject *free_list_cells = NULL;
 static int free_list_cells_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_cells )
 
 static void Nuitka_Cell_tp_dealloc( struct Nuitka_CellObject *cell )
 {
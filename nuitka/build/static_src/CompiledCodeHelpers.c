@@ -1304,6 +1304,8 @@ bool PRINT_ITEM( PyObject *object )
 #if PYTHON_VERSION < 300
 PyObject *UNSTREAM_UNICODE( unsigned char const *buffer, Py_ssize_t size )
 {
+    NUITKA_COUNT_UNSTREAM( size );
+
     PyObject *result = PyUnicode_FromStringAndSize( (char const  *)buffer, size );
 
     assert( !ERROR_OCCURRED() );
@@ -1315,6 +1317,8 @@ PyObject *UNSTREAM_UNICODE( unsigned char const *buffer, Py_ssize_t size )
 
 PyObject *UNSTREAM_STRING( unsigned char const *buffer, Py_ssize_t size, bool intern )
 {
+    NUITKA_COUNT_UNSTREAM( size );
+
 #if PYTHON_VERSION < 300
     PyObject *result = PyString_FromStringAndSize( (char const  *)buffer, size );
 #else
@@ -1348,6 +1352,8 @@ PyObject *UNSTREAM_STRING( unsigned char const *buffer, Py_ssize_t size, bool in
 
 PyObject *UNSTREAM_CHAR( unsigned char value, bool intern )
 {
+    NUITKA_COUNT_UNSTREAM( 1 );
+
 #if PYTHON_VERSION < 300
     PyObject *result = PyString_FromStringAndSize( (char const  *)&value, 1 );
 #else
@@ -1383,6 +1389,8 @@ PyObject *UNSTREAM_CHAR( unsigned char value, bool intern )
 
 PyObject *UNSTREAM_FLOAT( unsigned char const *buffer )
 {
+    NUITKA_COUNT_UNSTREAM( 8 );
+
     double x = _PyFloat_Unpack8( buffer, 1 );
     assert( x != -1.0 || !PyErr_Occurred() );
 
@@ -1395,6 +1403,8 @@ PyObject *UNSTREAM_FLOAT( unsigned char const *buffer )
 #if PYTHON_VERSION >= 300
 PyObject *UNSTREAM_BYTES( unsigned char const *buffer, Py_ssize_t size )
 {
+    NUITKA_COUNT_UNSTREAM( size );
+
     PyObject *result = PyBytes_FromStringAndSize( (char const  *)buffer, size );
     assert( !ERROR_OCCURRED() );
     CHECK_OBJECT( result );
@@ -1406,6 +1416,8 @@ PyObject *UNSTREAM_BYTES( unsigned char const *buffer, Py_ssize_t size )
 
 PyObject *UNSTREAM_BYTEARRAY( unsigned char const *buffer, Py_ssize_t size )
 {
+    NUITKA_COUNT_UNSTREAM( size );
+
     PyObject *result = PyByteArray_FromStringAndSize( (char const  *)buffer, size );
     assert( !ERROR_OCCURRED() );
     CHECK_OBJECT( result );
@@ -2177,6 +2189,80 @@ PyObject *BUILTIN_SUM1( PyObject *sequence )
 }
 
 
+static void QUICK_ITERATOR_RELEASE( struct Nuitka_QuickIterator *qiter )
+{
+    if ( qiter->iterator_mode == ITERATOR_GENERIC )
+    {
+        Py_DECREF( qiter->iterator_data.iter );
+    }
+}
+
+// Shared by "any" and "all", these stop at the first item with the given
+// truth value and return it, or the opposite when running out of items.
+static PyObject *_BUILTIN_ANY_ALL( PyObject *iterable, int stop_truth )
+{
+    struct Nuitka_QuickIterator qiter;
+
+    if (unlikely( MAKE_QUICK_ITERATOR( iterable, &qiter ) == false ))
+    {
+        return NULL;
+    }
+
+    PyObject *result;
+
+    for(;;)
+    {
+        bool finished;
+        PyObject *item = QUICK_ITERATOR_NEXT( &qiter, &finished );
+
+        if ( finished )
+        {
+            result = stop_truth ? Py_False : Py_True;
+            break;
+        }
+        else if ( item == NULL )
+        {
+            return NULL;
+        }
+
+        CHECK_OBJECT( item );
+
+        int res = CHECK_IF_TRUE( item );
+        Py_DECREF( item );
+
+        if (unlikely( res == -1 ))
+        {
+            QUICK_ITERATOR_RELEASE( &qiter );
+            return NULL;
+        }
+
+        if ( res == stop_truth )
+        {
+            QUICK_ITERATOR_RELEASE( &qiter );
+
+            result = stop_truth ? Py_True : Py_False;
+            break;
+        }
+    }
+
+    Py_INCREF( result );
+    return result;
+}
+
+PyObject *BUILTIN_ANY( PyObject *iterable )
+{
+    CHECK_OBJECT( iterable );
+
+    return _BUILTIN_ANY_ALL( iterable, 1 );
+}
+
+PyObject *BUILTIN_ALL( PyObject *iterable )
+{
+    CHECK_OBJECT( iterable );
+
+    return _BUILTIN_ANY_ALL( iterable, 0 );
+}
+
 NUITKA_DEFINE_BUILTIN( sum );
 
 PyObject *BUILTIN_SUM2( PyObject *sequence, PyObject *start )
@@ -3572,3 +3658,9 @@ PyObject *MY_RICHCOMPARE_NORECURSE( PyObject *a, PyObject *b, int op )
 #include "HelpersProfiling.c"
 #endif
 
+#include "HelpersTypeFeedback.c"
+
+#include "HelpersRuntimeStats.c"
+
+#include "HelpersImportTime.c"
+
@@ -665,6 +665,7 @@ static long Nuitka_Coroutine_tp_traverse( PyObject *coroutine, visitproc visit,
 
 static struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
 static int free_list_coro_wrappers_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_coro_wrappers )
 
 
 static PyObject *Nuitka_Coroutine_await( struct Nuitka_CoroutineObject *coroutine )
@@ -695,9 +696,9 @@ static PyObject *Nuitka_Coroutine_await( struct Nuitka_CoroutineObject *coroutin
     return (PyObject *)result;
 }
 
-#define MAX_COROUTINE_FREE_LIST_COUNT 100
 static struct Nuitka_CoroutineObject *free_list_coros = NULL;
 static int free_list_coros_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_coros )
 
 static void Nuitka_Coroutine_tp_dealloc( struct Nuitka_CoroutineObject *coroutine )
 {
@@ -1437,6 +1438,7 @@ static int Nuitka_AIterWrapper_traverse( struct Nuitka_AIterWrapper *aw, visitpr
 
 static struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
 static int free_list_coroutine_aiter_wrappers_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_coroutine_aiter_wrappers )
 
 static void Nuitka_AIterWrapper_dealloc( struct Nuitka_AIterWrapper *aw )
 {
@@ -327,9 +327,9 @@ void Nuitka_Frame_ReleaseLocals( struct Nuitka_FrameObject *frame )
     Nuitka_Frame_tp_clear( frame );
 }
 
-#define MAX_FRAME_FREE_LIST_COUNT 100
 static struct Nuitka_FrameObject *free_list_frames = NULL;
 static int free_list_frames_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_frames )
 
 
 static void Nuitka_Frame_tp_dealloc( struct Nuitka_FrameObject *nuitka_frame )
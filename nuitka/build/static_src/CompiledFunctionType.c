@@ -526,9 +526,9 @@ static PyObject *Nuitka_Function_reduce( struct Nuitka_FunctionObject *function
 }
 
 
-#define MAX_FUNCTION_FREE_LIST_COUNT 100
 static struct Nuitka_FunctionObject *free_list_functions = NULL;
 static int free_list_functions_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_functions )
 
 static void Nuitka_Function_tp_dealloc( struct Nuitka_FunctionObject *function )
 {
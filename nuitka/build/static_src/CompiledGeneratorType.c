@@ -60,6 +60,19 @@ static void Nuitka_Generator_release_closure( struct Nuitka_GeneratorObject *gen
     generator->m_closure_given = 0;
 }
 
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+// The local variables are released by the generator function when it exits,
+// this is only the storage of them.
+static void Nuitka_Generator_release_heap_storage( struct Nuitka_GeneratorObject *generator )
+{
+    if ( generator->m_heap_storage != NULL )
+    {
+        PyMem_Free( generator->m_heap_storage );
+        generator->m_heap_storage = NULL;
+    }
+}
+#endif
+
 #ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
 // For the generator object fiber entry point, we may need to follow what
 // "makecontext" will support and that is only a list of integers, but we will need
@@ -193,6 +206,10 @@ static PyObject *Nuitka_Generator_send2( struct Nuitka_GeneratorObject *generato
 
             Nuitka_Generator_release_closure( generator );
 
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+            Nuitka_Generator_release_heap_storage( generator );
+#endif
+
 #if PYTHON_VERSION < 300
             if ( saved_exception_type != NULL && saved_exception_type != Py_None )
             {
@@ -593,9 +610,9 @@ static void Nuitka_Generator_tp_del( struct Nuitka_GeneratorObject *generator )
 
 #endif
 
-#define MAX_GENERATOR_FREE_LIST_COUNT 100
 static struct Nuitka_GeneratorObject *free_list_generators = NULL;
 static int free_list_generators_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_generators )
 
 static void Nuitka_Generator_tp_dealloc( struct Nuitka_GeneratorObject *generator )
 {
@@ -631,6 +648,8 @@ static void Nuitka_Generator_tp_dealloc( struct Nuitka_GeneratorObject *generato
 
 #ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
     releaseFiber( &generator->m_yielder_context );
+#else
+    Nuitka_Generator_release_heap_storage( generator );
 #endif
 
     // Now it is safe to release references and memory for it.
@@ -922,6 +941,7 @@ PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject
     result->m_yielded = NULL;
 #else
     result->m_yield_return_index = 0;
+    result->m_heap_storage = NULL;
 #endif
 
     result->m_frame = NULL;
@@ -1106,6 +1126,7 @@ extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
 
 extern PyObject *const_str_plain_send, *const_str_plain_throw, *const_str_plain_close;
 
+#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
 static PyObject *_YIELD_FROM( struct Nuitka_GeneratorObject *generator, PyObject *value )
 {
     // This is the value, propagated back and forth the sub-generator and the
@@ -1523,6 +1544,185 @@ PyObject *GENERATOR_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *genera
     }
 }
 
+#else
+
+PyObject *GENERATOR_YIELD_FROM_ITERATOR( struct Nuitka_GeneratorObject *generator, PyObject *target )
+{
+#if PYTHON_VERSION >= 350
+    if ( PyCoro_CheckExact( target ) || Nuitka_Coroutine_Check( target ))
+    {
+        if (unlikely( (generator->m_code_object->co_flags & CO_ITERABLE_COROUTINE) == 0 ))
+        {
+            PyErr_SetString(
+                PyExc_TypeError,
+                "cannot 'yield from' a coroutine object in a non-coroutine generator"
+            );
+            return NULL;
+        }
+
+        Py_INCREF( target );
+        return target;
+    }
+#endif
+
+    return MAKE_ITERATOR( target );
+}
+
+// One step of "yield from", sending the value, or the exception thrown into
+// the generator, to the sub-generator. Returns the value it yielded, to be
+// yielded by the generator function, which then calls this again, when it's
+// resumed. Otherwise NULL is returned, and "*result" is the value of the
+// "yield from" expression, or NULL for an exception. The first step is made
+// with "send_value" as NULL.
+PyObject *GENERATOR_YIELD_FROM_STEP( struct Nuitka_GeneratorObject *generator, PyObject *value, PyObject *send_value, PyObject **result )
+{
+    CHECK_OBJECT( value );
+
+    if ( send_value == NULL )
+    {
+        send_value = Py_None;
+    }
+
+    CHECK_OBJECT( send_value );
+
+    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+
+#if PYTHON_VERSION >= 350
+    generator->m_yieldfrom = NULL;
+#endif
+
+    *result = NULL;
+
+    PyObject *retval;
+
+    // Exception, was thrown into us, need to send that to sub-generator.
+    if ( generator->m_exception_type )
+    {
+        // The yielding generator is being closed, but we also are tasked to
+        // immediately close the currently running sub-generator.
+        if ( EXCEPTION_MATCH_BOOL_SINGLE( generator->m_exception_type, PyExc_GeneratorExit ) )
+        {
+            PyObject *close_method = PyObject_GetAttr( value, const_str_plain_close );
+
+            if ( close_method )
+            {
+                PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
+                Py_DECREF( close_method );
+
+                if (unlikely( close_value == NULL ))
+                {
+                    Py_CLEAR( generator->m_exception_type );
+                    Py_CLEAR( generator->m_exception_value );
+                    Py_CLEAR( generator->m_exception_tb );
+
+                    return NULL;
+                }
+
+                Py_DECREF( close_value );
+            }
+            else
+            {
+                PyObject *error = GET_ERROR_OCCURRED();
+
+                if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
+                {
+                    PyErr_WriteUnraisable( (PyObject *)value );
+                }
+            }
+
+            RAISE_GENERATOR_EXCEPTION( generator );
+
+            return NULL;
+        }
+
+        PyObject *throw_method = PyObject_GetAttr( value, const_str_plain_throw );
+
+        if ( throw_method )
+        {
+            retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
+            Py_DECREF( throw_method );
+
+            Py_CLEAR( generator->m_exception_type );
+            Py_CLEAR( generator->m_exception_value );
+            Py_CLEAR( generator->m_exception_tb );
+        }
+        else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
+        {
+            CLEAR_ERROR_OCCURRED();
+
+            RAISE_GENERATOR_EXCEPTION( generator );
+
+            return NULL;
+        }
+        else
+        {
+            assert( ERROR_OCCURRED() );
+
+            Py_CLEAR( generator->m_exception_type );
+            Py_CLEAR( generator->m_exception_value );
+            Py_CLEAR( generator->m_exception_tb );
+
+            return NULL;
+        }
+    }
+    else if ( PyGen_CheckExact( value ) )
+    {
+        retval = PyGen_Send( (PyGenObject *)value, send_value );
+    }
+#if PYTHON_VERSION >= 350
+    else if ( PyCoro_CheckExact( value ) )
+    {
+        retval = PyGen_Send( (PyGenObject *)value, send_value );
+    }
+#endif
+    else if ( send_value == Py_None && Py_TYPE( value )->tp_iternext != NULL )
+    {
+        retval = Py_TYPE( value )->tp_iternext( value );
+    }
+    else
+    {
+        // Bug compatibility here, before 3.3 tuples were unrolled in calls, which is what
+        // PyObject_CallMethod does.
+#if PYTHON_VERSION >= 340
+        retval = PyObject_CallMethodObjArgs( value, const_str_plain_send, send_value, NULL );
+#else
+        retval = PyObject_CallMethod( value, (char *)"send", (char *)"O", send_value );
+#endif
+    }
+
+    // Check the sub-generator result
+    if ( retval == NULL )
+    {
+        PyObject *error = GET_ERROR_OCCURRED();
+
+        if ( error == NULL )
+        {
+            Py_INCREF( Py_None );
+            *result = Py_None;
+        }
+        // The sub-generator has given an exception. In case of StopIteration,
+        // we need to check the value, as it is going to be the expression
+        // value of this "yield from", and we are done. All other errors, we
+        // need to raise.
+        else if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
+        {
+            *result = ERROR_GET_STOP_ITERATION_VALUE();
+        }
+
+        return NULL;
+    }
+
+#if PYTHON_VERSION >= 350
+    generator->m_yieldfrom = value;
+#endif
+
+    Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+
+    return retval;
+}
+
+#endif
+
 #endif
 
 #endif
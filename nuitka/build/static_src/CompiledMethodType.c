@@ -506,9 +506,9 @@ static long Nuitka_Method_tp_hash( struct Nuitka_MethodObject *method )
     return method->m_function->m_counter;
 }
 
-#define MAX_METHOD_FREE_LIST_COUNT 100
 static struct Nuitka_MethodObject *free_list_methods = NULL;
 static int free_list_methods_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_methods )
 
 static void Nuitka_Method_tp_dealloc( struct Nuitka_MethodObject *method )
 {
@@ -81,6 +81,57 @@ static PyObject *CALL_BUILTIN_KW_ARGS( PyObject *callable, PyObject **args, char
 
 NUITKA_DEFINE_BUILTIN( compile )
 
+// Cache of code objects compiled from source strings at run time, as "exec"
+// and "eval" are often used repeatedly with the same source. The key is the
+// source with its type, the file name, mode and the inherited future flags.
+static PyObject *compile_cache = NULL;
+
+#define NUITKA_COMPILE_CACHE_SIZE 256
+
+static PyObject *makeCompileCacheKey( PyObject *source_code, PyObject *file_name, PyObject *mode )
+{
+    if ( !PyUnicode_CheckExact( source_code ) &&
+#if PYTHON_VERSION < 300
+         !PyString_CheckExact( source_code )
+#else
+         !PyBytes_CheckExact( source_code )
+#endif
+       )
+    {
+        return NULL;
+    }
+
+    // Flags are inherited from the calling frame, like the built-in does.
+    int inherited_flags = 0;
+
+    PyFrameObject *frame = PyEval_GetFrame();
+
+    if ( frame != NULL )
+    {
+        inherited_flags = frame->f_code->co_flags & PyCF_MASK;
+    }
+
+    PyObject *flags_value = PyInt_FromLong( inherited_flags );
+
+    PyObject *result = PyTuple_Pack(
+        5,
+        (PyObject *)Py_TYPE( source_code ),
+        source_code,
+        file_name,
+        mode,
+        flags_value
+    );
+
+    Py_DECREF( flags_value );
+
+    if (unlikely( result == NULL ))
+    {
+        CLEAR_ERROR_OCCURRED();
+    }
+
+    return result;
+}
+
 #if PYTHON_VERSION < 300
 PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit )
 #else
@@ -95,6 +146,30 @@ PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mo
         return source_code;
     }
 
+    PyObject *cache_key = NULL;
+
+#if PYTHON_VERSION < 300
+    if ( flags == NULL && dont_inherit == NULL )
+#else
+    if ( flags == NULL && dont_inherit == NULL && optimize == NULL )
+#endif
+    {
+        cache_key = makeCompileCacheKey( source_code, file_name, mode );
+
+        if ( cache_key != NULL && compile_cache != NULL )
+        {
+            PyObject *cached = PyDict_GetItem( compile_cache, cache_key );
+
+            if ( cached != NULL )
+            {
+                Py_DECREF( cache_key );
+
+                Py_INCREF( cached );
+                return cached;
+            }
+        }
+    }
+
     PyObject *pos_args = PyTuple_New(3);
     PyTuple_SET_ITEM( pos_args, 0, source_code );
     Py_INCREF( source_code );
@@ -136,9 +211,63 @@ PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mo
     Py_DECREF( pos_args );
     Py_XDECREF( kw_args );
 
+    if ( cache_key != NULL )
+    {
+        // Only code objects are immutable, and failures are not cached.
+        if ( result != NULL && PyCode_Check( result ) )
+        {
+            if ( compile_cache == NULL )
+            {
+                compile_cache = PyDict_New();
+            }
+            else if ( DICT_SIZE( compile_cache ) >= NUITKA_COMPILE_CACHE_SIZE )
+            {
+                PyDict_Clear( compile_cache );
+            }
+
+            if ( compile_cache == NULL || PyDict_SetItem( compile_cache, cache_key, result ) != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        Py_DECREF( cache_key );
+    }
+
     return result;
 }
 
+PyObject *LOAD_PRECOMPILED_CODE( PyObject **code_object, char const *data, Py_ssize_t size, PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags )
+{
+    if ( *code_object == NULL )
+    {
+        // The code was compiled without optimization, which cannot change
+        // while running, so the result is kept the same way.
+        if ( source_code != NULL && Py_OptimizeFlag != 0 )
+        {
+#if PYTHON_VERSION < 300
+            *code_object = COMPILE_CODE( source_code, file_name, mode, flags, Py_True );
+#else
+            *code_object = COMPILE_CODE( source_code, file_name, mode, flags, Py_True, NULL );
+#endif
+        }
+        else
+        {
+            *code_object = PyMarshal_ReadObjectFromString( (char *)data, size );
+        }
+
+        if (unlikely( *code_object == NULL ))
+        {
+            return NULL;
+        }
+
+        assert( PyCode_Check( *code_object ) );
+    }
+
+    Py_INCREF( *code_object );
+    return *code_object;
+}
+
 /**
  *  The "eval" implementation, used for "exec" too.
  */
@@ -720,3 +720,142 @@ PyObject *CALL_METHOD_NO_ARGS( PyObject *source, PyObject *attr_name )
         return NULL;
     }
 }
+
+PyObject *CALL_FUNCTION_WITH_STAR_ARGS( PyObject *called, PyObject *positional_args, PyObject *kw, PyObject *star_list, PyObject *star_dict )
+{
+    CHECK_OBJECT( called );
+
+    assert( positional_args == NULL || PyTuple_CheckExact( positional_args ) );
+    assert( kw == NULL || PyDict_CheckExact( kw ) );
+    assert( star_list == NULL || PyTuple_CheckExact( star_list ) );
+    assert( star_dict == NULL || PyDict_CheckExact( star_dict ) );
+
+    // Merge the keyword arguments, the caller has checked that there are no
+    // duplicates, so this cannot fail other than with memory errors.
+    PyObject *named_args;
+
+    if ( kw != NULL && star_dict != NULL )
+    {
+        named_args = PyDict_Copy( kw );
+
+        if (unlikely( named_args == NULL ))
+        {
+            return NULL;
+        }
+
+        if (unlikely( PyDict_Update( named_args, star_dict ) == -1 ))
+        {
+            Py_DECREF( named_args );
+            return NULL;
+        }
+    }
+    else
+    {
+        named_args = kw != NULL ? kw : star_dict;
+
+        Py_XINCREF( named_args );
+    }
+
+    Py_ssize_t pos_size = positional_args != NULL ? PyTuple_GET_SIZE( positional_args ) : 0;
+    Py_ssize_t star_size = star_list != NULL ? PyTuple_GET_SIZE( star_list ) : 0;
+
+    PyObject *result;
+
+    if ( Nuitka_Function_Check( called ) )
+    {
+        if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+        {
+            Py_XDECREF( named_args );
+            return NULL;
+        }
+
+        struct Nuitka_FunctionObject *function = (struct Nuitka_FunctionObject *)called;
+
+        // Avoid the tuple concatenation, the arguments are only borrowed for
+        // argument parsing, so an array of them is good enough.
+        if ( star_size == 0 )
+        {
+            result = Nuitka_CallFunctionPosArgsKwArgs(
+                function,
+                pos_size != 0 ? &PyTuple_GET_ITEM( positional_args, 0 ) : NULL,
+                pos_size,
+                named_args
+            );
+        }
+        else if ( pos_size == 0 )
+        {
+            result = Nuitka_CallFunctionPosArgsKwArgs(
+                function,
+                &PyTuple_GET_ITEM( star_list, 0 ),
+                star_size,
+                named_args
+            );
+        }
+        else
+        {
+#ifdef _MSC_VER
+            PyObject **args = (PyObject **)_alloca( sizeof( PyObject * ) * ( pos_size + star_size ) );
+#else
+            PyObject *args[ pos_size + star_size ];
+#endif
+            memcpy( args, &PyTuple_GET_ITEM( positional_args, 0 ), pos_size * sizeof(PyObject *) );
+            memcpy( args + pos_size, &PyTuple_GET_ITEM( star_list, 0 ), star_size * sizeof(PyObject *) );
+
+            result = Nuitka_CallFunctionPosArgsKwArgs(
+                function,
+                args,
+                pos_size + star_size,
+                named_args
+            );
+        }
+
+        Py_LeaveRecursiveCall();
+    }
+    else
+    {
+        PyObject *args;
+
+        if ( star_size == 0 )
+        {
+            args = pos_size != 0 ? positional_args : const_tuple_empty;
+            Py_INCREF( args );
+        }
+        else if ( pos_size == 0 )
+        {
+            args = star_list;
+            Py_INCREF( args );
+        }
+        else
+        {
+            args = PyTuple_New( pos_size + star_size );
+
+            if (unlikely( args == NULL ))
+            {
+                Py_XDECREF( named_args );
+                return NULL;
+            }
+
+            for( Py_ssize_t i = 0; i < pos_size; i++ )
+            {
+                PyObject *item = PyTuple_GET_ITEM( positional_args, i );
+                Py_INCREF( item );
+                PyTuple_SET_ITEM( args, i, item );
+            }
+
+            for( Py_ssize_t i = 0; i < star_size; i++ )
+            {
+                PyObject *item = PyTuple_GET_ITEM( star_list, i );
+                Py_INCREF( item );
+                PyTuple_SET_ITEM( args, pos_size + i, item );
+            }
+        }
+
+        result = CALL_FUNCTION( called, args, named_args );
+
+        Py_DECREF( args );
+    }
+
+    Py_XDECREF( named_args );
+
+    return result;
+}
@@ -0,0 +1,166 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for timing the loading of embedded modules, if the
+ * "NUITKA_IMPORT_TIME" environment variable is set. Each module gives one
+ * line on "stderr" when done, nested imports come before the importing
+ * module, and are indented, just like "-X importtime" of CPython does it.
+ */
+
+#ifndef _WIN32
+#include <time.h>
+#endif
+
+// Deeper nesting is not reported, but still counted.
+#define MAX_IMPORT_TIME_DEPTH 256
+
+struct Nuitka_ImportTimeEntry {
+    char const *name;
+
+    // All in microseconds, marks are -1 if not reached. These exceed the
+    // range of "long" on Windows, where it is 32 bits.
+    PY_LONG_LONG start;
+    PY_LONG_LONG marks[ 2 ];
+    PY_LONG_LONG children;
+};
+
+static struct Nuitka_ImportTimeEntry import_time_stack[ MAX_IMPORT_TIME_DEPTH ];
+static int import_time_depth = 0;
+
+// Decided on first use, -1 means not yet known.
+static int import_time_enabled = -1;
+
+static PY_LONG_LONG getImportTimeNow( void )
+{
+#ifdef _WIN32
+    LARGE_INTEGER counter, frequency;
+
+    QueryPerformanceCounter( &counter );
+    QueryPerformanceFrequency( &frequency );
+
+    return (PY_LONG_LONG)( counter.QuadPart / frequency.QuadPart * 1000000 + counter.QuadPart % frequency.QuadPart * 1000000 / frequency.QuadPart );
+#else
+    struct timespec now;
+    clock_gettime( CLOCK_MONOTONIC, &now );
+
+    return (PY_LONG_LONG)now.tv_sec * 1000000 + now.tv_nsec / 1000;
+#endif
+}
+
+void startImportTimeTrace( char const *name )
+{
+    if ( import_time_enabled == -1 )
+    {
+        char const *value = getenv( "NUITKA_IMPORT_TIME" );
+
+        import_time_enabled = value != NULL && *value != 0;
+
+        if ( import_time_enabled )
+        {
+            fprintf(
+                stderr,
+                "import time: self [us] | cumulative | constants | code objects |   body | imported package\n"
+            );
+        }
+    }
+
+    if ( import_time_enabled == 0 )
+    {
+        return;
+    }
+
+    if ( import_time_depth < MAX_IMPORT_TIME_DEPTH )
+    {
+        struct Nuitka_ImportTimeEntry *entry = &import_time_stack[ import_time_depth ];
+
+        entry->name = name;
+        entry->marks[ IMPORT_TIME_PHASE_CONSTANTS ] = -1;
+        entry->marks[ IMPORT_TIME_PHASE_CODE_OBJECTS ] = -1;
+        entry->children = 0;
+        entry->start = getImportTimeNow();
+    }
+
+    import_time_depth += 1;
+}
+
+void markImportTimeTrace( int phase )
+{
+    if ( import_time_enabled != 1 || import_time_depth == 0 || import_time_depth > MAX_IMPORT_TIME_DEPTH )
+    {
+        return;
+    }
+
+    import_time_stack[ import_time_depth - 1 ].marks[ phase ] = getImportTimeNow();
+}
+
+static char const *formatImportTimePhase( char *buffer, size_t size, PY_LONG_LONG start, PY_LONG_LONG end )
+{
+    if ( start == -1 || end == -1 )
+    {
+        return "-";
+    }
+
+    snprintf( buffer, size, "%lld", (long long)( end - start ) );
+    return buffer;
+}
+
+void stopImportTimeTrace( void )
+{
+    if ( import_time_enabled != 1 )
+    {
+        return;
+    }
+
+    assert( import_time_depth > 0 );
+    import_time_depth -= 1;
+
+    if ( import_time_depth >= MAX_IMPORT_TIME_DEPTH )
+    {
+        return;
+    }
+
+    PY_LONG_LONG end = getImportTimeNow();
+
+    struct Nuitka_ImportTimeEntry *entry = &import_time_stack[ import_time_depth ];
+
+    PY_LONG_LONG cumulative = end - entry->start;
+
+    if ( import_time_depth > 0 )
+    {
+        import_time_stack[ import_time_depth - 1 ].children += cumulative;
+    }
+
+    PY_LONG_LONG constants_end = entry->marks[ IMPORT_TIME_PHASE_CONSTANTS ];
+    PY_LONG_LONG code_objects_end = entry->marks[ IMPORT_TIME_PHASE_CODE_OBJECTS ];
+
+    // The body excludes the nested imports, these have their own lines.
+    char constants[32], code_objects[32], body[32];
+
+    fprintf(
+        stderr,
+        "import time: %9lld | %10lld | %9s | %12s | %6s | %*s%s\n",
+        (long long)( cumulative - entry->children ),
+        (long long)cumulative,
+        formatImportTimePhase( constants, sizeof(constants), entry->start, constants_end ),
+        formatImportTimePhase( code_objects, sizeof(code_objects), constants_end, code_objects_end ),
+        formatImportTimePhase( body, sizeof(body), code_objects_end, code_objects_end == -1 ? -1 : end - entry->children ),
+        import_time_depth * 2,
+        "",
+        entry->name
+    );
+}
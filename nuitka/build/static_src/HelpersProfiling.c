@@ -16,16 +16,339 @@
 //     limitations under the License.
 //
 /**
- * This is responsible for profiling Nuitka using "vmprof".
+ * This is responsible for profiling Nuitka using "vmprof", or the built-in
+ * sampling profiler, if "NUITKA_PROFILE_SAMPLES" gives a file name for it.
  */
 
 #if _NUITKA_PROFILE
 
-timespec diff(timespec start, timespec end);
+#ifndef _WIN32
+#include <signal.h>
+#include <sys/time.h>
 
-static timespec getTimespecDiff( timespec start, timespec end )
+#include "pythread.h"
+
+/* The sampling profiler interrupts the program with a timer signal, and walks
+ * the frame stack, which compiled code maintains just like CPython. Nothing
+ * is allocated in the signal handler. Code objects are translated to labels
+ * when first seen, and a sample is only the label indexes of its frames. At
+ * exit, the stacks are written in collapsed form, one line per distinct
+ * stack with its count, as used by flame graph tools.
+ */
+
+// Number of labels for code objects, a power of two, and their size.
+#define SAMPLER_LABEL_COUNT 8192
+#define SAMPLER_LABEL_SIZE 128
+
+// Deeper stacks are cut off at the outer end.
+#define SAMPLER_MAX_DEPTH 256
+
+// Space for samples, entries are depth and then label indexes.
+#define SAMPLER_BUFFER_SIZE (16*1024*1024)
+
+struct Nuitka_SamplerLabel {
+    void const *code;
+    char label[ SAMPLER_LABEL_SIZE ];
+};
+
+static char const *sampler_filename = NULL;
+
+static struct Nuitka_SamplerLabel *sampler_labels = NULL;
+static int sampler_label_used = 0;
+
+static int *sampler_buffer = NULL;
+static size_t sampler_buffer_used = 0;
+static unsigned long sampler_dropped = 0;
+
+static void appendLabelText( char *label, int *pos, char const *text, Py_ssize_t size )
+{
+    for ( Py_ssize_t i = 0; i < size && *pos < SAMPLER_LABEL_SIZE - 1; i++ )
+    {
+        // Separator of the collapsed stack output, must not be in labels.
+        label[ (*pos)++ ] = text[ i ] == ';' ? ':' : text[ i ];
+    }
+}
+
+static void appendLabelString( char *label, int *pos, PyObject *value, bool basename )
+{
+    char const *text;
+    Py_ssize_t size;
+
+#if PYTHON_VERSION < 300
+    if ( !PyString_Check( value ) )
+    {
+        appendLabelText( label, pos, "?", 1 );
+        return;
+    }
+
+    text = PyString_AS_STRING( value );
+    size = PyString_GET_SIZE( value );
+#elif PYTHON_VERSION >= 330
+    // Only ASCII strings can be used without conversion, which would need
+    // memory allocation.
+    if ( !PyUnicode_Check( value ) || !PyUnicode_IS_READY( value ) || !PyUnicode_IS_COMPACT_ASCII( value ) )
+    {
+        appendLabelText( label, pos, "?", 1 );
+        return;
+    }
+
+    text = (char const *)( ((PyASCIIObject *)value) + 1 );
+    size = ((PyASCIIObject *)value)->length;
+#else
+    appendLabelText( label, pos, "?", 1 );
+    return;
+#endif
+
+    if ( basename )
+    {
+        for ( Py_ssize_t i = size - 1; i >= 0; i-- )
+        {
+            if ( text[ i ] == '/' || text[ i ] == '\\' )
+            {
+                text += i + 1;
+                size -= i + 1;
+
+                break;
+            }
+        }
+    }
+
+    appendLabelText( label, pos, text, size );
+}
+
+static void appendLabelNumber( char *label, int *pos, int value )
+{
+    char digits[ 16 ];
+    int count = 0;
+
+    do
+    {
+        digits[ count++ ] = (char)( '0' + value % 10 );
+        value /= 10;
+    }
+    while ( value > 0 && count < (int)sizeof( digits ) );
+
+    while ( count > 0 && *pos < SAMPLER_LABEL_SIZE - 1 )
+    {
+        label[ (*pos)++ ] = digits[ --count ];
+    }
+}
+
+static int getSamplerLabelIndex( PyCodeObject *code )
+{
+    size_t hash = ( (size_t)code >> 4 ) & ( SAMPLER_LABEL_COUNT - 1 );
+
+    for (;;)
+    {
+        struct Nuitka_SamplerLabel *entry = &sampler_labels[ hash ];
+
+        if ( entry->code == code )
+        {
+            return (int)hash;
+        }
+
+        if ( entry->code == NULL )
+        {
+            // Keep the table sparse, everything else is counted as unknown.
+            if ( sampler_label_used >= SAMPLER_LABEL_COUNT / 2 )
+            {
+                return -1;
+            }
+
+            sampler_label_used += 1;
+
+            int pos = 0;
+            appendLabelString( entry->label, &pos, code->co_name, false );
+            appendLabelText( entry->label, &pos, " (", 2 );
+            appendLabelString( entry->label, &pos, code->co_filename, true );
+            appendLabelText( entry->label, &pos, ":", 1 );
+            appendLabelNumber( entry->label, &pos, code->co_firstlineno );
+            appendLabelText( entry->label, &pos, ")", 1 );
+            entry->label[ pos ] = 0;
+
+            entry->code = code;
+
+            return (int)hash;
+        }
+
+        hash = ( hash + 1 ) & ( SAMPLER_LABEL_COUNT - 1 );
+    }
+}
+
+static void takeSample( int signum )
+{
+#if PYTHON_VERSION < 330
+    PyThreadState *tstate = _PyThreadState_Current;
+#elif PYTHON_VERSION < 352
+    // This is what "PyThreadState_GET" does, unless in debug mode, where it
+    // is a fatal error to not have a thread state.
+    PyThreadState *tstate = (PyThreadState *)_Py_atomic_load_relaxed( &_PyThreadState_Current );
+#else
+    PyThreadState *tstate = _PyThreadState_UncheckedGet();
+#endif
+
+    // Only the thread currently running Python code can be sampled safely.
+    if ( tstate == NULL || (long)tstate->thread_id != (long)PyThread_get_thread_ident() )
+    {
+        return;
+    }
+
+    int depth = 0;
+
+    for ( PyFrameObject *frame = tstate->frame; frame != NULL && depth < SAMPLER_MAX_DEPTH; frame = frame->f_back )
+    {
+        depth += 1;
+    }
+
+    if ( depth == 0 )
+    {
+        return;
+    }
+
+    if ( sampler_buffer_used + depth + 1 > SAMPLER_BUFFER_SIZE / sizeof( int ) )
+    {
+        sampler_dropped += 1;
+        return;
+    }
+
+    sampler_buffer[ sampler_buffer_used++ ] = depth;
+
+    PyFrameObject *frame = tstate->frame;
+
+    for ( int i = 0; i < depth; i++ )
+    {
+        sampler_buffer[ sampler_buffer_used++ ] = getSamplerLabelIndex( frame->f_code );
+        frame = frame->f_back;
+    }
+}
+
+static void setSamplerTimer( long interval )
+{
+    struct itimerval timer;
+
+    timer.it_interval.tv_sec = interval / 1000000;
+    timer.it_interval.tv_usec = interval % 1000000;
+    timer.it_value = timer.it_interval;
+
+    setitimer( ITIMER_PROF, &timer, NULL );
+}
+
+static void startSampling( char const *filename )
+{
+    sampler_labels = (struct Nuitka_SamplerLabel *)calloc( SAMPLER_LABEL_COUNT, sizeof( struct Nuitka_SamplerLabel ) );
+    sampler_buffer = (int *)malloc( SAMPLER_BUFFER_SIZE );
+
+    if ( sampler_labels == NULL || sampler_buffer == NULL )
+    {
+        fprintf( stderr, "Nuitka: Cannot allocate memory for sampling profiler.\n" );
+        abort();
+    }
+
+    sampler_filename = filename;
+
+    // Interval in microseconds, by default a thousand samples per second.
+    char const *interval_value = getenv( "NUITKA_PROFILE_INTERVAL" );
+    long interval = interval_value != NULL ? atol( interval_value ) : 0;
+
+    if ( interval <= 0 )
+    {
+        interval = 1000;
+    }
+
+    struct sigaction action;
+    memset( &action, 0, sizeof( action ) );
+    action.sa_handler = takeSample;
+    action.sa_flags = SA_RESTART;
+    sigemptyset( &action.sa_mask );
+
+    sigaction( SIGPROF, &action, NULL );
+
+    setSamplerTimer( interval );
+}
+
+static void stopSampling( void )
 {
-    timespec temp;
+    setSamplerTimer( 0 );
+    signal( SIGPROF, SIG_IGN );
+
+    FILE *samples_file = fopen( sampler_filename, "w" );
+
+    if ( samples_file == NULL )
+    {
+        perror( "Nuitka: Cannot write profile samples" );
+        return;
+    }
+
+    // Save the current exception, if any, we must preserve it.
+    PyObject *save_exception_type, *save_exception_value;
+    PyTracebackObject *save_exception_tb;
+    FETCH_ERROR_OCCURRED( &save_exception_type, &save_exception_value, &save_exception_tb );
+
+    // Count the distinct stacks, with outermost frames first.
+    PyObject *stack_counts = PyDict_New();
+    char *stack = (char *)malloc( SAMPLER_MAX_DEPTH * SAMPLER_LABEL_SIZE );
+
+    for ( size_t i = 0; i < sampler_buffer_used; )
+    {
+        int depth = sampler_buffer[ i ];
+        size_t pos = 0;
+
+        for ( int j = depth; j > 0; j-- )
+        {
+            int label_index = sampler_buffer[ i + j ];
+            char const *label = label_index >= 0 ? sampler_labels[ label_index ].label : "[unknown]";
+
+            if ( pos != 0 )
+            {
+                stack[ pos++ ] = ';';
+            }
+
+            size_t size = strlen( label );
+            memcpy( stack + pos, label, size );
+            pos += size;
+        }
+
+        i += depth + 1;
+
+        PyObject *key = PyBytes_FromStringAndSize( stack, pos );
+        PyObject *count = PyDict_GetItem( stack_counts, key );
+
+        PyObject *new_count = PyInt_FromLong( count != NULL ? PyInt_AsLong( count ) + 1 : 1 );
+        PyDict_SetItem( stack_counts, key, new_count );
+
+        Py_DECREF( new_count );
+        Py_DECREF( key );
+    }
+
+    free( stack );
+
+    Py_ssize_t dict_pos = 0;
+    PyObject *key, *value;
+
+    while ( PyDict_Next( stack_counts, &dict_pos, &key, &value ) )
+    {
+        fprintf( samples_file, "%s %ld\n", PyBytes_AS_STRING( key ), PyInt_AsLong( value ) );
+    }
+
+    Py_DECREF( stack_counts );
+
+    fclose( samples_file );
+
+    if ( sampler_dropped != 0 )
+    {
+        fprintf( stderr, "Nuitka: Profile sample buffer was full, dropped %lu samples.\n", sampler_dropped );
+    }
+
+    free( sampler_buffer );
+    free( sampler_labels );
+
+    RESTORE_ERROR_OCCURRED( save_exception_type, save_exception_value, save_exception_tb );
+}
+#endif
+
+static struct timespec getTimespecDiff( struct timespec start, struct timespec end )
+{
+    struct timespec temp;
 
     if ( ( end.tv_nsec - start.tv_nsec ) < 0 )
     {
@@ -44,10 +367,20 @@ static timespec getTimespecDiff( timespec start, timespec end )
 static FILE *tempfile_profile;
 static PyObject *vmprof_module;
 
-static timespec time1, time2;
+static struct timespec time1, time2;
 
 void startProfiling( void )
 {
+#ifndef _WIN32
+    char const *samples_filename = getenv( "NUITKA_PROFILE_SAMPLES" );
+
+    if ( samples_filename != NULL )
+    {
+        startSampling( samples_filename );
+        return;
+    }
+#endif
+
     tempfile_profile = fopen("nuitka-performance.dat", "wb");
 
     // Might be necessary to import "site" module to find "vmprof", lets just
@@ -63,9 +396,13 @@ void startProfiling( void )
         abort();
     }
 
+    PyObject *args[] = {
+        PyInt_FromLong( fileno( tempfile_profile ) )
+    };
+
     PyObject *result = CALL_FUNCTION_WITH_ARGS1(
         PyObject_GetAttrString( vmprof_module, "enable"),
-         PyInt_FromLong( fileno( tempfile_profile ) )
+        args
     );
 
     if ( result == NULL ) {
@@ -78,6 +415,14 @@ void startProfiling( void )
 
 void stopProfiling( void )
 {
+#ifndef _WIN32
+    if ( sampler_filename != NULL )
+    {
+        stopSampling();
+        return;
+    }
+#endif
+
     clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time2);
 
     // Save the current exception, if any, we must preserve it.
@@ -95,7 +440,7 @@ void stopProfiling( void )
 
     FILE *tempfile_times = fopen( "nuitka-times.dat", "wb" );
 
-    timespec diff = getTimespecDiff( time1, time2 );
+    struct timespec diff = getTimespecDiff( time1, time2 );
 
     long delta_ns = diff.tv_sec * 1000000000 + diff.tv_nsec;
     fprintf( tempfile_times, "%ld\n", delta_ns);
@@ -0,0 +1,212 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This provides the "__nuitka_runtime_stats__" module for "--runtime-stats"
+ * builds, reporting what free lists, fibers and constant creation did.
+ */
+
+#if _NUITKA_RUNTIME_STATS
+
+#include "nuitka/freelists.h"
+
+struct Nuitka_FiberStats fiber_stats;
+struct Nuitka_ConstantStats constant_stats;
+
+struct Nuitka_FreeListStatsEntry {
+    char const *name;
+    struct Nuitka_FreeListStats *stats;
+    int limit;
+};
+
+static struct Nuitka_FreeListStatsEntry free_list_stats_entries[] =
+{
+    { "cells", &free_list_cells_stats, MAX_CELL_FREE_LIST_COUNT },
+    { "frames", &free_list_frames_stats, MAX_FRAME_FREE_LIST_COUNT },
+    { "functions", &free_list_functions_stats, MAX_FUNCTION_FREE_LIST_COUNT },
+    { "generators", &free_list_generators_stats, MAX_GENERATOR_FREE_LIST_COUNT },
+    { "methods", &free_list_methods_stats, MAX_METHOD_FREE_LIST_COUNT },
+    { "tracebacks", &free_list_tracebacks_stats, MAX_TRACEBACK_FREE_LIST_COUNT },
+#if PYTHON_VERSION >= 350
+    { "coroutines", &free_list_coros_stats, MAX_COROUTINE_FREE_LIST_COUNT },
+    { "coroutine_wrappers", &free_list_coro_wrappers_stats, MAX_COROUTINE_FREE_LIST_COUNT },
+#endif
+#if PYTHON_VERSION >= 352
+    { "coroutine_aiter_wrappers", &free_list_coroutine_aiter_wrappers_stats, MAX_COROUTINE_FREE_LIST_COUNT },
+#endif
+#if PYTHON_VERSION >= 360
+    { "asyncgens", &free_list_asyncgens_stats, MAX_ASYNCGEN_FREE_LIST_COUNT },
+    { "asyncgen_value_wrappers", &free_list_asyncgen_value_wrappers_stats, MAX_ASYNCGEN_FREE_LIST_COUNT },
+    { "asyncgen_asends", &free_list_asyncgen_asends_stats, MAX_ASYNCGEN_FREE_LIST_COUNT },
+    { "asyncgen_athrows", &free_list_asyncgen_athrows_stats, MAX_ASYNCGEN_FREE_LIST_COUNT },
+#endif
+    { NULL, NULL, 0 }
+};
+
+static bool setStatsItem( PyObject *dict, char const *name, unsigned long value )
+{
+    PyObject *value_object = PyLong_FromUnsignedLong( value );
+
+    if (unlikely( value_object == NULL ))
+    {
+        return false;
+    }
+
+    int res = PyDict_SetItemString( dict, name, value_object );
+    Py_DECREF( value_object );
+
+    return res == 0;
+}
+
+static PyObject *makeFreeListStats( struct Nuitka_FreeListStatsEntry const *entry )
+{
+    PyObject *result = PyDict_New();
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    struct Nuitka_FreeListStats const *stats = entry->stats;
+
+    if ( !setStatsItem( result, "allocations", stats->allocations ) ||
+         !setStatsItem( result, "hits", stats->hits ) ||
+         !setStatsItem( result, "misses", stats->allocations - stats->hits ) ||
+         !setStatsItem( result, "releases", stats->releases ) ||
+         !setStatsItem( result, "deletes", stats->deletes ) ||
+         !setStatsItem( result, "high_water", (unsigned long)stats->high_water ) ||
+         !setStatsItem( result, "limit", (unsigned long)entry->limit ) )
+    {
+        Py_DECREF( result );
+        return NULL;
+    }
+
+    return result;
+}
+
+static PyObject *_getRuntimeStats( PyObject *self, PyObject *args )
+{
+    PyObject *free_lists = PyDict_New();
+    PyObject *fibers = PyDict_New();
+    PyObject *constants = PyDict_New();
+    PyObject *result = NULL;
+
+    if (unlikely( free_lists == NULL || fibers == NULL || constants == NULL ))
+    {
+        goto error_exit;
+    }
+
+    for ( struct Nuitka_FreeListStatsEntry const *entry = free_list_stats_entries; entry->name != NULL; entry++ )
+    {
+        PyObject *entry_stats = makeFreeListStats( entry );
+
+        if (unlikely( entry_stats == NULL ))
+        {
+            goto error_exit;
+        }
+
+        int res = PyDict_SetItemString( free_lists, entry->name, entry_stats );
+        Py_DECREF( entry_stats );
+
+        if (unlikely( res != 0 ))
+        {
+            goto error_exit;
+        }
+    }
+
+    if ( !setStatsItem( fibers, "prepared", fiber_stats.prepared ) ||
+         !setStatsItem( fibers, "switches", fiber_stats.switches ) ||
+         !setStatsItem( constants, "unstreamed", constant_stats.unstreamed ) ||
+         !setStatsItem( constants, "unstreamed_bytes", constant_stats.unstreamed_bytes ) )
+    {
+        goto error_exit;
+    }
+
+    result = Py_BuildValue(
+        "{sOsOsO}",
+        "free_lists", free_lists,
+        "fibers", fibers,
+        "constants", constants
+    );
+
+error_exit:
+    Py_XDECREF( free_lists );
+    Py_XDECREF( fibers );
+    Py_XDECREF( constants );
+
+    return result;
+}
+
+static PyMethodDef _runtime_stats_methods[] =
+{
+    {
+        "get_stats",
+        (PyCFunction)_getRuntimeStats,
+        METH_NOARGS,
+        "get_stats() -> dict\n\nReturn the counts of the Nuitka runtime so far."
+    },
+    { NULL, NULL, 0, NULL }
+};
+
+#if PYTHON_VERSION >= 300
+static struct PyModuleDef _runtime_stats_module_def =
+{
+    PyModuleDef_HEAD_INIT,
+    "__nuitka_runtime_stats__",  /* m_name */
+    NULL,                        /* m_doc */
+    -1,                          /* m_size */
+    _runtime_stats_methods,      /* m_methods */
+    NULL,                        /* m_reload */
+    NULL,                        /* m_traverse */
+    NULL,                        /* m_clear */
+    NULL,                        /* m_free */
+};
+#endif
+
+void registerRuntimeStatsModule( void )
+{
+    PyObject *sys_modules = PyImport_GetModuleDict();
+
+    // Extension modules each have their copy of the runtime, the first one
+    // to get loaded provides it.
+    if ( PyDict_GetItemString( sys_modules, "__nuitka_runtime_stats__" ) != NULL )
+    {
+        return;
+    }
+
+#if PYTHON_VERSION < 300
+    PyObject *module = Py_InitModule4(
+        "__nuitka_runtime_stats__",
+        _runtime_stats_methods,
+        NULL,
+        NULL,
+        PYTHON_API_VERSION
+    );
+#else
+    PyObject *module = PyModule_Create( &_runtime_stats_module_def );
+
+    if ( module != NULL )
+    {
+        PyDict_SetItemString( sys_modules, "__nuitka_runtime_stats__", module );
+        Py_DECREF( module );
+    }
+#endif
+
+    assert( module != NULL );
+}
+
+#endif
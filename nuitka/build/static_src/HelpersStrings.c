@@ -143,3 +143,75 @@ PyObject *BUILTIN_ORD( PyObject *value )
 
     return PyInt_FromLong( result );
 }
+
+// Common part of "str.startswith" and "str.endswith", for exact strings and
+// single string arguments only, others use the method.
+static PyObject *STR_TAILMATCH( PyObject *str, PyObject *substr, int direction, char const *method_name )
+{
+    CHECK_OBJECT( str );
+    CHECK_OBJECT( substr );
+
+#if PYTHON_VERSION < 300
+    if ( PyString_CheckExact( str ) && PyString_CheckExact( substr ) )
+    {
+        Py_ssize_t size = PyString_GET_SIZE( str );
+        Py_ssize_t sub_size = PyString_GET_SIZE( substr );
+
+        bool result = sub_size <= size && memcmp(
+            PyString_AS_STRING( str ) + ( direction > 0 ? size - sub_size : 0 ),
+            PyString_AS_STRING( substr ),
+            sub_size
+        ) == 0;
+
+        PyObject *value = BOOL_FROM( result );
+        Py_INCREF( value );
+        return value;
+    }
+#else
+    if ( PyUnicode_CheckExact( str ) && PyUnicode_CheckExact( substr ) )
+    {
+        Py_ssize_t result = PyUnicode_Tailmatch( str, substr, 0, PY_SSIZE_T_MAX, direction );
+
+        if (unlikely( result == -1 ))
+        {
+            return NULL;
+        }
+
+        PyObject *value = BOOL_FROM( result != 0 );
+        Py_INCREF( value );
+        return value;
+    }
+#endif
+
+    return PyObject_CallMethod( str, (char *)method_name, (char *)"(O)", substr );
+}
+
+PyObject *STR_METHOD_STARTSWITH( PyObject *str, PyObject *prefix )
+{
+    return STR_TAILMATCH( str, prefix, -1, "startswith" );
+}
+
+PyObject *STR_METHOD_ENDSWITH( PyObject *str, PyObject *suffix )
+{
+    return STR_TAILMATCH( str, suffix, 1, "endswith" );
+}
+
+PyObject *STR_METHOD_JOIN( PyObject *str, PyObject *iterable )
+{
+    CHECK_OBJECT( str );
+    CHECK_OBJECT( iterable );
+
+#if PYTHON_VERSION < 300
+    if ( PyString_CheckExact( str ) )
+    {
+        return _PyString_Join( str, iterable );
+    }
+#else
+    if ( PyUnicode_CheckExact( str ) )
+    {
+        return PyUnicode_Join( str, iterable );
+    }
+#endif
+
+    return PyObject_CallMethod( str, (char *)"join", (char *)"(O)", iterable );
+}
@@ -0,0 +1,93 @@
+//     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for writing the type feedback recorded by operations.
+ */
+
+#if _NUITKA_TYPE_FEEDBACK
+
+// The names of the kinds, as seen from Python code.
+static char const *type_feedback_kind_names[ NUITKA_TYPE_FEEDBACK_KIND_COUNT ] =
+{
+    "other",
+#if PYTHON_VERSION < 300
+    "int",
+    "long",
+    "float",
+    "str",
+    "unicode",
+#else
+    NULL, // There is no Python2 "int" type anymore.
+    "int",
+    "float",
+    "bytes",
+    "str",
+#endif
+    "list",
+    "tuple"
+};
+
+static struct Nuitka_TypeFeedbackSites *type_feedback_sites = NULL;
+
+static void writeTypeFeedback( void )
+{
+    FILE *feedback_file = fopen( TYPE_FEEDBACK_FILENAME, "a" );
+
+    if ( feedback_file == NULL )
+    {
+        perror( "Nuitka: Cannot write type feedback to " TYPE_FEEDBACK_FILENAME );
+        return;
+    }
+
+    for ( struct Nuitka_TypeFeedbackSites *current = type_feedback_sites; current != NULL; current = current->next )
+    {
+        for ( int i = 0; i < current->count; i++ )
+        {
+            struct Nuitka_TypeFeedbackSite *site = &current->sites[ i ];
+
+            for ( int kind = 0; kind < NUITKA_TYPE_FEEDBACK_KIND_COUNT; kind++ )
+            {
+                if ( site->counts[ kind ] != 0 )
+                {
+                    fprintf(
+                        feedback_file,
+                        "%s\t%s\t%lu\n",
+                        site->site_name,
+                        type_feedback_kind_names[ kind ],
+                        site->counts[ kind ]
+                    );
+                }
+            }
+        }
+    }
+
+    fclose( feedback_file );
+}
+
+void registerTypeFeedbackSites( struct Nuitka_TypeFeedbackSites *sites )
+{
+    if ( type_feedback_sites == NULL )
+    {
+        Py_AtExit( writeTypeFeedback );
+    }
+
+    sites->next = type_feedback_sites;
+    type_feedback_sites = sites;
+}
+
+#endif
@@ -383,9 +383,9 @@ void patchTypeComparison()
 
 #include "nuitka/freelists.h"
 
-#define MAX_TRACEBACK_FREE_LIST_COUNT 1000
 static PyTracebackObject *free_list_tracebacks = NULL;
 static int free_list_tracebacks_count = 0;
+NUITKA_DEFINE_FREE_LIST_STATS( free_list_tracebacks )
 
 // Create a traceback for a given frame, using a freelist hacked into the
 // existing type.
@@ -199,6 +199,8 @@ extern void _initCompiledAsyncgenTypes();
 unsigned char const* constant_bin = NULL;
 #endif
 
+extern void prefetchStartupData( void );
+
 
 #ifdef _NUITKA_WINMAIN_ENTRY_POINT
 int __stdcall WinMain( HINSTANCE hInstance, HINSTANCE hPrevInstance, char* lpCmdLine, int nCmdShow )
@@ -252,6 +254,9 @@ int main( int argc, char **argv )
     assert( constant_bin );
 #endif
 
+    /* Have the data read at startup paged in early, and in one go. */
+    NUITKA_PRINT_TRACE("main(): Calling prefetchStartupData().");
+    prefetchStartupData();
 
 #ifdef _NUITKA_STANDALONE
     NUITKA_PRINT_TRACE("main(): Prepare standalone environment.");
@@ -395,6 +400,11 @@ int main( int argc, char **argv )
     NUITKA_PRINT_TRACE("main(): Calling patchTracebackDealloc().");
     patchTracebackDealloc();
 
+#if _NUITKA_RUNTIME_STATS
+    NUITKA_PRINT_TRACE("main(): Calling registerRuntimeStatsModule().");
+    registerRuntimeStatsModule();
+#endif
+
     /* Allow to override the ticker value, to remove checks for threads in
      * CPython core from impact on benchmarks. */
     char const *ticker_value = getenv( "NUITKA_TICKER" );
@@ -608,7 +608,9 @@ static void loadTriggeredModule( char const *name, char const *trigger_name )
             PySys_WriteStderr( "Loading %s\n", trigger_module_name );
         }
 
+        startImportTimeTrace( trigger_module_name );
         entry->python_initfunc();
+        stopImportTimeTrace();
 
         if (unlikely( ERROR_OCCURRED() ))
         {
@@ -712,7 +714,9 @@ PyObject *IMPORT_EMBEDDED_MODULE( PyObject *module_name, char const *name )
 
     if ( entry != NULL )
     {
+        startImportTimeTrace( name );
         result = loadModule( module_name, entry );
+        stopImportTimeTrace();
 
         if ( result == NULL )
         {
@@ -722,7 +726,9 @@ PyObject *IMPORT_EMBEDDED_MODULE( PyObject *module_name, char const *name )
 
     if ( frozen_import )
     {
+        startImportTimeTrace( name );
         int res = PyImport_ImportFrozenModule( (char *)name );
+        stopImportTimeTrace();
 
         if (unlikely( res == -1 ))
         {
@@ -750,6 +756,251 @@ PyObject *IMPORT_EMBEDDED_MODULE( PyObject *module_name, char const *name )
     return Py_None;
 }
 
+extern PyObject *const_str_plain___import__;
+NUITKA_DECLARE_BUILTIN( __import__ );
+
+// Direct linking is only correct while "__import__" is not replaced.
+static bool isBuiltinImportOriginal( void )
+{
+    static PyObject *original_import = NULL;
+
+    NUITKA_ASSIGN_BUILTIN( __import__ );
+    PyObject *current_import = NUITKA_ACCESS_BUILTIN( __import__ );
+
+    if ( current_import == original_import )
+    {
+        return original_import != NULL;
+    }
+
+    if ( original_import == NULL && current_import != NULL && PyCFunction_Check( current_import ) &&
+         strcmp( ((PyCFunctionObject *)current_import)->m_ml->ml_name, "__import__" ) == 0 )
+    {
+        original_import = current_import;
+        return true;
+    }
+
+    return false;
+}
+
+#if PYTHON_VERSION < 300
+// Load a compiled module and its missing parent packages by their loader
+// entries. Returns false without an exception set, if one of them is not
+// known to the loader.
+static bool loadCompiledModuleDirect( PyObject *modules, char const *name )
+{
+    char buffer[ 2048 ];
+
+    if ( strlen( name ) >= sizeof( buffer ) )
+    {
+        return false;
+    }
+
+    strcpy( buffer, name );
+
+    PyObject *parent = NULL;
+    char *end = buffer;
+
+    for (;;)
+    {
+        char *dot = strchr( end, '.' );
+        char *child_name = end;
+
+        if ( dot != NULL )
+        {
+            *dot = 0;
+        }
+
+        PyObject *part_name = Nuitka_String_FromString( buffer );
+        PyObject *module = PyDict_GetItem( modules, part_name );
+
+        if ( module == NULL )
+        {
+            if ( findEntry( buffer ) == NULL )
+            {
+                Py_DECREF( part_name );
+                return false;
+            }
+
+            PyObject *result = IMPORT_EMBEDDED_MODULE( part_name, buffer );
+
+            if ( result == NULL )
+            {
+                Py_DECREF( part_name );
+                return false;
+            }
+
+            Py_DECREF( result );
+
+            module = PyDict_GetItem( modules, part_name );
+
+            // Like the import machinery does, make it an attribute of the
+            // parent package.
+            if ( module != NULL && parent != NULL )
+            {
+                int res = PyObject_SetAttrString( parent, child_name, module );
+
+                if (unlikely( res == -1 ))
+                {
+                    Py_DECREF( part_name );
+                    return false;
+                }
+            }
+        }
+
+        Py_DECREF( part_name );
+
+        // Removed or blocked by "None", leave that to the import machinery.
+        if ( module == NULL || module == Py_None )
+        {
+            return false;
+        }
+
+        if ( dot == NULL )
+        {
+            return true;
+        }
+
+        *dot = '.';
+        end = dot + 1;
+        parent = module;
+    }
+}
+#endif
+
+// The regular import, with the arguments as given at the import site.
+static PyObject *importModuleRegular( PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level )
+{
+    if ( level != NULL )
+    {
+        if ( globals != NULL && locals != NULL && import_items != NULL )
+        {
+            return IMPORT_MODULE5( module_name, globals, locals, import_items, level );
+        }
+    }
+    else if ( import_items != NULL )
+    {
+        if ( globals != NULL && locals != NULL )
+        {
+            return IMPORT_MODULE4( module_name, globals, locals, import_items );
+        }
+    }
+    else if ( locals != NULL )
+    {
+        if ( globals != NULL )
+        {
+            return IMPORT_MODULE3( module_name, globals, locals );
+        }
+    }
+    else if ( globals != NULL )
+    {
+        return IMPORT_MODULE2( module_name, globals );
+    }
+    else
+    {
+        return IMPORT_MODULE1( module_name );
+    }
+
+    return IMPORT_MODULE_KW( module_name, globals, locals, import_items, level );
+}
+
+// This is used for imports of compiled modules in the same binary, with
+// constant arguments, and caches per import site. The cache holds the
+// imported module and the result, and is used only while "sys.modules" has
+// these, otherwise the regular import is done.
+PyObject *IMPORT_COMPILED_MODULE( PyObject **cache, char const *name, PyObject *module_name, PyObject *top_module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level )
+{
+    PyObject *modules = PyImport_GetModuleDict();
+
+    bool direct = isBuiltinImportOriginal();
+
+    if ( direct && cache[0] != NULL &&
+         PyDict_GetItem( modules, module_name ) == cache[0] &&
+         ( top_module_name == NULL || PyDict_GetItem( modules, top_module_name ) == cache[1] ) )
+    {
+        Py_INCREF( cache[1] );
+        return cache[1];
+    }
+
+#if PYTHON_VERSION < 300
+    // Modules present, but not cached, might be incomplete, or something
+    // else was put there. Only absent modules are loaded directly, under the
+    // import lock, which the regular import also holds while the module code
+    // runs.
+    if ( direct && PyDict_GetItem( modules, module_name ) == NULL )
+    {
+#ifdef WITH_THREAD
+        _PyImport_AcquireLock();
+#endif
+
+        if ( PyDict_GetItem( modules, module_name ) == NULL )
+        {
+            direct = loadCompiledModuleDirect( modules, name );
+        }
+        else
+        {
+            direct = false;
+        }
+
+#ifdef WITH_THREAD
+        _PyImport_ReleaseLock();
+#endif
+
+        if (unlikely( ERROR_OCCURRED() ))
+        {
+            return NULL;
+        }
+    }
+    else
+    {
+        direct = false;
+    }
+#else
+    // The regular import uses per module locks, that are not held while the
+    // module code runs, and sets up "__spec__", "__loader__", and
+    // "__package__" before it. Without a cache hit, it is used, and only its
+    // result is cached.
+    direct = false;
+#endif
+
+    PyObject *result;
+
+    if ( direct )
+    {
+        result = PyDict_GetItem( modules, top_module_name != NULL ? top_module_name : module_name );
+
+        if (unlikely( result == NULL ))
+        {
+            return importModuleRegular( module_name, globals, locals, import_items, level );
+        }
+
+        Py_INCREF( result );
+    }
+    else
+    {
+        result = importModuleRegular( module_name, globals, locals, import_items, level );
+
+        if ( result == NULL )
+        {
+            return NULL;
+        }
+    }
+
+    PyObject *module = PyDict_GetItem( modules, module_name );
+
+    if ( module != NULL )
+    {
+        Py_XDECREF( cache[0] );
+        Py_XDECREF( cache[1] );
+
+        Py_INCREF( module );
+        cache[0] = module;
+        Py_INCREF( result );
+        cache[1] = result;
+    }
+
+    return result;
+}
+
 static PyObject *_path_unfreezer_load_module( PyObject *self, PyObject *args, PyObject *kwds )
 {
     PyObject *module_name;
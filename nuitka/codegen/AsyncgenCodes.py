@@ -21,6 +21,7 @@
 
 from .CodeHelpers import generateStatementSequenceCode
 from .Emission import SourceCodeCollector
+from .ErrorCodes import getSharedErrorExitsCode
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     setupFunctionLocalVariables
@@ -79,6 +80,8 @@ def getAsyncgenObjectCode(context, function_identifier, closure_variables,
     if needs_generator_return:
         generator_exit += template_asyncgen_return_exit % {}
 
+    generator_exit += getSharedErrorExitsCode(context)
+
     return template_asyncgen_object_body_template % {
         "function_identifier" : function_identifier,
         "function_body"       : indented(function_codes.codes),
@@ -21,6 +21,10 @@ Attribute lookup, setting.
 """
 
 from nuitka import Options
+from nuitka.optimizations.TypeFeedback import (
+    getAttributeSiteName,
+    isTypeFeedbackRecording
+)
 
 from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
 from .ErrorCodes import (
@@ -31,6 +35,7 @@ from .ErrorCodes import (
 )
 from .LabelCodes import getBranchingCode
 from .PythonAPICodes import generateCAPIObjectCode, generateCAPIObjectCode0
+from .TypeFeedbackCodes import getTypeFeedbackRecordCode
 
 
 def generateAssignmentAttributeCode(statement, emit, context):
@@ -137,6 +142,14 @@ def generateAttributeLookupCode(to_name, expression, emit, context):
         context        = context
     )
 
+    if isTypeFeedbackRecording():
+        getTypeFeedbackRecordCode(
+            site_name   = getAttributeSiteName(expression),
+            value_names = (to_name,),
+            emit        = emit,
+            context     = context
+        )
+
 
 def getAttributeLookupCode(to_name, source_name, attribute_name, needs_check,
                            emit, context):
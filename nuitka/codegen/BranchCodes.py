@@ -21,6 +21,7 @@
 
 from .CodeHelpers import generateStatementSequenceCode
 from .ConditionalCodes import generateConditionCode
+from .DictCodes import generateDictFetchedBranchCode
 from .LabelCodes import getGotoCode, getLabelCode
 
 
@@ -36,7 +37,7 @@ def generateBranchCode(statement, emit, context):
     context.setTrueBranchTarget(true_target)
     context.setFalseBranchTarget(false_target)
 
-    generateConditionCode(
+    fetched_name = generateConditionCode(
         condition = statement.getCondition(),
         emit      = emit,
         context   = context
@@ -47,11 +48,19 @@ def generateBranchCode(statement, emit, context):
 
     getLabelCode(true_target, emit)
 
-    generateStatementSequenceCode(
-        statement_sequence = statement.getBranchYes(),
-        emit               = emit,
-        context            = context
-    )
+    if fetched_name is not None:
+        generateDictFetchedBranchCode(
+            statement_sequence = statement.getBranchYes(),
+            fetched_name       = fetched_name,
+            emit               = emit,
+            context            = context
+        )
+    else:
+        generateStatementSequenceCode(
+            statement_sequence = statement.getBranchYes(),
+            emit               = emit,
+            context            = context
+        )
 
     if statement.getBranchNo() is not None:
         getGotoCode(end_target, emit)
@@ -151,6 +151,34 @@ def generateBuiltinSum1Code(to_name, expression, emit, context):
     )
 
 
+def generateBuiltinAnyCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_ANY",
+        arg_desc   = (
+            ("any_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinAllCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_ALL",
+        arg_desc   = (
+            ("all_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
 def generateBuiltinSum2Code(to_name, expression, emit, context):
     generateCAPIObjectCode(
         to_name    = to_name,
@@ -31,7 +31,8 @@ from .templates.CodeTemplatesCalls import (
     template_call_function_with_args_decl,
     template_call_function_with_args_impl,
     template_call_method_with_args_decl,
-    template_call_method_with_args_impl
+    template_call_method_with_args_impl,
+    template_call_star_args_helper
 )
 from .templates.CodeTemplatesModules import (
     template_header_guard,
@@ -656,6 +657,85 @@ def getCallCodePosKeywordArgs(to_name, called_name, call_args_name,
     context.addCleanupTempName(to_name)
 
 
+# The complex call helpers, see "nuitka.tree.ComplexCallHelperFunctions",
+# that only convert star arguments and check keywords before they call.
+_star_args_call_helper_names = frozenset(
+    (
+        "complex_call_helper_star_list",
+        "complex_call_helper_keywords_star_list",
+        "complex_call_helper_pos_star_list",
+        "complex_call_helper_pos_keywords_star_list",
+        "complex_call_helper_star_dict",
+        "complex_call_helper_pos_star_dict",
+        "complex_call_helper_keywords_star_dict",
+        "complex_call_helper_pos_keywords_star_dict",
+        "complex_call_helper_star_list_star_dict",
+        "complex_call_helper_pos_star_list_star_dict",
+        "complex_call_helper_keywords_star_list_star_dict",
+        "complex_call_helper_pos_keywords_star_list_star_dict",
+    )
+)
+
+
+def isStarArgsCallHelper(function_body):
+    return function_body.getParentModule().isInternalModule() and \
+           function_body.getFunctionName() in _star_args_call_helper_names
+
+
+def getStarArgsCallHelperCallCode(to_name, function_identifier,
+                                  parameter_names, arg_names, needs_check,
+                                  emit, context):
+    """ Call a complex call helper, with a fast path in C for simple values.
+
+    The complex call helpers convert star list and star dict arguments to
+    tuple and dict, and check for duplicate keywords, all in compiled Python
+    code. For exact tuple and dict values without duplicate keywords, none
+    of that is needed, and the call is done directly in C, otherwise the
+    helper gives the conversions and compatible error messages.
+    """
+
+    arg_values = dict(zip(parameter_names, arg_names))
+
+    emit(
+        template_call_star_args_helper % {
+            "to_name"             : to_name,
+            "function_identifier" : function_identifier,
+            "called"              : arg_values["called"],
+            "args"                : arg_values.get("args", "NULL"),
+            "kw"                  : arg_values.get("kw", "NULL"),
+            "star_list"           : arg_values.get("star_arg_list", "NULL"),
+            "star_dict"           : arg_values.get("star_arg_dict", "NULL"),
+            "arg_names"           : ", ".join(arg_names),
+            "release_args"        : "".join(
+                "\n    Py_DECREF( %s );" % arg_name
+                for arg_name in
+                arg_names
+                if context.needsCleanup(arg_name)
+            ),
+            "ref_args"            : "".join(
+                "\n    Py_INCREF( %s );" % arg_name
+                for arg_name in
+                arg_names
+                if not context.needsCleanup(arg_name)
+            )
+        }
+    )
+
+    # Arguments are consumed by either branch.
+    for arg_name in arg_names:
+        if context.needsCleanup(arg_name):
+            context.removeCleanupTempName(arg_name)
+
+    getErrorExitCode(
+        check_name  = to_name,
+        emit        = emit,
+        needs_check = needs_check,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def getCallsDecls():
     result = []
 
@@ -45,7 +45,9 @@ from .AttributeCodes import (
 )
 from .BranchCodes import generateBranchCode
 from .BuiltinCodes import (
+    generateBuiltinAllCode,
     generateBuiltinAnonymousRefCode,
+    generateBuiltinAnyCode,
     generateBuiltinBinCode,
     generateBuiltinBoolCode,
     generateBuiltinBytearray1Code,
@@ -105,8 +107,10 @@ from .DictCodes import (
     generateDictionaryCreationCode,
     generateDictOperationGetCode,
     generateDictOperationInCode,
+    generateDictOperationMethodGetCode,
     generateDictOperationRemoveCode,
     generateDictOperationSetCode,
+    generateDictOperationSetdefaultCode,
     generateDictOperationUpdateCode
 )
 from .EvalCodes import (
@@ -138,7 +142,8 @@ from .FunctionCodes import (
     generateFunctionOutlineCode,
     getExportScopeCode,
     getFunctionCode,
-    getFunctionDirectDecl
+    getFunctionDirectDecl,
+    getFunctionEntryPointDecl
 )
 from .GeneratorCodes import (
     generateMakeGeneratorObjectCode,
@@ -173,6 +178,7 @@ from .ListCodes import (
     generateBuiltinListCode,
     generateListCreationCode,
     generateListOperationAppendCode,
+    generateListOperationAppendExpressionCode,
     generateListOperationExtendCode,
     generateListOperationPopCode
 )
@@ -207,6 +213,7 @@ from .SetCodes import (
     generateSetCreationCode,
     generateSetLiteralCreationCode,
     generateSetOperationAddCode,
+    generateSetOperationAddExpressionCode,
     generateSetOperationUpdateCode
 )
 from .SliceCodes import (
@@ -223,6 +230,7 @@ from .StringCodes import (
     generateBuiltinOrdCode,
     generateBuiltinStrCode,
     generateBuiltinUnicodeCode,
+    generateStrOperationCode,
     generateStringContenationCode
 )
 from .SubscriptCodes import (
@@ -414,6 +422,9 @@ def prepareModuleCode(global_context, module, module_name):
     function_decl_codes = []
     function_body_codes = []
 
+    # Only needed when the function makers are not in the same file.
+    function_entry_decl_codes = []
+
     for function_body in module.getUsedFunctions():
         function_code, function_context = generateFunctionBodyCode(
             function_body = function_body,
@@ -432,7 +443,12 @@ def prepareModuleCode(global_context, module, module_name):
 
         if function_decl is not None:
             function_decl_codes.append(function_decl)
-
+        elif function_body.needsCreation():
+            function_entry_decl_codes.append(
+                getFunctionEntryPointDecl(
+                    function_identifier = function_body.getCodeName()
+                )
+            )
 
     # These are for functions used from other modules. Due to cyclic
     # dependencies, we cannot rely on those to be already created.
@@ -459,35 +475,37 @@ def prepareModuleCode(global_context, module, module_name):
     for _identifier, code in sorted(iterItems(context.getDeclarations())):
         function_decl_codes.append(code)
 
-    function_body_codes = "\n\n".join(function_body_codes)
     function_decl_codes = "\n\n".join(function_decl_codes)
+    function_entry_decl_codes = "\n".join(function_entry_decl_codes)
 
     template_values = getModuleValues(
-        module_name         = module_name,
-        module_identifier   = module.getCodeName(),
-        codes               = codes.codes,
-        function_decl_codes = function_decl_codes,
-        function_body_codes = function_body_codes,
-        temp_variables      = module.getTempVariables(),
-        is_main_module      = module.isMainModule(),
-        is_internal_module  = module.isInternalModule(),
-        context             = context
+        module_name               = module_name,
+        module_identifier         = module.getCodeName(),
+        codes                     = codes.codes,
+        function_decl_codes       = function_decl_codes,
+        function_entry_decl_codes = function_entry_decl_codes,
+        function_body_codes       = function_body_codes,
+        temp_variables            = module.getTempVariables(),
+        is_main_module            = module.isMainModule(),
+        is_internal_module        = module.isInternalModule(),
+        context                   = context
     )
 
     return template_values, context
 
 
-def generateModuleCode(module_context, template_values):
+def generateModuleCode(module_context, template_values, header_filename):
     return getModuleCode(
         module_context  = module_context,
-        template_values = template_values
+        template_values = template_values,
+        header_filename = header_filename
     )
 
 
-def generateHelpersCode(other_modules):
+def generateHelpersCode(other_modules, startup_modules):
     calls_decl_code = getCallsDecls()
 
-    loader_code = getMetapathLoaderBodyCode(other_modules)
+    loader_code = getMetapathLoaderBodyCode(other_modules, startup_modules)
 
     calls_body_code = getCallsCode()
 
@@ -515,6 +533,8 @@ setExpressionDispatchDict(
         "EXPRESSION_BUILTIN_NEXT2"                  : generateBuiltinNext2Code,
         "EXPRESSION_BUILTIN_SUM1"                   : generateBuiltinSum1Code,
         "EXPRESSION_BUILTIN_SUM2"                   : generateBuiltinSum2Code,
+        "EXPRESSION_BUILTIN_ANY"                    : generateBuiltinAnyCode,
+        "EXPRESSION_BUILTIN_ALL"                    : generateBuiltinAllCode,
         "EXPRESSION_BUILTIN_TYPE1"                  : generateBuiltinType1Code,
         "EXPRESSION_BUILTIN_TYPE3"                  : generateBuiltinType3Code,
         "EXPRESSION_BUILTIN_IMPORT"                 : generateBuiltinImportCode,
@@ -604,12 +624,15 @@ setExpressionDispatchDict(
         "EXPRESSION_COMPARISON_NOT_IN"              : generateComparisonExpressionCode,
         "EXPRESSION_COMPARISON_EXCEPTION_MATCH"     : generateComparisonExpressionCode,
         "EXPRESSION_DICT_OPERATION_GET"             : generateDictOperationGetCode,
+        "EXPRESSION_DICT_OPERATION_METHOD_GET"      : generateDictOperationMethodGetCode,
+        "EXPRESSION_DICT_OPERATION_SETDEFAULT"      : generateDictOperationSetdefaultCode,
         "EXPRESSION_DICT_OPERATION_IN"              : generateDictOperationInCode,
         "EXPRESSION_DICT_OPERATION_NOT_IN"          : generateDictOperationInCode,
         "EXPRESSION_FUNCTION_CREATION"              : generateFunctionCreationCode,
         "EXPRESSION_FUNCTION_CALL"                  : generateFunctionCallCode,
         "EXPRESSION_IMPORT_MODULE_HARD"             : generateImportModuleHardCode,
         "EXPRESSION_IMPORT_NAME"                    : generateImportNameCode,
+        "EXPRESSION_LIST_OPERATION_APPEND"          : generateListOperationAppendExpressionCode,
         "EXPRESSION_LIST_OPERATION_EXTEND"          : generateListOperationExtendCode,
         "EXPRESSION_LIST_OPERATION_POP"             : generateListOperationPopCode,
         "EXPRESSION_MODULE_FILE_ATTRIBUTE_REF"      : generateModuleFileAttributeCode,
@@ -634,8 +657,12 @@ setExpressionDispatchDict(
         "EXPRESSION_SUBSCRIPT_LOOKUP"               : generateSubscriptLookupCode,
         "EXPRESSION_SLICE_LOOKUP"                   : generateSliceLookupCode,
         "EXPRESSION_SET_OPERATION_UPDATE"           : generateSetOperationUpdateCode,
+        "EXPRESSION_SET_OPERATION_ADD"              : generateSetOperationAddExpressionCode,
         "EXPRESSION_SIDE_EFFECTS"                   : generateSideEffectsCode,
         "EXPRESSION_SPECIAL_UNPACK"                 : generateSpecialUnpackCode,
+        "EXPRESSION_STR_OPERATION_STARTSWITH"       : generateStrOperationCode,
+        "EXPRESSION_STR_OPERATION_ENDSWITH"         : generateStrOperationCode,
+        "EXPRESSION_STR_OPERATION_JOIN"             : generateStrOperationCode,
         "EXPRESSION_TEMP_VARIABLE_REF"              : generateVariableReferenceCode,
         "EXPRESSION_VARIABLE_REF"                   : generateVariableReferenceCode,
         "EXPRESSION_YIELD"                          : generateYieldCode,
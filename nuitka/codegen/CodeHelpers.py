@@ -193,26 +193,30 @@ def generateStatementCode(statement, emit, context):
         raise
 
 
-def _generateStatementSequenceCode(statement_sequence, emit, context):
-    if statement_sequence is None:
-        return
+def generateStatementTraceCode(statement, emit):
+    source_ref = statement.getSourceReference()
 
-    for statement in statement_sequence.getStatements():
-        if shallTraceExecution():
-            source_ref = statement.getSourceReference()
+    statement_repr = repr(statement)
+    source_repr = source_ref.getAsString()
 
-            statement_repr = repr(statement)
-            source_repr = source_ref.getAsString()
+    if python_version >= 300:
+        statement_repr = statement_repr.encode("utf8")
+        source_repr = source_repr.encode("utf8")
+
+    emit(
+        getStatementTrace(
+            source_repr,
+            statement_repr
+        )
+    )
 
-            if python_version >= 300:
-                statement_repr = statement_repr.encode("utf8")
-                source_repr = source_repr.encode("utf8")
 
-            emit(
-                getStatementTrace(
-                    source_repr,
-                    statement_repr
-                )
+def generateStatementsCode(statements, emit, context):
+    for statement in statements:
+        if shallTraceExecution():
+            generateStatementTraceCode(
+                statement = statement,
+                emit      = emit
             )
 
         # Might contain frame statement sequences as children.
@@ -232,6 +236,17 @@ def _generateStatementSequenceCode(statement_sequence, emit, context):
             )
 
 
+def _generateStatementSequenceCode(statement_sequence, emit, context):
+    if statement_sequence is None:
+        return
+
+    generateStatementsCode(
+        statements = statement_sequence.getStatements(),
+        emit       = emit,
+        context    = context
+    )
+
+
 def generateStatementSequenceCode(statement_sequence, emit, context,
                                   allow_none = False):
 
@@ -25,14 +25,30 @@ import os
 from nuitka import Options
 from nuitka.PythonVersions import python_version
 
+from .templates.CodeTemplatesModules import (
+    template_lazy_code_object,
+    template_lazy_code_object_decl
+)
+
 
 def getCodeObjectsDeclCode(context):
     statements = []
 
-    for _code_object_key, code_identifier in context.getCodeObjects():
-        declaration = "static PyCodeObject *%s;" % code_identifier
+    for code_object_key, code_identifier in context.getCodeObjects():
+        if Options.shallUseLazyModuleInit():
+            statements.append(
+                template_lazy_code_object % {
+                    "code_identifier" : code_identifier,
+                    "code_creation"   : _getCodeObjectCreationCode(
+                        code_object_key = code_object_key,
+                        context         = context
+                    )
+                }
+            )
+        else:
+            declaration = "NUITKA_LOCAL_MODULE PyCodeObject *%s;" % code_identifier
 
-        statements.append(declaration)
+            statements.append(declaration)
 
     if context.getOwner().getFullName() == "__main__":
         statements.append('/* For use in "MainProgram.c". */')
@@ -40,11 +56,26 @@ def getCodeObjectsDeclCode(context):
 
     return statements
 
-def getCodeObjectsInitCode(context):
-    # There is a bit of details to this, code objects have many flags to deal
-    # with, and we are making some optimizations as well as customization to
-    # what path should be put there, pylint: disable=too-many-branches
 
+def getCodeObjectsExternDeclCode(context):
+    """ Declarations of the code objects for the other files of the module. """
+
+    statements = []
+
+    for _code_object_key, code_identifier in context.getCodeObjects():
+        if Options.shallUseLazyModuleInit():
+            statements.append(
+                template_lazy_code_object_decl % {
+                    "code_identifier" : code_identifier
+                }
+            )
+        else:
+            statements.append("extern PyCodeObject *%s;" % code_identifier)
+
+    return statements
+
+
+def getCodeObjectsInitCode(context):
     statements = []
 
     code_objects = context.getCodeObjects()
@@ -52,7 +83,6 @@ def getCodeObjectsInitCode(context):
     # Create the always identical, but dynamic filename first thing.
     if code_objects:
         context.markAsNeedsModuleFilenameObject()
-        filename_code = "module_filename_obj"
 
     if context.needsModuleFilenameObject():
         module_filename = context.getOwner().getRunTimeFilename()
@@ -74,72 +104,86 @@ def getCodeObjectsInitCode(context):
         )
 
     for code_object_key, code_identifier in code_objects:
-        co_flags = []
-
         # Make sure the filename is always identical.
         assert code_object_key[0] == module_filename
 
-        if code_object_key[6] in ("Module", "Class", "Function"):
-            pass
-        elif code_object_key[6] == "Generator":
-            co_flags.append("CO_GENERATOR")
-        elif code_object_key[6] == "Coroutine":
-            co_flags.append("CO_COROUTINE")
-        elif code_object_key[6] == "Asyncgen":
-            co_flags.append("CO_ASYNC_GENERATOR")
-        else:
-            assert False, code_object_key[6]
-
-        if code_object_key[7]:
-            co_flags.append("CO_OPTIMIZED")
-
-        if code_object_key[8]:
-            co_flags.append("CO_NEWLOCALS")
-
-        if code_object_key[9]:
-            co_flags.append("CO_VARARGS")
-
-        if code_object_key[10]:
-            co_flags.append("CO_VARKEYWORDS")
-
-        if not code_object_key[11]:
-            co_flags.append("CO_NOFREE")
-
-        co_flags.extend(code_object_key[12])
-
-        if python_version < 300:
-            code = "%s = MAKE_CODEOBJ( %s, %s, %d, %s, %d, %s );" % (
-                code_identifier,
-                filename_code,
-                context.getConstantCode(
-                    constant = code_object_key[1]
-                ),
-                code_object_key[2],
-                context.getConstantCode(
-                    constant = code_object_key[3]
-                ),
-                code_object_key[4],
-                " | ".join(co_flags) or '0',
-            )
-        else:
-            code = "%s = MAKE_CODEOBJ( %s, %s, %d, %s, %d, %d, %s );" % (
-                code_identifier,
-                filename_code,
-                context.getConstantCode(
-                    constant = code_object_key[1]
-                ),
-                code_object_key[2],
-                context.getConstantCode(
-                    constant = code_object_key[3]
-                ),
-                code_object_key[4],
-                code_object_key[5],
-                " | ".join(co_flags) or  '0',
+        # With lazy module init, code objects are created on first use.
+        if not Options.shallUseLazyModuleInit():
+            statements.append(
+                "%s = %s;" % (
+                    code_identifier,
+                    _getCodeObjectCreationCode(
+                        code_object_key = code_object_key,
+                        context         = context
+                    )
+                )
             )
 
-        statements.append(code)
-
         if context.getOwner().getFullName() == "__main__":
             if code_object_key[1] == "<module>":
                 statements.append("codeobj_main = %s;" % code_identifier)
+
     return statements
+
+
+def _getCodeObjectCreationCode(code_object_key, context):
+    # There is a bit of details to this, code objects have many flags to deal
+    # with, pylint: disable=too-many-branches
+
+    co_flags = []
+
+    if code_object_key[6] in ("Module", "Class", "Function"):
+        pass
+    elif code_object_key[6] == "Generator":
+        co_flags.append("CO_GENERATOR")
+    elif code_object_key[6] == "Coroutine":
+        co_flags.append("CO_COROUTINE")
+    elif code_object_key[6] == "Asyncgen":
+        co_flags.append("CO_ASYNC_GENERATOR")
+    else:
+        assert False, code_object_key[6]
+
+    if code_object_key[7]:
+        co_flags.append("CO_OPTIMIZED")
+
+    if code_object_key[8]:
+        co_flags.append("CO_NEWLOCALS")
+
+    if code_object_key[9]:
+        co_flags.append("CO_VARARGS")
+
+    if code_object_key[10]:
+        co_flags.append("CO_VARKEYWORDS")
+
+    if not code_object_key[11]:
+        co_flags.append("CO_NOFREE")
+
+    co_flags.extend(code_object_key[12])
+
+    if python_version < 300:
+        return "MAKE_CODEOBJ( %s, %s, %d, %s, %d, %s )" % (
+            "module_filename_obj",
+            context.getConstantCode(
+                constant = code_object_key[1]
+            ),
+            code_object_key[2],
+            context.getConstantCode(
+                constant = code_object_key[3]
+            ),
+            code_object_key[4],
+            " | ".join(co_flags) or '0',
+        )
+    else:
+        return "MAKE_CODEOBJ( %s, %s, %d, %s, %d, %d, %s )" % (
+            "module_filename_obj",
+            context.getConstantCode(
+                constant = code_object_key[1]
+            ),
+            code_object_key[2],
+            context.getConstantCode(
+                constant = code_object_key[3]
+            ),
+            code_object_key[4],
+            code_object_key[5],
+            " | ".join(co_flags) or  '0',
+        )
@@ -28,6 +28,7 @@ from .ComparisonCodes import (
     getBuiltinIsinstanceBoolCode,
     getComparisonExpressionBoolCode
 )
+from .DictCodes import generateDictOperationInConditionCode
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitBoolCode, getReleaseCode
 from .LabelCodes import getBranchingCode, getGotoCode, getLabelCode
@@ -37,6 +38,9 @@ def generateConditionCode(condition, emit, context):
     # The complexity is needed to avoid unnecessary complex generated C
     # pylint: disable=too-many-locals,too-many-statements
 
+    # Returns the name of a value looked up by an "in" check, for the "yes"
+    # branch to use, or None.
+
     if condition.isExpressionComparison():
         left_name = context.allocateTempName("compare_left")
 
@@ -186,6 +190,19 @@ def generateConditionCode(condition, emit, context):
         )
 
         context.setCurrentSourceCodeReference(old_source_ref)
+    elif condition.isExpressionDictOperationIn() or \
+         condition.isExpressionDictOperationNOTIn():
+        old_source_ref = context.setCurrentSourceCodeReference(condition.getSourceReference())
+
+        fetched_name = generateDictOperationInConditionCode(
+            condition = condition,
+            emit      = emit,
+            context   = context
+        )
+
+        context.setCurrentSourceCodeReference(old_source_ref)
+
+        return fetched_name
     elif condition.isCompileTimeConstant():
         getBranchingCode(
             condition = '1' if condition.getCompileTimeConstant() else '0',
@@ -227,6 +244,8 @@ def generateConditionCode(condition, emit, context):
             context   = context
         )
 
+    return None
+
 
 def getConditionCheckTrueCode(to_name, value_name, needs_check, emit, context):
     emit(
@@ -47,12 +47,27 @@ from nuitka.PythonVersions import python_version
 from .BlobCodes import StreamData
 from .Emission import SourceCodeCollector
 from .Indentation import indented
-from .templates.CodeTemplatesConstants import template_constants_reading
+from .templates.CodeTemplatesConstants import (
+    template_constants_reading,
+    template_lazy_constant_guard,
+    template_lazy_module_constants
+)
 
 
 def generateConstantReferenceCode(to_name, expression, emit, context):
     """ Assign the constant behind the expression to to_name."""
 
+    # Mutable constants, that do not escape, need no copy.
+    if expression.isNonEscaping():
+        emit(
+            "%s = %s;" % (
+                to_name,
+                context.getConstantCode(expression.getConstant())
+            )
+        )
+
+        return
+
     getConstantAccess(
         to_name  = to_name,
         constant = expression.getConstant(),
@@ -314,6 +329,57 @@ def _addConstantInitCode(context, emit, check, constant_type, constant_value,
     if constant_identifier in done:
         return
 
+    # With lazy module init, shared constants are created by the first module
+    # using them, so the others must not create them again.
+    if not module_level and _isLazyConstant(context, constant_identifier):
+        lazy_emit = SourceCodeCollector()
+        lazy_check = SourceCodeCollector()
+
+        _addUnguardedConstantInitCode(
+            context             = context,
+            emit                = lazy_emit,
+            check               = lazy_check,
+            constant_type       = constant_type,
+            constant_value      = constant_value,
+            constant_identifier = constant_identifier,
+            module_level        = module_level
+        )
+
+        if lazy_emit.codes:
+            emit(
+                template_lazy_constant_guard % {
+                    "condition" : "%s == NULL" % constant_identifier,
+                    "codes"     : indented(lazy_emit.codes)
+                }
+            )
+
+        if lazy_check.codes:
+            check(
+                template_lazy_constant_guard % {
+                    "condition" : "%s != NULL" % constant_identifier,
+                    "codes"     : indented(lazy_check.codes)
+                }
+            )
+    else:
+        _addUnguardedConstantInitCode(
+            context             = context,
+            emit                = emit,
+            check               = check,
+            constant_type       = constant_type,
+            constant_value      = constant_value,
+            constant_identifier = constant_identifier,
+            module_level        = module_level
+        )
+
+
+def _isLazyConstant(context, constant_identifier):
+    return Options.shallUseLazyModuleInit() and \
+           not context.isEagerConstant(constant_identifier)
+
+
+def _addUnguardedConstantInitCode(context, emit, check, constant_type,
+                                  constant_value, constant_identifier,
+                                  module_level):
     if Options.shallTraceExecution():
         emit("""NUITKA_PRINT_TRACE("Creating constant: %s");""" % constant_identifier)
 
@@ -850,6 +916,10 @@ def getConstantsInitCode(context):
     )
 
     for constant_identifier, constant_value in sorted_constants:
+        # Lazy constants are created by the modules using them.
+        if _isLazyConstant(context, constant_identifier):
+            continue
+
         _addConstantInitCode(
             emit                = emit,
             check               = check,
@@ -860,9 +930,77 @@ def getConstantsInitCode(context):
             context             = context
         )
 
+    if Options.shallUseLazyModuleInit():
+        # Only the checks are global for lazy constants, the creation code is
+        # thrown away here and done per module.
+        eager_done = set(done)
+
+        for constant_identifier, constant_value in sorted_constants:
+            if context.getConstantUseCount(constant_identifier) == 1:
+                continue
+
+            _addConstantInitCode(
+                emit                = SourceCodeCollector(),
+                check               = check,
+                constant_type       = type(constant_value),
+                constant_value      = constant_value,
+                constant_identifier = constant_identifier,
+                module_level        = False,
+                context             = context
+            )
+
+        done.clear()
+        done.update(eager_done)
+
     return emit.codes, check.codes
 
 
+def getLazyModuleConstantsInitCode(context, module_context):
+    """ Create the code to create shared constants used by a module.
+
+        For lazy module init, shared constants are not created at startup,
+        but when the first module using them is imported. Every using module
+        has a function doing that, each constant guarded against repeats.
+    """
+
+    emit = SourceCodeCollector()
+
+    # Constants created by other modules are still to be created here.
+    eager_done = set(done)
+
+    sorted_constants = sorted(
+        module_context.getConstants(),
+        key = lambda k: (len(k[0]), k[0])
+    )
+
+    for constant_identifier in sorted_constants:
+        if not constant_identifier.startswith("const_"):
+            continue
+
+        if context.getConstantUseCount(constant_identifier) == 1:
+            continue
+
+        constant_value = context.constants[constant_identifier]
+
+        _addConstantInitCode(
+            emit                = emit,
+            check               = SourceCodeCollector(),
+            constant_type       = type(constant_value),
+            constant_value      = constant_value,
+            constant_identifier = constant_identifier,
+            module_level        = False,
+            context             = context
+        )
+
+    done.clear()
+    done.update(eager_done)
+
+    return template_lazy_module_constants % {
+        "module_identifier" : module_context.getModuleCodeName(),
+        "constant_inits"    : indented(emit.codes)
+    }
+
+
 def getConstantsDeclCode(context):
     statements = []
 
@@ -1005,12 +1143,26 @@ def getConstantInitCodes(module_context):
 
     global_context = module_context.global_context
 
+    # Shared constants are created on first use with lazy module init.
+    if Options.shallUseLazyModuleInit():
+        decls.append(
+            "extern void createModuleSharedConstants_%s( void );" % (
+                module_context.getModuleCodeName()
+            )
+        )
+
+        inits.emit(
+            "createModuleSharedConstants_%s();" % (
+                module_context.getModuleCodeName()
+            )
+        )
+
     for constant_identifier in sorted_constants:
         if not constant_identifier.startswith("const_"):
             continue
 
         if global_context.getConstantUseCount(constant_identifier) == 1:
-            qualifier = "static"
+            qualifier = "NUITKA_LOCAL_MODULE"
 
             constant_value = global_context.constants[constant_identifier]
 
@@ -1099,7 +1251,7 @@ def allocateNestedConstants(module_context):
             considerForDeferral(constant_value)
 
 
-def getConstantsDefinitionCode(context):
+def getConstantsDefinitionCode(context, module_contexts):
     """ Create the code code "__constants.c" file.
 
         This needs to create code to make all global constants (used in more
@@ -1110,6 +1262,21 @@ def getConstantsDefinitionCode(context):
         context = context
     )
 
+    if Options.shallUseLazyModuleInit():
+        module_constant_inits = [
+            getLazyModuleConstantsInitCode(
+                context        = context,
+                module_context = module_context
+            )
+            for module_context in
+            sorted(
+                module_contexts,
+                key = lambda module_context: module_context.getModuleCodeName()
+            )
+        ]
+    else:
+        module_constant_inits = []
+
     constant_declarations = getConstantsDeclCode(
         context = context
     )
@@ -1123,5 +1290,6 @@ def getConstantsDefinitionCode(context):
         "constant_declarations" : '\n'.join(constant_declarations),
         "constant_inits"        : indented(constant_inits),
         "constant_checks"       : indented(constant_checks),
-        "sys_executable"        : sys_executable
+        "sys_executable"        : sys_executable,
+        "module_constant_inits" : '\n'.join(module_constant_inits)
     }
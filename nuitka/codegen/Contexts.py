@@ -59,6 +59,10 @@ class TempMixin(object):
 
         self.cleanup_names = []
 
+        # Error exits shared by checks with the same release code and target.
+        self.shared_error_exits = {}
+        self.shared_error_exit_codes = []
+
         self.current_source_ref = None
         self.last_source_ref = None
 
@@ -234,6 +238,22 @@ class TempMixin(object):
         assert count != 0
         self.preserver_variable_counts.add(count)
 
+    def getSharedErrorExitLabel(self, exit_code):
+        label = self.shared_error_exits.get(exit_code)
+
+        if label is None:
+            label = self.allocateLabel("error_exit")
+
+            self.shared_error_exits[exit_code] = label
+            self.shared_error_exit_codes.append(
+                (label, exit_code)
+            )
+
+        return label
+
+    def getSharedErrorExitCodes(self):
+        return self.shared_error_exit_codes
+
     def getTrueBranchTarget(self):
         return self.true_target
 
@@ -347,6 +367,9 @@ class PythonChildContextBase(PythonContextBase):
     def addDeclaration(self, key, code):
         self.parent.addDeclaration(key, code)
 
+    def addTypeFeedbackSite(self, site_name):
+        return self.parent.addTypeFeedbackSite(site_name)
+
     def pushFrameVariables(self, frame_variables):
         return self.parent.pushFrameVariables(frame_variables)
 
@@ -534,6 +557,10 @@ class PythonGlobalContext(object):
         self.constants = {}
         self.constant_use_count = {}
 
+        # Constants that must be created before any module code runs, because
+        # they are used by helper code, even with lazy module init.
+        self.eager_constants = set()
+
         for constant in _getConstantDefaultPopulation():
             code = self.getConstantCode(constant)
 
@@ -541,6 +568,8 @@ class PythonGlobalContext(object):
             self.countConstantUse(code)
             self.countConstantUse(code)
 
+            self.markConstantEager(code)
+
         self.needs_exception_variables = False
 
     def getConstantCode(self, constant):
@@ -604,6 +633,12 @@ class PythonGlobalContext(object):
     def getConstantUseCount(self, constant):
         return self.constant_use_count[constant]
 
+    def markConstantEager(self, constant):
+        self.eager_constants.add(constant)
+
+    def isEagerConstant(self, constant):
+        return constant in self.eager_constants
+
     def getConstants(self):
         return self.constants
 
@@ -725,6 +760,9 @@ class PythonModuleContext(PythonContextBase, TempMixin, CodeObjectsMixin,
 
         self.needs_module_filename_object = False
 
+        self.type_feedback_sites = []
+        self.type_feedback_site_indexes = {}
+
     def __repr__(self):
         return "<PythonModuleContext instance for module %s>" % self.filename
 
@@ -820,6 +858,22 @@ class PythonModuleContext(PythonContextBase, TempMixin, CodeObjectsMixin,
     def needsModuleFilenameObject(self):
         return self.needs_module_filename_object
 
+    def addTypeFeedbackSite(self, site_name):
+        """ Add a site for type feedback, return its index.
+
+            Code that is about the same site, e.g. the assignments of one
+            variable, shares the index and so records into the same counts.
+        """
+        if site_name not in self.type_feedback_site_indexes:
+            self.type_feedback_site_indexes[site_name] = \
+              len(self.type_feedback_sites)
+            self.type_feedback_sites.append(site_name)
+
+        return self.type_feedback_site_indexes[site_name]
+
+    def getTypeFeedbackSites(self):
+        return self.type_feedback_sites
+
 
 class PythonFunctionContext(FrameDeclarationsMixin, PythonChildContextBase, TempMixin):
     def __init__(self, parent, function):
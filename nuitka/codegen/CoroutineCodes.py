@@ -24,7 +24,11 @@ from .CodeHelpers import (
     generateStatementSequenceCode
 )
 from .Emission import SourceCodeCollector
-from .ErrorCodes import getErrorExitCode, getReleaseCode
+from .ErrorCodes import (
+    getErrorExitCode,
+    getReleaseCode,
+    getSharedErrorExitsCode
+)
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     setupFunctionLocalVariables
@@ -85,6 +89,8 @@ def getCoroutineObjectCode(context, function_identifier, closure_variables,
     if needs_generator_return:
         generator_exit += template_coroutine_return_exit % {}
 
+    generator_exit += getSharedErrorExitsCode(context)
+
     return template_coroutine_object_body_template % {
         "function_identifier" : function_identifier,
         "function_body"       : indented(function_codes.codes),
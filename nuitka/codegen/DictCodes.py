@@ -22,8 +22,17 @@
 from nuitka import Options
 from nuitka.PythonVersions import python_version
 
-from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
+from .CodeHelpers import (
+    generateChildExpressionsCode,
+    generateExpressionCode,
+    generateStatementsCode,
+    generateStatementTraceCode
+)
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
+from .ExceptionCodes import getExceptionUnpublishedReleaseCode
+from .LabelCodes import getBranchingCode, getGotoCode
+from .PythonAPICodes import generateCAPIObjectCode
+from .VariableCodes import getVariableAssignmentCode
 
 
 def generateBuiltinDictCode(to_name, expression, emit, context):
@@ -242,6 +251,132 @@ def generateDictOperationGetCode(to_name, expression, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def generateDictFetchedBranchCode(statement_sequence, fetched_name, emit,
+                                  context):
+    """ Code for the branch of an "in" check that uses the value looked up.
+
+    The first statement assigns or returns the value that the check fetched
+    already, see "generateDictOperationInConditionCode", so the look-up of
+    it is not repeated.
+    """
+    context.pushCleanupScope()
+
+    statements = statement_sequence.getStatements()
+    statement = statements[0]
+
+    if Options.shallTraceExecution():
+        generateStatementTraceCode(
+            statement = statement,
+            emit      = emit
+        )
+
+    if statement.isStatementAssignmentVariable():
+        assert statement.getAssignSource().isExpressionDictOperationGetFetched()
+
+        value_name = context.allocateTempName("assign_source")
+
+        getDictFetchedValueCode(
+            to_name      = value_name,
+            fetched_name = fetched_name,
+            emit         = emit,
+            context      = context
+        )
+
+        getVariableAssignmentCode(
+            tmp_name      = value_name,
+            variable      = statement.getVariable(),
+            version       = statement.getVariableVersion(),
+            needs_release = statement.needsReleasePreviousValue(),
+            in_place      = statement.inplace_suspect,
+            emit          = emit,
+            context       = context
+        )
+
+        # Ownership of that reference must have been transfered.
+        assert not context.needsCleanup(value_name)
+    else:
+        assert statement.isStatementReturn(), statement
+        assert statement.getExpression().isExpressionDictOperationGetFetched()
+
+        getExceptionUnpublishedReleaseCode(emit, context)
+
+        value_name = context.getReturnValueName()
+
+        if context.getReturnReleaseMode():
+            emit("Py_DECREF( %s );" % value_name)
+
+        getDictFetchedValueCode(
+            to_name      = value_name,
+            fetched_name = fetched_name,
+            emit         = emit,
+            context      = context
+        )
+
+        context.removeCleanupTempName(value_name)
+
+        getGotoCode(
+            label = context.getReturnTarget(),
+            emit  = emit
+        )
+
+    generateStatementsCode(
+        statements = statements[1:],
+        emit       = emit,
+        context    = context
+    )
+
+    context.popCleanupScope()
+
+
+def getDictFetchedValueCode(to_name, fetched_name, emit, context):
+    # The dictionary and key were checked by the condition already, and they
+    # are variable references without side effects.
+    emit(
+        "%s = %s;" % (
+            to_name,
+            fetched_name
+        )
+    )
+    emit("CHECK_OBJECT( %s );" % to_name)
+    emit("Py_INCREF( %s );" % to_name)
+
+    context.addCleanupTempName(to_name)
+
+
+def generateDictOperationMethodGetCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "DICT_METHOD_GET",
+        arg_desc   = (
+            ("dict_arg", expression.getDict()),
+            ("get_key", expression.getKey()),
+            ("get_default", expression.getDefault()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context,
+        none_null  = True
+    )
+
+
+def generateDictOperationSetdefaultCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "DICT_METHOD_SETDEFAULT",
+        arg_desc   = (
+            ("dict_arg", expression.getDict()),
+            ("setdefault_key", expression.getKey()),
+            ("setdefault_default", expression.getDefault()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context,
+        none_null  = True
+    )
+
+
 def generateDictOperationInCode(to_name, expression, emit, context):
     inverted = expression.isExpressionDictOperationNOTIn()
 
@@ -284,6 +419,85 @@ def generateDictOperationInCode(to_name, expression, emit, context):
     )
 
 
+def generateDictOperationInConditionCode(condition, emit, context):
+    inverted = condition.isExpressionDictOperationNOTIn()
+
+    key_name, dict_name = generateChildExpressionsCode(
+        expression = condition,
+        emit       = emit,
+        context    = context
+    )
+
+    if not inverted and condition.isValueFetched():
+        # Look-up the value, so the following code can use it.
+        fetched_name = context.allocateTempName("dict_fetched_value")
+
+        emit(
+            "%s = DICT_GET_ITEM_WITH_ERROR( %s, %s );" % (
+                fetched_name,
+                dict_name,
+                key_name
+            )
+        )
+
+        getReleaseCodes(
+            release_names = (dict_name, key_name),
+            emit          = emit,
+            context       = context
+        )
+
+        getErrorExitBoolCode(
+            condition   = "%s == NULL && ERROR_OCCURRED()" % fetched_name,
+            needs_check = condition.mayRaiseException(BaseException),
+            emit        = emit,
+            context     = context
+        )
+
+        getBranchingCode(
+            condition = "%s != NULL" % fetched_name,
+            emit      = emit,
+            context   = context
+        )
+
+        # The branch taken then uses this value, see
+        # "generateDictFetchedBranchCode".
+        return fetched_name
+
+    res_name = context.getIntResName()
+
+    emit(
+        "%s = PyDict_Contains( %s, %s );" % (
+            res_name,
+            dict_name,
+            key_name
+        )
+    )
+
+    getReleaseCodes(
+        release_names = (dict_name, key_name),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitBoolCode(
+        condition   = "%s == -1" % res_name,
+        needs_check = condition.mayRaiseException(BaseException),
+        emit        = emit,
+        context     = context
+    )
+
+    getBranchingCode(
+        condition = "%s == %s" % (
+            res_name,
+            '1' if not inverted else '0'
+        ),
+        emit      = emit,
+        context   = context
+    )
+
+    return None
+
+
 def generateDictOperationSetCode(statement, emit, context):
     value_arg_name = context.allocateTempName("dictset_value", unique = True)
     generateExpressionCode(
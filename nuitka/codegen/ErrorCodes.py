@@ -37,6 +37,9 @@ from .LineNumberCodes import getErrorLineNumberUpdateCode
 from .templates.CodeTemplatesExceptions import (
     template_error_catch_exception,
     template_error_catch_quick_exception,
+    template_error_catch_shared_exit,
+    template_error_exit_exception,
+    template_error_exit_quick_exception,
     template_error_format_string_exception
 )
 
@@ -79,7 +82,38 @@ def getErrorExitBoolCode(condition, emit, context,
 
     context.markAsNeedsExceptionVariables()
 
-    if quick_exception:
+    # Error exits with the same release code and target are shared, unless
+    # disabled for comparison of the generated code.
+    if not Options.isExperimental("unshared_error_exits"):
+        if quick_exception:
+            exit_code = template_error_exit_quick_exception % {
+                "exception_exit"       : context.getExceptionEscape(),
+                "quick_exception"      : getExceptionIdentifier(quick_exception),
+                "release_temps"        : getErrorExitReleaseCode(context),
+                "var_description_code" : getFrameVariableTypeDescriptionCode(
+                    context
+                )
+            }
+        else:
+            exit_code = template_error_exit_exception % {
+                "exception_exit"       : context.getExceptionEscape(),
+                "release_temps"        : getErrorExitReleaseCode(context),
+                "var_description_code" : getFrameVariableTypeDescriptionCode(
+                    context
+                )
+            }
+
+        # Only the line number differs between most exits.
+        emit(
+            template_error_catch_shared_exit % {
+                "condition"        : condition,
+                "line_number_code" : indented(
+                    getErrorLineNumberUpdateCode(context)
+                ),
+                "error_exit"       : context.getSharedErrorExitLabel(exit_code)
+            }
+        )
+    elif quick_exception:
         emit(
             indented(
                 template_error_catch_quick_exception % {
@@ -120,6 +154,28 @@ def getErrorExitBoolCode(condition, emit, context,
         )
 
 
+def getSharedErrorExitsCode(context):
+    """ Code for the shared error exits of a function or module.
+
+    This must be placed where it cannot be reached other than by "goto", i.e.
+    after a "return" statement, but still in the function.
+    """
+
+    result = []
+
+    for label, exit_code in context.getSharedErrorExitCodes():
+        result.append("")
+        result.append("%s:;" % label)
+        result.extend(exit_code.split('\n'))
+
+    if result:
+        result.insert(0, "")
+        result.insert(1, "// Shared error exits, only reached through goto.")
+        result.append("")
+
+    return indented(result)
+
+
 def getErrorExitCode(check_name, emit, context, quick_exception = None, needs_check = True):
     if needs_check:
         getErrorExitBoolCode(
@@ -299,7 +355,10 @@ def getMustNotGetHereCode(reason, context, emit):
     )
 
     if provider.isExpressionGeneratorObjectBody():
-        emit("return;")
+        if Options.isExperimental("generator_goto"):
+            emit("return NULL;")
+        else:
+            emit("return;")
     elif provider.isExpressionCoroutineObjectBody():
         emit("return;")
     elif provider.isExpressionAsyncgenObjectBody():
@@ -17,10 +17,17 @@
 #
 """ Eval/exec/execfile/compile built-in related codes. """
 
+import marshal
+import sys
+import warnings
+from types import CodeType
+
 from nuitka import Options
+from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateExpressionCode
+from .ConstantCodes import stream_data
 from .ErrorCodes import (
     getErrorExitBoolCode,
     getErrorExitCode,
@@ -85,7 +92,132 @@ def getStoreLocalsCode(locals_name, variables, is_foreign, emit, context):
 
 
 
+def _getPrecompiledCodeData(source_code, filename, mode, flags, dont_inherit,
+                            optimize, future_spec):
+    """ Compile a constant source at compile time, if that is safe to do.
+
+    Returns the marshal data of the code object and the arguments to compile
+    it at run time instead, or None if compilation has to be done at run time,
+    because it fails or warns, or the run time flags are not known.
+
+    The code is compiled without optimization. Unless that was given as an
+    argument, an optimization level given at run time, e.g. with "-O" or
+    "PYTHONOPTIMIZE", makes it compile there with the arguments.
+    """
+
+    if sys.flags.optimize:
+        return None
+
+    if type(source_code) not in (str, bytes, unicode) or \
+       type(filename) not in (str, unicode) or \
+       mode not in ("exec", "eval", "single"):
+        return None
+
+    if type(flags) is not int or type(optimize) is not int:
+        return None
+
+    if not dont_inherit:
+        flags |= future_spec.asCompilerFlags()
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            if python_version < 300:
+                code_object = compile(source_code, filename, mode, flags, True)
+            else:
+                code_object = compile(
+                    source_code,
+                    filename,
+                    mode,
+                    flags,
+                    True,
+                    optimize if optimize != -1 else 0
+                )
+    except Exception: # Catching anything on purpose, pylint: disable=broad-except
+        return None
+
+    # Other flags can make it return AST objects.
+    if type(code_object) is not CodeType:
+        return None
+
+    if python_version < 300 or optimize == -1:
+        compile_args = (source_code, filename, mode, flags)
+    else:
+        compile_args = None
+
+    return marshal.dumps(code_object), compile_args
+
+
+def getPrecompiledCodeCode(to_name, precompiled, emit, context):
+    code_data, compile_args = precompiled
+
+    if compile_args is None:
+        compile_args_code = "NULL, NULL, NULL, NULL"
+    else:
+        compile_args_code = ", ".join(
+            context.getConstantCode(compile_arg)
+            for compile_arg in
+            compile_args
+        )
+
+    emit(
+        """\
+{
+    static PyObject *precompiled_code = NULL;
+    %s = LOAD_PRECOMPILED_CODE( &precompiled_code, %s, %s );
+}""" % (
+            to_name,
+            stream_data.getStreamDataCode(code_data),
+            compile_args_code
+        )
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
+def _getConstantArgumentValue(node, default):
+    if node is None:
+        return default
+    elif node.isExpressionConstantRef():
+        return node.getConstant()
+    else:
+        return _not_constant
+
+
+_not_constant = object()
+
+
 def generateBuiltinCompileCode(to_name, expression, emit, context):
+    precompiled = _getPrecompiledCodeData(
+        source_code  = _getConstantArgumentValue(expression.getSourceCode(), None),
+        filename     = _getConstantArgumentValue(expression.getFilename(), None),
+        mode         = _getConstantArgumentValue(expression.getMode(), None),
+        flags        = _getConstantArgumentValue(expression.getFlags(), 0),
+        dont_inherit = _getConstantArgumentValue(expression.getDontInherit(), False),
+        optimize     = _getConstantArgumentValue(expression.getOptimize(), -1),
+        future_spec  = expression.getParentModule().getFutureSpec()
+    )
+
+    if precompiled is not None:
+        context.setCurrentSourceCodeReference(
+            expression.getCompatibleSourceReference()
+        )
+
+        getPrecompiledCodeCode(
+            to_name     = to_name,
+            precompiled = precompiled,
+            emit        = emit,
+            context     = context
+        )
+
+        return
 
     source_name = context.allocateTempName("compile_source")
     filename_name = context.allocateTempName("compile_filename")
@@ -208,20 +340,28 @@ def getBuiltinCompileCode(to_name, source_name, filename_name, mode_name,
 
 
 def getBuiltinEvalCode(to_name, source_name, filename_name, globals_name,
-                       locals_name, mode_name, emit, context):
+                       locals_name, mode_name, precompiled, emit, context):
     compiled_name = context.allocateTempName("eval_compiled")
 
-    getBuiltinCompileCode(
-        to_name           = compiled_name,
-        source_name       = source_name,
-        filename_name     = filename_name,
-        mode_name         = mode_name,
-        flags_name        = "NULL",
-        dont_inherit_name = "NULL",
-        optimize_name     = "NULL",
-        emit              = emit,
-        context           = context
-    )
+    if precompiled is not None:
+        getPrecompiledCodeCode(
+            to_name     = compiled_name,
+            precompiled = precompiled,
+            emit        = emit,
+            context     = context
+        )
+    else:
+        getBuiltinCompileCode(
+            to_name           = compiled_name,
+            source_name       = source_name,
+            filename_name     = filename_name,
+            mode_name         = mode_name,
+            flags_name        = "NULL",
+            dont_inherit_name = "NULL",
+            optimize_name     = "NULL",
+            emit              = emit,
+            context           = context
+        )
 
     emit(
         "%s = EVAL_CODE( %s, %s, %s );" % (
@@ -252,16 +392,36 @@ def generateExecCode(statement, emit, context):
     globals_arg = statement.getGlobals()
     locals_arg = statement.getLocals()
 
-    source_name = context.allocateTempName("exec_source")
+    source_ref = statement.getSourceReference()
+
+    # Filename with origin in improved mode.
+    if Options.isFullCompat():
+        filename = "<string>"
+    else:
+        filename = "<string at %s>" % source_ref.getAsString()
+
+    precompiled = _getPrecompiledCodeData(
+        source_code  = _getConstantArgumentValue(source_arg, None),
+        filename     = filename,
+        mode         = "exec",
+        flags        = 0,
+        dont_inherit = False,
+        optimize     = -1,
+        future_spec  = statement.getParentModule().getFutureSpec()
+    )
+
     globals_name = context.allocateTempName("exec_globals")
     locals_name = context.allocateTempName("exec_locals")
 
-    generateExpressionCode(
-        to_name    = source_name,
-        expression = source_arg,
-        emit       = emit,
-        context    = context
-    )
+    if precompiled is None:
+        source_name = context.allocateTempName("exec_source")
+
+        generateExpressionCode(
+            to_name    = source_name,
+            expression = source_arg,
+            emit       = emit,
+            context    = context
+        )
 
     generateExpressionCode(
         to_name    = globals_name,
@@ -277,18 +437,6 @@ def generateExecCode(statement, emit, context):
         context    = context
     )
 
-    source_ref = statement.getSourceReference()
-
-    # Filename with origin in improved mode.
-    if Options.isFullCompat():
-        filename_name = context.getConstantCode(
-            constant = "<string>"
-        )
-    else:
-        filename_name = context.getConstantCode(
-            constant = "<string at %s>" % source_ref.getAsString()
-        )
-
     old_source_ref = context.setCurrentSourceCodeReference(
         locals_arg.getSourceReference()
           if Options.isFullCompat() else
@@ -297,19 +445,29 @@ def generateExecCode(statement, emit, context):
 
     compiled_name = context.allocateTempName("exec_compiled")
 
-    getBuiltinCompileCode(
-        to_name           = compiled_name,
-        source_name       = source_name,
-        filename_name     = filename_name,
-        mode_name         = context.getConstantCode(
-            constant = "exec"
-        ),
-        flags_name        = "NULL",
-        dont_inherit_name = "NULL",
-        optimize_name     = "NULL",
-        emit              = emit,
-        context           = context
-    )
+    if precompiled is not None:
+        getPrecompiledCodeCode(
+            to_name     = compiled_name,
+            precompiled = precompiled,
+            emit        = emit,
+            context     = context
+        )
+    else:
+        getBuiltinCompileCode(
+            to_name           = compiled_name,
+            source_name       = source_name,
+            filename_name     = context.getConstantCode(
+                constant = filename
+            ),
+            mode_name         = context.getConstantCode(
+                constant = "exec"
+            ),
+            flags_name        = "NULL",
+            dont_inherit_name = "NULL",
+            optimize_name     = "NULL",
+            emit              = emit,
+            context           = context
+        )
 
     to_name = context.allocateTempName("exec_result")
 
@@ -347,16 +505,38 @@ def generateExecCode(statement, emit, context):
 
 
 def _generateEvalCode(to_name, node, emit, context):
-    source_name = context.allocateTempName("eval_source")
+    if node.isExpressionBuiltinEval() or \
+         (python_version >= 300 and node.isExpressionBuiltinExec()):
+        filename = "<string>"
+    else:
+        filename = "<execfile>"
+
+    mode = "eval" if node.isExpressionBuiltinEval() else "exec"
+
+    precompiled = _getPrecompiledCodeData(
+        source_code  = _getConstantArgumentValue(node.getSourceCode(), None),
+        filename     = filename,
+        mode         = mode,
+        flags        = 0,
+        dont_inherit = False,
+        optimize     = -1,
+        future_spec  = node.getParentModule().getFutureSpec()
+    )
+
     globals_name = context.allocateTempName("eval_globals")
     locals_name = context.allocateTempName("eval_locals")
 
-    generateExpressionCode(
-        to_name    = source_name,
-        expression = node.getSourceCode(),
-        emit       = emit,
-        context    = context
-    )
+    if precompiled is None:
+        source_name = context.allocateTempName("eval_source")
+
+        generateExpressionCode(
+            to_name    = source_name,
+            expression = node.getSourceCode(),
+            emit       = emit,
+            context    = context
+        )
+    else:
+        source_name = None
 
     generateExpressionCode(
         to_name    = globals_name,
@@ -372,12 +552,6 @@ def _generateEvalCode(to_name, node, emit, context):
         context    = context
     )
 
-    if node.isExpressionBuiltinEval() or \
-         (python_version >= 300 and node.isExpressionBuiltinExec()):
-        filename = "<string>"
-    else:
-        filename = "<execfile>"
-
     getBuiltinEvalCode(
         to_name       = to_name,
         source_name   = source_name,
@@ -387,8 +561,9 @@ def _generateEvalCode(to_name, node, emit, context):
             constant = filename
         ),
         mode_name     = context.getConstantCode(
-            constant = "eval" if node.isExpressionBuiltinEval() else "exec"
+            constant = mode
         ),
+        precompiled   = precompiled,
         emit          = emit,
         context       = context
     )
@@ -19,9 +19,14 @@
 
 """
 
+from nuitka.optimizations.TypeFeedback import (
+    getVariableSiteName,
+    isTypeFeedbackRecording
+)
 from nuitka.PythonVersions import python_version
 
 from .c_types.CTypePyObjectPtrs import CTypeCellObject, CTypePyObjectPtrPtr
+from .CallCodes import getStarArgsCallHelperCallCode, isStarArgsCallHelper
 from .CodeHelpers import generateExpressionCode, generateStatementSequenceCode
 from .Emission import SourceCodeCollector
 from .ErrorCodes import (
@@ -30,7 +35,8 @@ from .ErrorCodes import (
     getExceptionKeeperVariableNames,
     getExceptionPreserverVariableNames,
     getMustNotGetHereCode,
-    getReleaseCode
+    getReleaseCode,
+    getSharedErrorExitsCode
 )
 from .Indentation import indented
 from .LabelCodes import getLabelCode
@@ -40,6 +46,7 @@ from .templates.CodeTemplatesFunction import (
     function_dict_setup,
     function_direct_body_template,
     template_function_body,
+    template_function_entry_point_declaration,
     template_function_direct_declaration,
     template_function_exception_exit,
     template_function_make_declaration,
@@ -47,6 +54,7 @@ from .templates.CodeTemplatesFunction import (
     template_make_function_template
 )
 from .TupleCodes import getTupleCreationCode
+from .TypeFeedbackCodes import getTypeFeedbackRecordCode
 from .VariableCodes import (
     getLocalVariableCodeType,
     getLocalVariableInitCode,
@@ -118,6 +126,12 @@ def getFunctionEntryPointIdentifier(function_identifier):
     return "impl_" + function_identifier
 
 
+def getFunctionEntryPointDecl(function_identifier):
+    return template_function_entry_point_declaration % {
+        "function_identifier" : function_identifier
+    }
+
+
 def getFunctionMakerCode(function_name, function_qualname, function_identifier,
                          code_identifier, closure_variables, defaults_name,
                          kw_defaults_name, annotations_name, function_doc,
@@ -497,6 +511,23 @@ def setupFunctionLocalVariables(context, parameters, closure_variables,
     return function_locals, function_cleanup
 
 
+def getParameterTypeFeedbackRecordCode(parameters, emit, context):
+    # The star arguments are always a tuple and a dict.
+    star_variables = (
+        parameters.getListStarArgVariable(),
+        parameters.getDictStarArgVariable()
+    )
+
+    for count, variable in enumerate(parameters.getAllVariables()):
+        if variable not in star_variables:
+            getTypeFeedbackRecordCode(
+                site_name   = getVariableSiteName(variable),
+                value_names = ("python_pars[ %d ]" % count,),
+                emit        = emit,
+                context     = context
+            )
+
+
 def finalizeFunctionLocalVariables(context):
     function_locals = []
 
@@ -556,6 +587,13 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
 
     function_codes = SourceCodeCollector()
 
+    if parameters is not None and isTypeFeedbackRecording():
+        getParameterTypeFeedbackRecordCode(
+            parameters = parameters,
+            emit       = function_codes,
+            context    = context
+        )
+
     generateStatementSequenceCode(
         statement_sequence = context.getOwner().getBody(),
         allow_none         = True,
@@ -594,6 +632,8 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
             }
         )
 
+    function_exit += getSharedErrorExitsCode(context)
+
     if context.isForCreatedFunction():
         parameter_objects_decl = ["struct Nuitka_FunctionObject const *self"]
     else:
@@ -669,6 +709,21 @@ def generateFunctionCallCode(to_name, expression, emit, context):
         expression.getCompatibleSourceReference()
     )
 
+    if isStarArgsCallHelper(function_body):
+        getStarArgsCallHelperCallCode(
+            to_name             = to_name,
+            function_identifier = getFunctionEntryPointIdentifier(
+                function_identifier = function_identifier
+            ),
+            parameter_names     = function_body.getParameters().getParameterNames(),
+            arg_names           = arg_names,
+            needs_check         = function_body.mayRaiseException(BaseException),
+            emit                = emit,
+            context             = context
+        )
+
+        return
+
     getDirectFunctionCallCode(
         to_name             = to_name,
         function_identifier = function_identifier,
@@ -24,6 +24,7 @@ from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateStatementSequenceCode
 from .Emission import SourceCodeCollector
+from .ErrorCodes import getSharedErrorExitsCode
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     setupFunctionLocalVariables
@@ -32,6 +33,7 @@ from .Indentation import indented
 from .ModuleCodes import getModuleAccessCode
 from .templates.CodeTemplatesGeneratorFunction import (
     template_generator_exception_exit,
+    template_generator_heap_storage_init,
     template_generator_making,
     template_generator_noexception_exit,
     template_generator_return_exit,
@@ -83,6 +85,8 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
     if needs_generator_return:
         generator_exit += template_generator_return_exit % {}
 
+    generator_exit += getSharedErrorExitsCode(context)
+
     function_dispatch = [
         "case %(index)d: goto yield_return_%(index)d;" % {
             "index" : yield_index
@@ -95,46 +99,69 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
         function_dispatch.insert(0, "switch(generator->m_yield_return_index) {")
         function_dispatch.append('}')
 
-    local_type_decl = []
-    local_type_init = []
-    local_reals = []
+    function_heap_defines = []
+    function_heap_undefs = []
+
+    if Options.isExperimental("generator_goto"):
+        # The local variables must survive the return of the generator function
+        # at yields, so these are kept in a heap storage, with the exception of
+        # what is not used across yields by design.
+        local_type_decl = []
+        local_type_init = []
+        local_reals = []
 
-    for decl in function_locals:
-        if decl.startswith("NUITKA_MAY_BE_UNUSED "):
-            decl = decl[21:]
+        for decl in function_locals:
+            if decl.startswith("NUITKA_MAY_BE_UNUSED "):
+                decl = decl[21:]
 
-        if decl.startswith("static"):
-            local_reals.append(decl)
-            continue
+            if decl.startswith("static"):
+                local_reals.append(decl)
+                continue
 
-        if decl in ("char const *type_description;", "PyObject *tmp_unused;"):
-            local_reals.append(decl)
-            continue
+            if decl in ("char const *type_description;", "PyObject *tmp_unused;"):
+                local_reals.append(decl)
+                continue
 
-        parts = decl.split('=')
+            parts = decl.split('=', 1)
 
-        if len(parts) == 1:
-            local_type_decl.append(decl)
-        else:
-            type_decl = parts[0].strip()
+            type_decl = parts[0].strip().rstrip(';')
             var_name = type_decl.split('*')[-1]
             var_name = var_name.split(' ')[-1]
 
-            local_type_decl.append(type_decl)
-            local_type_init.append(
-                "local_variables->" + var_name + " =" + parts[1]
+            if len(parts) != 1:
+                local_type_init.append(var_name + " =" + parts[1])
+
+            # Plain initialization of an already declared variable.
+            if type_decl == var_name:
+                continue
+
+            local_type_decl.append(type_decl + ';')
+
+            function_heap_defines.append(
+                "#define %s generator_heap->%s" % (var_name, var_name)
+            )
+            function_heap_undefs.append(
+                "#undef %s" % var_name
             )
 
-    if Options.isExperimental("generator_goto"):
-        function_locals = local_reals + local_type_init
+        heap_storage_init = template_generator_heap_storage_init % {
+            "function_identifier" : function_identifier
+        }
+
+        function_locals = local_reals + heap_storage_init.split('\n') + \
+                          local_type_init
+    else:
+        local_type_decl = []
 
     return template_genfunc_yielder_body_template % {
-        "function_identifier"  : function_identifier,
-        "function_body"        : indented(function_codes.codes),
-        "function_local_types" : indented(local_type_decl),
-        "function_var_inits"   : indented(function_locals),
-        "function_dispatch"    : indented(function_dispatch),
-        "generator_exit"       : generator_exit
+        "function_identifier"   : function_identifier,
+        "function_body"         : indented(function_codes.codes),
+        "function_local_types"  : indented(local_type_decl),
+        "function_heap_defines" : '\n'.join(function_heap_defines),
+        "function_heap_undefs"  : '\n'.join(function_heap_undefs),
+        "function_var_inits"    : indented(function_locals),
+        "function_dispatch"     : indented(function_dispatch),
+        "generator_exit"        : generator_exit
     }
 
 
@@ -20,6 +20,9 @@
 That is import as expression, and star import.
 """
 
+from nuitka import Options
+from nuitka.PythonVersions import python_version
+
 from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
 from .ErrorCodes import (
     getErrorExitBoolCode,
@@ -31,6 +34,65 @@ from .LineNumberCodes import emitLineNumberUpdateCode
 from .ModuleCodes import getModuleAccessCode
 
 
+def _getCompiledImportNames(expression):
+    """ Module names for an import of a compiled module of this binary.
+
+    Returns the full name of the module, and the name of the top level
+    package, if that is the result, or "None" if the import cannot be done
+    directly.
+    """
+
+    # Extension modules don't link each other.
+    if Options.shallMakeModule():
+        return None
+
+    imported_module = expression.getImportedModule()
+
+    if imported_module is None or \
+       not imported_module.isCompiledPythonModule() or \
+       imported_module.isMainModule():
+        return None
+
+    module_name = expression.getImportName()
+
+    if not module_name.isExpressionConstantRef():
+        return None
+
+    module_name = module_name.getConstant()
+
+    # Relative imports resolved to another name are not direct.
+    if module_name != imported_module.getFullName():
+        return None
+
+    level = expression.getLevel()
+
+    if level is not None:
+        if not level.isExpressionConstantRef():
+            return None
+
+        level = level.getConstant()
+
+        if level not in (0, -1) or (level == -1 and python_version >= 300):
+            return None
+
+    import_list = expression.getFromList()
+
+    if import_list is not None:
+        if not import_list.isExpressionConstantRef():
+            return None
+
+        import_list = import_list.getConstant()
+
+    if import_list:
+        # Sub-modules of packages might be imported from the list.
+        if imported_module.isCompiledPythonPackage():
+            return None
+
+        return module_name, None
+    else:
+        return module_name, module_name.split('.')[0]
+
+
 def generateBuiltinImportCode(to_name, expression, emit, context):
     # We know that 5 expressions are created, pylint: disable=W0632
     module_name, globals_name, locals_name, import_list_name, level_name = \
@@ -40,6 +102,24 @@ def generateBuiltinImportCode(to_name, expression, emit, context):
         context    = context
     )
 
+    compiled_names = _getCompiledImportNames(expression)
+
+    if compiled_names is not None:
+        getCompiledImportCode(
+            to_name          = to_name,
+            module_name      = module_name,
+            compiled_names   = compiled_names,
+            globals_name     = globals_name,
+            locals_name      = locals_name,
+            import_list_name = import_list_name,
+            level_name       = level_name,
+            needs_check      = expression.mayRaiseException(BaseException),
+            emit             = emit,
+            context          = context
+        )
+
+        return
+
     getBuiltinImportCode(
         to_name          = to_name,
         module_name      = module_name,
@@ -124,6 +204,54 @@ def getBuiltinImportCode(to_name, module_name, globals_name, locals_name,
     )
 
 
+def getCompiledImportCode(to_name, module_name, compiled_names, globals_name,
+                          locals_name, import_list_name, level_name,
+                          needs_check, emit, context):
+    full_name, top_name = compiled_names
+
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        """\
+{
+    static PyObject *import_cache[2] = { NULL, NULL };
+    %s = IMPORT_COMPILED_MODULE( import_cache, "%s", %s, %s, %s );
+}""" % (
+            to_name,
+            full_name,
+            module_name,
+            "NULL" if top_name is None or top_name == full_name
+              else context.getConstantCode(top_name),
+            ", ".join(
+                "NULL" if arg is None else arg
+                for arg in
+                (globals_name, locals_name, import_list_name, level_name)
+            )
+        )
+    )
+
+    getReleaseCodes(
+        release_names = (
+            module_name,
+            globals_name,
+            locals_name,
+            import_list_name,
+            level_name
+        ),
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name  = to_name,
+        needs_check = needs_check,
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateImportModuleHardCode(to_name, expression, emit, context):
     getImportModuleHardCode(
         to_name     = to_name,
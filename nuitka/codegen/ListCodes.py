@@ -109,6 +109,22 @@ def generateListOperationAppendCode(statement, emit, context):
     )
 
 
+def generateListOperationAppendExpressionCode(to_name, expression, emit,
+                                             context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "LIST_METHOD_APPEND",
+        arg_desc   = (
+            ("list_arg", expression.getList()),
+            ("append_value", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
 def generateListOperationExtendCode(to_name, expression, emit, context):
     list_arg_name, value_arg_name = generateChildExpressionsCode(
         expression = expression,
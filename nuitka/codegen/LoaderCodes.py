@@ -22,6 +22,7 @@ or distribution folder.
 """
 
 
+from nuitka.freezer.StartupModules import getModulesInStartupOrder
 from nuitka.ModuleRegistry import getUncompiledNonTechnicalModules
 
 from . import ConstantCodes
@@ -58,11 +59,17 @@ def getModuleMetapathLoaderEntryCode(module_name, module_identifier,
 
 stream_data = ConstantCodes.stream_data
 
-def getMetapathLoaderBodyCode(other_modules):
+def getMetapathLoaderBodyCode(other_modules, startup_modules):
     metapath_loader_inittab = []
     metapath_module_decls = []
 
-    for other_module in other_modules:
+    # Modules imported at startup come first, so looking them up in the table
+    # is fastest.
+    for other_module in getModulesInStartupOrder(
+            modules         = list(other_modules) +
+                              getUncompiledNonTechnicalModules(),
+            startup_modules = startup_modules
+        ):
         if other_module.isUncompiledPythonModule():
             code_data = other_module.getByteCode()
             is_package = other_module.isUncompiledPythonPackage()
@@ -94,24 +101,6 @@ def getMetapathLoaderBodyCode(other_modules):
                 "MOD_INIT_DECL( %s );" % other_module.getCodeName()
             )
 
-    for uncompiled_module in getUncompiledNonTechnicalModules():
-        code_data = uncompiled_module.getByteCode()
-        is_package = uncompiled_module.isUncompiledPythonPackage()
-
-        flags = ["NUITKA_BYTECODE_FLAG"]
-        if is_package:
-            flags.append("NUITKA_PACKAGE_FLAG")
-
-        metapath_loader_inittab.append(
-            template_metapath_loader_bytecode_module_entry % {
-                "module_name" : uncompiled_module.getFullName(),
-                "bytecode"    : stream_data.getStreamDataOffset(code_data),
-                "size"        : len(code_data),
-                "flags"       : " | ".join(flags)
-            }
-        )
-
-
     return template_metapath_loader_body % {
         "metapath_module_decls"   : indented(metapath_module_decls, 0),
         "metapath_loader_inittab" : indented(metapath_loader_inittab)
@@ -19,21 +19,35 @@
 
 """
 
+from nuitka import Options
 from nuitka.Version import getNuitkaVersion, getNuitkaVersionYear
 
-from .CodeObjectCodes import getCodeObjectsDeclCode, getCodeObjectsInitCode
+from .CodeObjectCodes import (
+    getCodeObjectsDeclCode,
+    getCodeObjectsExternDeclCode,
+    getCodeObjectsInitCode
+)
 from .ConstantCodes import allocateNestedConstants, getConstantInitCodes
 from .ErrorCodes import (
     getErrorVariableDeclarations,
     getExceptionKeeperVariableNames,
-    getExceptionPreserverVariableNames
+    getExceptionPreserverVariableNames,
+    getSharedErrorExitsCode
 )
 from .Indentation import indented
 from .templates.CodeTemplatesModules import (
     template_global_copyright,
+    template_header_guard,
     template_module_body_template,
     template_module_exception_exit,
-    template_module_noexception_exit
+    template_module_header_template,
+    template_module_noexception_exit,
+    template_module_part_template
+)
+from .TypeFeedbackCodes import (
+    getTypeFeedbackSitesDeclCode,
+    getTypeFeedbackSitesExternDeclCode,
+    getTypeFeedbackSitesInitCode
 )
 from .VariableCodes import getLocalVariableInitCode
 
@@ -42,9 +56,40 @@ def getModuleAccessCode(context):
     return "module_%s" % context.getModuleCodeName()
 
 
+def _splitFunctionBodyCodes(function_body_codes):
+    """ Group the function codes into parts for separate files.
+
+    Returns an empty list, if the module is small enough to be one file.
+    """
+
+    split_size = Options.getModuleSplitSize()
+
+    if not split_size or \
+       sum(len(code) for code in function_body_codes) <= split_size:
+        return []
+
+    parts = [[]]
+    part_size = 0
+
+    for code in function_body_codes:
+        if parts[-1] and part_size + len(code) > split_size:
+            parts.append([])
+            part_size = 0
+
+        parts[-1].append(code)
+        part_size += len(code)
+
+    return [
+        "\n\n".join(part)
+        for part in
+        parts
+    ]
+
+
 def getModuleValues(context, module_name, module_identifier, codes,
-                    function_decl_codes, function_body_codes, temp_variables,
-                    is_main_module, is_internal_module):
+                    function_decl_codes, function_entry_decl_codes,
+                    function_body_codes, temp_variables, is_main_module,
+                    is_internal_module):
     # For the module code, lots of arguments and attributes come together.
     # pylint: disable=too-many-locals
 
@@ -95,6 +140,18 @@ def getModuleValues(context, module_name, module_identifier, codes,
     else:
         module_exit = template_module_noexception_exit
 
+    # Placed after the return of the module code.
+    module_exit = "%s\n%s" % (getSharedErrorExitsCode(context), module_exit)
+
+    # Large modules have their functions in separate files, that can then be
+    # compiled in parallel, and the declarations go into a header for them.
+    function_body_parts = _splitFunctionBodyCodes(function_body_codes)
+
+    if function_body_parts:
+        function_body_codes = ""
+    else:
+        function_body_codes = "\n\n".join(function_body_codes)
+
     module_body_template_values = {
         "module_name"              : module_name,
         "module_name_obj"          : context.getConstantCode(
@@ -104,6 +161,8 @@ def getModuleValues(context, module_name, module_identifier, codes,
         "module_identifier"        : module_identifier,
         "module_functions_decl"    : function_decl_codes,
         "module_functions_code"    : function_body_codes,
+        "module_functions_parts"   : function_body_parts,
+        "module_functions_entries" : function_entry_decl_codes,
         "temps_decl"               : indented(local_var_inits),
         "module_code"              : indented(codes),
         "module_exit"              : module_exit,
@@ -114,21 +173,74 @@ def getModuleValues(context, module_name, module_identifier, codes,
         "module_code_objects_init" : indented(
             getCodeObjectsInitCode(context),
             1
-        )
+        ),
+        "type_feedback_decl"       : getTypeFeedbackSitesDeclCode(context),
+        "type_feedback_init"       : getTypeFeedbackSitesInitCode(context)
     }
 
     allocateNestedConstants(context)
 
     # Force internal module to not need constants init, by making all its
-    # constants be shared.
+    # constants be shared, and created before any module is imported.
     if is_internal_module:
+        for constant in context.getConstants():
+            context.global_context.countConstantUse(constant)
+            context.global_context.markConstantEager(constant)
+    # Constants of split modules are used from several files, so these are
+    # made shared ones, rather than private to the module file.
+    elif function_body_parts:
         for constant in context.getConstants():
             context.global_context.countConstantUse(constant)
 
     return module_body_template_values
 
 
-def getModuleCode(module_context, template_values):
+def _getExternDeclaration(declaration):
+    if declaration.startswith("NUITKA_LOCAL_MODULE "):
+        return "extern " + declaration[len("NUITKA_LOCAL_MODULE "):]
+    else:
+        return declaration
+
+
+def getModuleHeaderCode(module_context, template_values, decls,
+                        function_entry_decl_codes):
+    """ Header with the declarations shared by the files of a split module. """
+
+    return template_header_guard % {
+        "header_guard_name" : "__NUITKA_MODULE_%s_H__" % (
+            template_values["module_identifier"]
+        ),
+        "header_body"       : template_module_header_template % {
+            "module_name"              : template_values["module_name"],
+            "module_identifier"        : template_values["module_identifier"],
+            "constant_decl_codes"      : indented(
+                [
+                    _getExternDeclaration(decl)
+                    for decl in
+                    decls
+                ],
+                0
+            ),
+            "module_code_objects_decl" : indented(
+                getCodeObjectsExternDeclCode(module_context),
+                0
+            ),
+            "type_feedback_decl"       : getTypeFeedbackSitesExternDeclCode(
+                module_context
+            ),
+            "module_functions_decl"    : template_values["module_functions_decl"],
+            "module_functions_entries" : function_entry_decl_codes
+        }
+    }
+
+
+def getModuleCode(module_context, template_values, header_filename):
+    """ Code of the module, with the header and parts if it is split.
+
+    Returns the module code, the header code or None, and the codes of
+    the parts, if any.
+    """
+
     header = template_global_copyright % {
         "name"    : module_context.getName(),
         "version" : getNuitkaVersion(),
@@ -138,7 +250,7 @@ def getModuleCode(module_context, template_values):
     decls, inits, checks = getConstantInitCodes(module_context)
 
     if module_context.needsModuleFilenameObject():
-        decls.append("static PyObject *module_filename_obj;")
+        decls.append("NUITKA_LOCAL_MODULE PyObject *module_filename_obj;")
 
     template_values["constant_decl_codes"] = indented(
         decls,
@@ -155,7 +267,43 @@ def getModuleCode(module_context, template_values):
         1
     )
 
-    return header + template_module_body_template % template_values
+    # Not for the module template, only to make the other files.
+    function_body_parts = template_values.pop("module_functions_parts")
+    function_entry_decl_codes = template_values.pop("module_functions_entries")
+
+    if not function_body_parts:
+        template_values["module_header_include"] = ""
+
+        return header + template_module_body_template % template_values, None, ()
+
+    header_code = header + getModuleHeaderCode(
+        module_context            = module_context,
+        template_values           = template_values,
+        decls                     = decls,
+        function_entry_decl_codes = function_entry_decl_codes
+    )
+
+    # The header has the function declarations for all the files.
+    template_values["module_header_include"] = '\n#include "%s"\n' % (
+        header_filename
+    )
+    template_values["module_functions_decl"] = ""
+
+    part_codes = [
+        header + template_module_part_template % {
+            "module_header_name"    : header_filename,
+            "part_number"           : count,
+            "module_functions_code" : part_code
+        }
+        for count, part_code in
+        enumerate(function_body_parts, 1)
+    ]
+
+    return (
+        header + template_module_body_template % template_values,
+        header_code,
+        part_codes
+    )
 
 
 def generateModuleFileAttributeCode(to_name, expression, emit, context):
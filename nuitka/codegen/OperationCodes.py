@@ -22,9 +22,19 @@ of course types could play into it. Then there is also the added difficulty of
 in-place assignments, which have other operation variants.
 """
 
+from nuitka.optimizations.TypeFeedback import (
+    getOperationSiteName,
+    isTypeFeedbackRecording,
+    isTypeFeedbackUsed
+)
+
 from . import OperatorCodes
 from .CodeHelpers import generateChildExpressionsCode
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCode
+from .TypeFeedbackCodes import (
+    getTypeFeedbackFastPathCode,
+    getTypeFeedbackRecordCode
+)
 
 
 def generateOperationBinaryCode(to_name, expression, emit, context):
@@ -39,13 +49,25 @@ def generateOperationBinaryCode(to_name, expression, emit, context):
     assert not inplace or not expression.getLeft().isCompileTimeConstant(),  \
         expression
 
+    type_feedback_site = None
+    type_feedback_shape = None
+
+    if not inplace:
+        if isTypeFeedbackRecording():
+            type_feedback_site = getOperationSiteName(expression)
+
+        if isTypeFeedbackUsed():
+            type_feedback_shape = expression.getTypeFeedbackOperandShape()
+
     getOperationCode(
-        to_name   = to_name,
-        operator  = expression.getOperator(),
-        arg_names = (left_arg_name, right_arg_name),
-        in_place  = inplace,
-        emit      = emit,
-        context   = context
+        to_name             = to_name,
+        operator            = expression.getOperator(),
+        arg_names           = (left_arg_name, right_arg_name),
+        in_place            = inplace,
+        emit                = emit,
+        context             = context,
+        type_feedback_site  = type_feedback_site,
+        type_feedback_shape = type_feedback_shape
     )
 
 
@@ -71,7 +93,8 @@ def generateOperationUnaryCode(to_name, expression, emit, context):
     )
 
 
-def getOperationCode(to_name, operator, arg_names, in_place, emit, context):
+def getOperationCode(to_name, operator, arg_names, in_place, emit, context,
+                     type_feedback_site = None, type_feedback_shape = None):
     # This needs to have one case per operation of Python, and there are many
     # of these, # pylint: disable=too-many-branches,too-many-statements
 
@@ -171,11 +194,30 @@ def getOperationCode(to_name, operator, arg_names, in_place, emit, context):
             context.addCleanupTempName(to_name)
 
     else:
+        operation_code = "%s( %s )" % (
+            helper,
+            ", ".join(prefix_args + arg_names)
+        )
+
+        if type_feedback_site is not None:
+            getTypeFeedbackRecordCode(
+                site_name   = type_feedback_site,
+                value_names = arg_names,
+                emit        = emit,
+                context     = context
+            )
+
+        operation_code = getTypeFeedbackFastPathCode(
+            shape        = type_feedback_shape,
+            operator     = operator,
+            arg_names    = arg_names,
+            generic_code = operation_code
+        )
+
         emit(
-            "%s = %s( %s );" % (
+            "%s = %s;" % (
                 to_name,
-                helper,
-                ", ".join(prefix_args + arg_names)
+                operation_code
             )
         )
 
@@ -180,6 +180,21 @@ def generateSetOperationAddCode(statement, emit, context):
     )
 
 
+def generateSetOperationAddExpressionCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "SET_METHOD_ADD",
+        arg_desc   = (
+            ("set_arg", expression.getSet()),
+            ("add_value", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
 def generateSetOperationUpdateCode(to_name, expression, emit, context):
     res_name = context.getIntResName()
 
@@ -229,3 +229,18 @@ def generateBuiltinAsciiCode(to_name, expression, emit, context):
         emit       = emit,
         context    = context
     )
+
+
+def generateStrOperationCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "STR_METHOD_" + expression.method_name.upper(),
+        arg_desc   = (
+            ("str_arg", expression.getStr()),
+            ("str_method_value", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
@@ -0,0 +1,187 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Type feedback codes.
+
+With "--type-feedback-record", the compiled program counts the exact built-in
+types of binary operation operands, of arguments and values assigned to local
+variables, and of attribute look-up results, and appends them to a file when
+exiting, see "nuitka.optimizations.TypeFeedback" for the sites.
+
+With "--type-feedback", that file is read again, and the nodes give the types
+that dominate as shapes. Binary operations where both operands are expected to
+have the same shape get a fast path, that calls the slot of that type directly,
+guarded by a check of the operand types, and falling back to the generic code.
+"""
+
+from nuitka import Options
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    ShapeTypeBytes,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeList,
+    ShapeTypeLong,
+    ShapeTypeStr,
+    ShapeTypeTuple,
+    ShapeTypeUnicode
+)
+from nuitka.PythonVersions import python_version
+
+from .Indentation import indented
+from .templates.CodeTemplatesModules import (
+    template_type_feedback_sites_decl,
+    template_type_feedback_sites_extern_decl,
+    template_type_feedback_sites_init
+)
+
+# The exact type checks and type objects of the shapes given by feedback.
+if python_version < 300:
+    _shape_types = {
+        ShapeTypeInt     : ("PyInt_CheckExact", "PyInt_Type"),
+        ShapeTypeLong    : ("PyLong_CheckExact", "PyLong_Type"),
+        ShapeTypeFloat   : ("PyFloat_CheckExact", "PyFloat_Type"),
+        ShapeTypeStr     : ("PyString_CheckExact", "PyString_Type"),
+        ShapeTypeUnicode : ("PyUnicode_CheckExact", "PyUnicode_Type"),
+        ShapeTypeList    : ("PyList_CheckExact", "PyList_Type"),
+        ShapeTypeTuple   : ("PyTuple_CheckExact", "PyTuple_Type"),
+    }
+else:
+    _shape_types = {
+        ShapeTypeInt     : ("PyLong_CheckExact", "PyLong_Type"),
+        ShapeTypeFloat   : ("PyFloat_CheckExact", "PyFloat_Type"),
+        ShapeTypeBytes   : ("PyBytes_CheckExact", "PyBytes_Type"),
+        ShapeTypeStr     : ("PyUnicode_CheckExact", "PyUnicode_Type"),
+        ShapeTypeList    : ("PyList_CheckExact", "PyList_Type"),
+        ShapeTypeTuple   : ("PyTuple_CheckExact", "PyTuple_Type"),
+    }
+
+if python_version < 300:
+    _integer_shapes = (ShapeTypeInt, ShapeTypeLong)
+else:
+    _integer_shapes = (ShapeTypeInt,)
+
+_number_shapes = _integer_shapes + (ShapeTypeFloat,)
+
+# Number slots, that for two operands of the same number type never give
+# "NotImplemented".
+_number_slots = {
+    "Add"      : "nb_add",
+    "Sub"      : "nb_subtract",
+    "Mult"     : "nb_multiply",
+    "FloorDiv" : "nb_floor_divide",
+    "TrueDiv"  : "nb_true_divide",
+    "Mod"      : "nb_remainder",
+}
+
+if python_version < 300:
+    _number_slots["Div"] = "nb_divide"
+
+# These are not there for "float".
+_integer_slots = {
+    "LShift" : "nb_lshift",
+    "RShift" : "nb_rshift",
+    "BitAnd" : "nb_and",
+    "BitOr"  : "nb_or",
+    "BitXor" : "nb_xor",
+}
+
+def getTypeFeedbackRecordCode(site_name, value_names, emit, context):
+    emit(
+        "RECORD_TYPE_FEEDBACK%d( &type_feedback_sites[%d], %s );" % (
+            len(value_names),
+            context.addTypeFeedbackSite(site_name),
+            ", ".join(value_names)
+        )
+    )
+
+
+def getTypeFeedbackFastPathCode(shape, operator, arg_names, generic_code):
+    """ Wrap the generic code of an operation into a guarded fast path.
+
+        Returns the generic code if there is no fast path for the shape the
+        operands are expected to have.
+    """
+
+    if shape not in _shape_types:
+        return generic_code
+
+    check, type_name = _shape_types[shape]
+
+    if shape in _number_shapes and operator in _number_slots:
+        fast_code = "%s.tp_as_number->%s( %s, %s )" % (
+            type_name,
+            _number_slots[operator],
+            arg_names[0],
+            arg_names[1]
+        )
+    elif shape in _integer_shapes and operator in _integer_slots:
+        fast_code = "%s.tp_as_number->%s( %s, %s )" % (
+            type_name,
+            _integer_slots[operator],
+            arg_names[0],
+            arg_names[1]
+        )
+    elif shape not in _number_shapes and operator == "Add":
+        fast_code = "%s.tp_as_sequence->sq_concat( %s, %s )" % (
+            type_name,
+            arg_names[0],
+            arg_names[1]
+        )
+    else:
+        return generic_code
+
+    return "( %s( %s ) && %s( %s ) ) ? %s : %s" % (
+        check,
+        arg_names[0],
+        check,
+        arg_names[1],
+        fast_code,
+        generic_code
+    )
+
+
+def getTypeFeedbackSitesDeclCode(context):
+    if Options.getTypeFeedbackRecordFilename() is None or \
+       not context.getTypeFeedbackSites():
+        return ""
+
+    return template_type_feedback_sites_decl % {
+        "site_entries" : indented(
+            [
+                "{ \"%s\" }," % site_name
+                for site_name in
+                context.getTypeFeedbackSites()
+            ]
+        ),
+        "site_count"   : len(context.getTypeFeedbackSites())
+    }
+
+
+def getTypeFeedbackSitesExternDeclCode(context):
+    if Options.getTypeFeedbackRecordFilename() is None or \
+       not context.getTypeFeedbackSites():
+        return ""
+
+    return template_type_feedback_sites_extern_decl
+
+
+def getTypeFeedbackSitesInitCode(context):
+    if Options.getTypeFeedbackRecordFilename() is None or \
+       not context.getTypeFeedbackSites():
+        return ""
+
+    return template_type_feedback_sites_init
@@ -19,6 +19,11 @@
 
 """
 
+from nuitka.optimizations.TypeFeedback import (
+    getVariableSiteName,
+    isTypeFeedbackRecording
+)
+
 from .CodeHelpers import generateExpressionCode
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getCheckObjectCode, getNameReferenceErrorCode
@@ -28,6 +33,7 @@ from .templates.CodeTemplatesVariables import (
     template_read_maybe_local_unclear,
     template_read_mvar_unclear
 )
+from .TypeFeedbackCodes import getTypeFeedbackRecordCode
 
 
 def generateAssignmentVariableCode(statement, emit, context):
@@ -215,6 +221,14 @@ def getVariableAssignmentCode(context, emit, variable, version,
         if variable.isLocalVariable():
             context.setVariableType(variable, variable_code_name, variable_c_type)
 
+            if isTypeFeedbackRecording():
+                getTypeFeedbackRecordCode(
+                    site_name   = getVariableSiteName(variable),
+                    value_names = (tmp_name,),
+                    emit        = emit,
+                    context     = context
+                )
+
         # TODO: this was not handled previously, do not overlook when it
         # occurs.
         assert not in_place or not variable.isTempVariable()
@@ -21,10 +21,92 @@ The normal "yield", and the Python 3.3 or higher "yield from" variant.
 """
 
 from nuitka import Options
+from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateChildExpressionsCode
 from .ErrorCodes import getErrorExitCode, getReleaseCode
+from .Indentation import indented
 from .PythonAPICodes import getReferenceExportCode
+from .templates.CodeTemplatesGeneratorFunction import (
+    template_generator_swap_handler_exception,
+    template_generator_swap_handler_exception_on_resume,
+    template_generator_yield,
+    template_generator_yield_from
+)
+
+
+def _isGeneratorGotoContext(context):
+    # Only generators can return from their function at yields, coroutines
+    # and asyncgen still switch the stack.
+    return Options.isExperimental("generator_goto") and \
+           context.getContextObjectName() == "generator"
+
+
+def _getYieldReturnIndex(yield_return_label):
+    return int(yield_return_label.split('_')[-1])
+
+
+def _getSwapHandlerExceptionCode(preserve_exception):
+    if preserve_exception and python_version >= 300:
+        return template_generator_swap_handler_exception
+    else:
+        return ""
+
+
+def _generateGeneratorGotoYieldFromCode(to_name, value_name, preserve_exception,
+                                        emit, context):
+    iterator_name = context.allocateTempName("yield_from_iterator")
+
+    emit(
+        "%s = GENERATOR_YIELD_FROM_ITERATOR( generator, %s );" % (
+            iterator_name,
+            value_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = value_name,
+        emit         = emit,
+        context      = context
+    )
+
+    getErrorExitCode(
+        check_name = iterator_name,
+        emit       = emit,
+        context    = context
+    )
+
+    yield_return_label = context.allocateLabel("yield_return")
+
+    if preserve_exception and python_version >= 300:
+        swap_handler_exception_on_resume = \
+          template_generator_swap_handler_exception_on_resume
+    else:
+        swap_handler_exception_on_resume = ""
+
+    emit(
+        template_generator_yield_from % {
+            "swap_handler_exception_on_resume" : swap_handler_exception_on_resume,
+            "swap_handler_exception"           : indented(
+                _getSwapHandlerExceptionCode(preserve_exception),
+                2
+            ),
+            "yield_return_index"               : _getYieldReturnIndex(yield_return_label),
+            "yield_return_label"               : yield_return_label,
+            "iterator_name"                    : iterator_name,
+            "to_name"                          : to_name
+        }
+    )
+
+    emit("Py_DECREF( %s );" % iterator_name)
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
 
 
 def generateYieldCode(to_name, expression, emit, context):
@@ -40,26 +122,20 @@ def generateYieldCode(to_name, expression, emit, context):
     # This will produce GENERATOR_YIELD, COROUTINE_YIELD or ASYNCGEN_YIELD.
     getReferenceExportCode(value_name, emit, context)
 
-    if Options.isExperimental("generator_goto"):
+    if _isGeneratorGotoContext(context):
         yield_return_label = context.allocateLabel("yield_return")
-        yield_return_index = yield_return_label.split('_')[-1]
-
 
         emit(
-            """
-%(context_object_name)s->m_yield_return_index = %(yield_return_index)s;
-return %(yielded_value)s;
-%(yield_return_label)s:
-%(to_name)s = yield_return_value;
-""" % {
-                "context_object_name" : context.getContextObjectName(),
-                "yield_return_index"  : yield_return_index,
-                "yielded_value"       : value_name,
-                "yield_return_label"  : yield_return_label,
-                "to_name"             : to_name
-    }
+            template_generator_yield % {
+                "swap_handler_exception" : _getSwapHandlerExceptionCode(
+                    preserve_exception = preserve_exception
+                ),
+                "yield_return_index"     : _getYieldReturnIndex(yield_return_label),
+                "yielded_value"          : value_name,
+                "yield_return_label"     : yield_return_label,
+                "to_name"                : to_name
+            }
         )
-
     else:
         emit(
             "%s = %s_%s( %s, %s );" % (
@@ -96,6 +172,17 @@ def generateYieldFromCode(to_name, expression, emit, context):
     # In handlers, we must preserve/restore the exception.
     preserve_exception = expression.isExceptionPreserving()
 
+    if _isGeneratorGotoContext(context):
+        _generateGeneratorGotoYieldFromCode(
+            to_name            = to_name,
+            value_name         = value_name,
+            preserve_exception = preserve_exception,
+            emit               = emit,
+            context            = context
+        )
+
+        return
+
     # This will produce GENERATOR_YIELD_FROM, COROUTINE_YIELD_FROM or
     # ASYNCGEN_YIELD_FROM.
     getReferenceExportCode(value_name, emit, context)
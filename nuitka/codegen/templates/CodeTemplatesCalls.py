@@ -703,5 +703,16 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
 }
 """
 
+template_call_star_args_helper = """\
+if ( CAN_CALL_WITH_STAR_ARGS( %(kw)s, %(star_list)s, %(star_dict)s ) )
+{
+    %(to_name)s = CALL_FUNCTION_WITH_STAR_ARGS( %(called)s, %(args)s, %(kw)s, %(star_list)s, %(star_dict)s );%(release_args)s
+}
+else
+{%(ref_args)s
+    PyObject *dir_call_args[] = {%(arg_names)s};
+    %(to_name)s = %(function_identifier)s( dir_call_args );
+}"""
+
 from . import TemplateDebugWrapper # isort:skip
 TemplateDebugWrapper.checkDebug(globals())
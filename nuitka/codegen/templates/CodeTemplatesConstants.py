@@ -76,7 +76,33 @@ void createGlobalConstants( void )
         _createGlobalConstants();
     }
 }
+
+%(module_constant_inits)s
 """
 
+template_lazy_module_constants = """
+// Shared constants used by module "%(module_identifier)s", created when it is
+// imported, unless another module did it before.
+void createModuleSharedConstants_%(module_identifier)s( void )
+{
+    NUITKA_MAY_BE_UNUSED PyObject *exception_type, *exception_value;
+    NUITKA_MAY_BE_UNUSED PyTracebackObject *exception_tb;
+
+#ifdef _MSC_VER
+    // Prevent unused warnings in case of simple programs, the attribute
+    // NUITKA_MAY_BE_UNUSED doesn't work for MSVC.
+    (void *)exception_type; (void *)exception_value; (void *)exception_tb;
+#endif
+
+%(constant_inits)s
+}
+"""
+
+template_lazy_constant_guard = """\
+if ( %(condition)s )
+{
+%(codes)s
+}"""
+
 from . import TemplateDebugWrapper # isort:skip
 TemplateDebugWrapper.checkDebug(globals())
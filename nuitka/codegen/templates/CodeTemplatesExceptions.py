@@ -64,6 +64,37 @@ if ( %(condition)s )
     goto %(exception_exit)s;
 }"""
 
+template_error_catch_shared_exit = """\
+if ( %(condition)s )
+{
+%(line_number_code)s
+    goto %(error_exit)s;
+}"""
+
+template_error_exit_quick_exception = """\
+if ( !ERROR_OCCURRED() )
+{
+    exception_type = %(quick_exception)s;
+    Py_INCREF( exception_type );
+    exception_value = NULL;
+    exception_tb = NULL;
+}
+else
+{
+    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+}
+%(release_temps)s
+%(var_description_code)s
+goto %(exception_exit)s;"""
+
+template_error_exit_exception = """\
+assert( ERROR_OCCURRED() );
+
+FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+%(release_temps)s
+%(var_description_code)s
+goto %(exception_exit)s;"""
+
 template_error_format_string_exception = """\
 if ( %(condition)s )
 {
@@ -25,6 +25,10 @@ template_frozen_modules = """\
 // any.
 #include <Python.h>
 
+#if !defined(_WIN32)
+#include <sys/mman.h>
+#endif
+
 #include "nuitka/constants_blob.h"
 
 // Blob from which modules are unstreamed.
@@ -63,6 +67,58 @@ void copyFrozenModulesTo( struct _frozen *destination )
         destination += 1;
     };
 }
+
+// The ranges of the blob read at startup, the data of the modules imported
+// then is put there in the order of use, if startup layout was requested.
+struct startup_range {
+    ssize_t start;
+    ssize_t size;
+};
+
+#if defined(_WIN32)
+static unsigned char volatile startup_touched;
+#endif
+
+void prefetchStartupData( void )
+{
+    struct startup_range startup_ranges[] = {
+%(startup_ranges)s
+        { 0, 0 }
+    };
+
+    struct startup_range *current = startup_ranges;
+
+    while ( current->size != 0 )
+    {
+        unsigned char const *data = &constant_bin[ current->start ];
+
+#if defined(_WIN32)
+        // Touch the pages in order, so they are read sequentially rather than
+        // in the order of use.
+        unsigned char touched = 0;
+
+        for ( ssize_t offset = 0; offset < current->size; offset += 4096 )
+        {
+            touched ^= data[ offset ];
+        }
+
+        startup_touched = touched;
+#else
+        // Ask for the pages to be read ahead, all in one go, while the
+        // interpreter initializes.
+        uintptr_t page_size = (uintptr_t)sysconf( _SC_PAGESIZE );
+        uintptr_t start = (uintptr_t)data & ~( page_size - 1 );
+
+        posix_madvise(
+            (void *)start,
+            (uintptr_t)data + current->size - start,
+            POSIX_MADV_WILLNEED
+        );
+#endif
+
+        current += 1;
+    }
+}
 """
 
 
@@ -21,9 +21,9 @@
 
 template_genfunc_yielder_decl_template = """\
 #if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-static PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value );
+NUITKA_LOCAL_MODULE PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value );
 #else
-static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator );
+NUITKA_LOCAL_MODULE void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator );
 #endif
 """
 
@@ -32,28 +32,50 @@ template_genfunc_yielder_body_template = """
 struct %(function_identifier)s_locals {
 %(function_local_types)s
 };
+
+// The local variables are kept in the heap storage of the generator.
+%(function_heap_defines)s
 #endif
 
 #if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-static PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+NUITKA_LOCAL_MODULE PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
 #else
-static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator )
+NUITKA_LOCAL_MODULE void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator )
 #endif
 {
     CHECK_OBJECT( (PyObject *)generator );
     assert( Nuitka_Generator_Check( (PyObject *)generator ) );
 
-    // Local variable initialization
-%(function_var_inits)s
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    struct %(function_identifier)s_locals *generator_heap = (struct %(function_identifier)s_locals *)generator->m_heap_storage;
+#endif
 
     // Dispatch to yield based on return label index:
 %(function_dispatch)s
 
+    // Local variable initialization
+%(function_var_inits)s
+
     // Actual function code.
 %(function_body)s
 
 %(generator_exit)s
 }
+
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+%(function_heap_undefs)s
+#endif
+"""
+
+template_generator_heap_storage_init = """\
+generator->m_heap_storage = PyMem_Malloc( sizeof( struct %(function_identifier)s_locals ) );
+
+if (unlikely( generator->m_heap_storage == NULL ))
+{
+    return PyErr_NoMemory();
+}
+
+generator_heap = (struct %(function_identifier)s_locals *)generator->m_heap_storage;
 """
 
 template_generator_exception_exit = """\
@@ -94,7 +116,11 @@ template_generator_return_exit = """\
     // The above won't return, but we need to make it clear to the compiler
     // as well, or else it will complain and/or generate inferior code.
     assert(false);
+#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    return NULL;
+#else
     return;
+#endif
 
     function_return_exit:
 #if PYTHON_VERSION >= 330
@@ -119,6 +145,43 @@ template_generator_return_exit = """\
 #endif
 """
 
+template_generator_yield = """\
+%(swap_handler_exception)s\
+Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+generator->m_yield_return_index = %(yield_return_index)d;
+return %(yielded_value)s;
+%(yield_return_label)s:
+%(swap_handler_exception)s\
+%(to_name)s = GENERATOR_YIELD_RESUME( generator, yield_return_value );
+"""
+
+template_generator_yield_from = """\
+yield_return_value = NULL;
+%(yield_return_label)s:
+%(swap_handler_exception_on_resume)s\
+{
+    PyObject *yielded = GENERATOR_YIELD_FROM_STEP( generator, %(iterator_name)s, yield_return_value, &%(to_name)s );
+
+    if ( yielded != NULL )
+    {
+%(swap_handler_exception)s\
+        generator->m_yield_return_index = %(yield_return_index)d;
+        return yielded;
+    }
+}
+"""
+
+template_generator_swap_handler_exception = """\
+GENERATOR_SWAP_HANDLER_EXCEPTION();
+"""
+
+template_generator_swap_handler_exception_on_resume = """\
+if ( yield_return_value != NULL )
+{
+    GENERATOR_SWAP_HANDLER_EXCEPTION();
+}
+"""
+
 template_generator_making = """\
 %(to_name)s = Nuitka_Generator_New(
     %(generator_identifier)s_context,
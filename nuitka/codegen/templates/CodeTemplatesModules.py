@@ -45,7 +45,7 @@ template_module_body_template = """
 #include "nuitka/prelude.h"
 
 #include "__helpers.h"
-
+%(module_header_include)s
 /* The _module_%(module_identifier)s is a Python object pointer of module type. */
 
 /* Note: For full compatibility with CPython, every module variable access
@@ -86,6 +86,8 @@ static void createModuleCodeObjects(void)
 %(module_code_objects_init)s
 }
 
+%(type_feedback_decl)s
+
 // The module function declarations.
 %(module_functions_decl)s
 
@@ -179,6 +181,10 @@ MOD_INIT_DECL( %(module_identifier)s )
     patchBuiltinModule();
     patchTypeComparison();
 
+#if _NUITKA_RUNTIME_STATS
+    registerRuntimeStatsModule();
+#endif
+
     // Enable meta path based loader if not already done.
     setupMetaPathBasedLoader();
 
@@ -193,12 +199,15 @@ MOD_INIT_DECL( %(module_identifier)s )
     puts("%(module_name)s: Calling createModuleConstants().");
 #endif
     createModuleConstants();
+    markImportTimeTrace( IMPORT_TIME_PHASE_CONSTANTS );
 
     /* The code objects used by this module are created now. */
 #ifdef _NUITKA_TRACE
     puts("%(module_name)s: Calling createModuleCodeObjects().");
 #endif
     createModuleCodeObjects();
+    markImportTimeTrace( IMPORT_TIME_PHASE_CODE_OBJECTS );
+%(type_feedback_init)s
 
     // puts( "in init%(module_identifier)s" );
 
@@ -273,6 +282,43 @@ MOD_INIT_DECL( %(module_identifier)s )
 %(module_exit)s
 """
 
+template_module_header_template = """
+// Declarations shared by the files the code of module '%(module_name)s' is
+// split into, things local to the module are visible to all of them.
+#undef NUITKA_LOCAL_MODULE
+#define NUITKA_LOCAL_MODULE
+
+// These names are the same in all modules, make them unique.
+#define module_filename_obj module_filename_obj_%(module_identifier)s
+#define type_feedback_sites type_feedback_sites_%(module_identifier)s
+
+extern PyObject *module_%(module_identifier)s;
+extern PyDictObject *moduledict_%(module_identifier)s;
+
+/* The module constants used, if any. */
+%(constant_decl_codes)s
+
+// The module code objects.
+%(module_code_objects_decl)s
+%(type_feedback_decl)s
+// The module function declarations.
+%(module_functions_decl)s
+
+// The entry points of the functions, for their makers.
+%(module_functions_entries)s
+"""
+
+template_module_part_template = """
+#include "nuitka/prelude.h"
+
+#include "__helpers.h"
+
+#include "%(module_header_name)s"
+
+// The module function definitions, part %(part_number)d.
+%(module_functions_code)s
+"""
+
 template_module_exception_exit = """\
     module_exception_exit:
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
@@ -282,6 +328,48 @@ template_module_exception_exit = """\
 template_module_noexception_exit = """\
 }"""
 
+template_lazy_code_object = """\
+NUITKA_LOCAL_MODULE PyCodeObject *_%(code_identifier)s = NULL;
+
+NUITKA_LOCAL_MODULE PyCodeObject *_make_%(code_identifier)s( void )
+{
+    _%(code_identifier)s = %(code_creation)s;
+
+    return _%(code_identifier)s;
+}
+
+#define %(code_identifier)s ( likely( _%(code_identifier)s != NULL ) ? _%(code_identifier)s : _make_%(code_identifier)s() )
+"""
+
+template_lazy_code_object_decl = """\
+extern PyCodeObject *_%(code_identifier)s;
+extern PyCodeObject *_make_%(code_identifier)s( void );
+
+#define %(code_identifier)s ( likely( _%(code_identifier)s != NULL ) ? _%(code_identifier)s : _make_%(code_identifier)s() )
+"""
+
+template_type_feedback_sites_decl = """\
+// The sites recording type feedback.
+NUITKA_LOCAL_MODULE struct Nuitka_TypeFeedbackSite type_feedback_sites[] =
+{
+%(site_entries)s
+};
+
+static struct Nuitka_TypeFeedbackSites type_feedback_sites_registration =
+{
+    type_feedback_sites,
+    %(site_count)d,
+    NULL
+};
+"""
+
+template_type_feedback_sites_extern_decl = """\
+extern struct Nuitka_TypeFeedbackSite type_feedback_sites[];
+"""
+
+template_type_feedback_sites_init = """\
+    registerTypeFeedbackSites( &type_feedback_sites_registration );"""
+
 template_helper_impl_decl = """\
 // This file contains helper functions that are automatically created from
 // templates.
@@ -0,0 +1,205 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Layered dictionary, a copy on write mapping with cheap branching.
+
+A layered dictionary keeps its own changes in a plain dictionary, on top of
+a chain of frozen layers, which may be shared with other layered dictionaries.
+Making a branch freezes the pending changes into a new layer, and then both
+continue on top of it, which is O(1) rather than copying all the values.
+
+Because branches remember where they split, the keys that can differ between
+branches are only the ones in layers added after their common layer. This is
+what "getLayeredDictsDifferences" provides, and what makes merging of the
+branches cheap for trace collections.
+"""
+
+# Every this many layers, a layer also holds all the values, so that look-ups
+# never need to visit more layers than that.
+_full_layer_interval = 8
+
+
+class _LayeredDictLayer(object):
+    __slots__ = ("values", "parent", "depth", "full")
+
+    def __init__(self, values, parent):
+        # Changes of this layer, these are never modified once frozen.
+        self.values = values
+        self.parent = parent
+
+        if parent is None:
+            self.depth = 1
+            self.full = values
+        else:
+            self.depth = parent.depth + 1
+            self.full = None
+
+            if self.depth % _full_layer_interval == 0:
+                self.full = self.getAllValues()
+
+    def getAllValues(self):
+        layers = []
+
+        layer = self
+        while layer.full is None:
+            layers.append(layer)
+            layer = layer.parent
+
+        result = dict(layer.full)
+        for layer in reversed(layers):
+            result.update(layer.values)
+
+        return result
+
+
+def _getCommonLayer(layer1, layer2):
+    while layer1 is not layer2:
+        if layer1 is None or layer2 is None:
+            return None
+
+        if layer1.depth > layer2.depth:
+            layer1 = layer1.parent
+        elif layer2.depth > layer1.depth:
+            layer2 = layer2.parent
+        else:
+            layer1 = layer1.parent
+            layer2 = layer2.parent
+
+    return layer1
+
+
+class LayeredDict(object):
+    __slots__ = ("base", "values")
+
+    def __init__(self, base = None):
+        # The frozen layers shared with other layered dictionaries.
+        self.base = base
+
+        # The changes done to this one only.
+        self.values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            layer = self.base
+
+            while layer is not None:
+                if layer.full is not None:
+                    return layer.full[key]
+
+                if key in layer.values:
+                    return layer.values[key]
+
+                layer = layer.parent
+
+            raise
+
+    def __setitem__(self, key, value):
+        self.values[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def get(self, key, default = None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _getAllValues(self):
+        if self.base is None:
+            return self.values
+
+        result = self.base.getAllValues()
+        result.update(self.values)
+
+        return result
+
+    def keys(self):
+        return list(self._getAllValues())
+
+    def items(self):
+        return list(self._getAllValues().items())
+
+    # Python2 name, used by "iterItems".
+    iteritems = items
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._getAllValues())
+
+    def update(self, other):
+        for key, value in other.items():
+            self.values[key] = value
+
+    def clear(self):
+        self.base = None
+        self.values = {}
+
+    def freeze(self):
+        """ Freeze the pending changes into a shared layer and return it. """
+
+        if self.values:
+            self.base = _LayeredDictLayer(self.values, self.base)
+            self.values = {}
+
+        return self.base
+
+    def branch(self):
+        """ Make a layered dictionary with the same content, in O(1). """
+
+        return LayeredDict(self.freeze())
+
+
+def getLayeredDictsDifferences(dicts):
+    """ Find the common layer of layered dictionaries and their changes.
+
+    Returns the nearest layer all of the dictionaries are based on, and for
+    each of them a dictionary of the values set after that layer. All other
+    keys have the values of the common layer in each of them.
+    """
+
+    common = dicts[0].base
+    for ldict in dicts[1:]:
+        common = _getCommonLayer(common, ldict.base)
+
+    result = []
+
+    for ldict in dicts:
+        layers = []
+
+        layer = ldict.base
+        while layer is not common:
+            layers.append(layer)
+            layer = layer.parent
+
+        changes = {}
+        for layer in reversed(layers):
+            changes.update(layer.values)
+        changes.update(ldict.values)
+
+        result.append(changes)
+
+    return common, result
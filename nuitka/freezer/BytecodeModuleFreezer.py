@@ -39,7 +39,7 @@ from nuitka.ModuleRegistry import getUncompiledTechnicalModules
 
 stream_data = ConstantCodes.stream_data
 
-def generateBytecodeFrozenCode():
+def generateBytecodeFrozenCode(startup_ranges):
     frozen_defs = []
 
     for uncompiled_module in getUncompiledTechnicalModules():
@@ -65,6 +65,13 @@ def generateBytecodeFrozenCode():
         if Options.isShowInclusion():
             info("Embedded as frozen module '%s'.", module_name)
 
+    startup_range_defs = [
+        "{ %d, %d }," % (start, size)
+        for start, size in
+        startup_ranges
+    ]
+
     return template_frozen_modules % {
-        "frozen_modules" : indented(frozen_defs, 2)
+        "frozen_modules" : indented(frozen_defs, 2),
+        "startup_ranges" : indented(startup_range_defs, 2)
     }
@@ -0,0 +1,287 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Installing DLLs and extension modules into the dist folder.
+
+Standalone builds of the same program, or of programs using the same
+packages, put the same binaries into every dist folder. With a link mode
+other than "copy", these are kept in a content addressed store in the
+Nuitka cache directory, and only hardlinks or reflinks are made to them.
+
+Files in the store are shared, so they are never changed after being
+added. Fixups, e.g. the removal of "RPATH", are done on a private copy
+before it is added, and are part of the key of the store.
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import sys
+import threading
+
+from nuitka import Options
+from nuitka.utils import Utils
+from nuitka.utils.AppDirs import getCacheDir
+
+# The Linux ioctl to share the extents of one file with another, where the
+# file system supports it, e.g. btrfs and xfs.
+_FICLONE = 0x40049409
+
+
+def getDistStoreDir():
+    return os.path.join(getCacheDir(), "dist-store")
+
+
+def _writeStoreFile(filename, contents):
+    if not os.path.isdir(os.path.dirname(filename)):
+        try:
+            os.makedirs(os.path.dirname(filename))
+        except OSError:
+            # Another build may have created it in the mean time.
+            pass
+
+    # Other builds may be using the store at the same time, so make sure to
+    # never expose incomplete files.
+    tmp_filename = "%s.%d.%s" % (
+        filename,
+        os.getpid(),
+        threading.current_thread().ident
+    )
+
+    contents(tmp_filename)
+
+    try:
+        os.rename(tmp_filename, filename)
+    except OSError:
+        # On Windows, renaming over an existing file fails, but then another
+        # build was just faster adding it.
+        os.unlink(tmp_filename)
+
+        if not os.path.exists(filename):
+            raise
+
+
+def _getContentHash(filename):
+    # Hashing the content of big DLLs costs about as much as copying them,
+    # so remember it for unchanged files.
+    stat_result = os.stat(filename)
+
+    index_key = hashlib.md5(
+        repr(
+            (
+                os.path.abspath(filename),
+                stat_result.st_size,
+                stat_result.st_mtime,
+                stat_result.st_ino
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+
+    index_filename = os.path.join(
+        getDistStoreDir(),
+        "index",
+        index_key[:2],
+        index_key
+    )
+
+    if os.path.exists(index_filename):
+        with open(index_filename) as index_file:
+            return index_file.read()
+
+    key = hashlib.md5()
+
+    with open(filename, "rb") as input_file:
+        while True:
+            chunk = input_file.read(1024 * 1024)
+
+            if not chunk:
+                break
+
+            key.update(chunk)
+
+    result = key.hexdigest()
+
+    def writeIndexFile(tmp_filename):
+        with open(tmp_filename, 'w') as index_file:
+            index_file.write(result)
+
+    _writeStoreFile(index_filename, writeIndexFile)
+
+    return result
+
+
+def _getStoreKey(filename, fixup_key):
+    key = hashlib.md5()
+    key.update(_getContentHash(filename).encode("utf-8"))
+
+    if fixup_key is not None:
+        key.update(b"\0")
+        key.update(fixup_key.encode("utf-8"))
+
+    return key.hexdigest()
+
+
+def _makeReadOnly(filename):
+    # On Windows, read-only files prevent the removal of the dist folder,
+    # and hardlinks share that attribute.
+    if Utils.getOS() == "Windows":
+        return
+
+    mode = os.stat(filename).st_mode
+
+    os.chmod(
+        filename,
+        mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def _getStoreFilename(source_filename, fixup, fixup_key):
+    store_key = _getStoreKey(source_filename, fixup_key)
+
+    store_filename = os.path.join(
+        getDistStoreDir(),
+        store_key[:2],
+        store_key
+    )
+
+    if os.path.exists(store_filename):
+        return store_filename
+
+    def addStoreFile(tmp_filename):
+        shutil.copy(source_filename, tmp_filename)
+
+        # Only private copies are fixed up, files in the store are shared.
+        if fixup is not None:
+            fixup(tmp_filename)
+
+        _makeReadOnly(tmp_filename)
+
+    _writeStoreFile(store_filename, addStoreFile)
+
+    return store_filename
+
+
+def _reflinkFile(source_filename, target_filename):
+    try:
+        import fcntl
+
+        with open(source_filename, "rb") as source_file:
+            with open(target_filename, "wb") as target_file:
+                fcntl.ioctl(target_file.fileno(), _FICLONE, source_file.fileno())
+    except (ImportError, IOError, OSError):
+        # No Linux, or the file system cannot do it, e.g. across devices.
+        shutil.copyfile(source_filename, target_filename)
+
+    shutil.copymode(source_filename, target_filename)
+
+
+def _hardlinkFile(source_filename, target_filename):
+    try:
+        os.link(source_filename, target_filename)
+    except (AttributeError, OSError):
+        # Python2 on Windows has no "os.link", and hardlinks cannot cross
+        # devices, make a copy then.
+        shutil.copy(source_filename, target_filename)
+
+
+def installDistFile(source_filename, target_filename, fixup = None,
+                    fixup_key = None):
+    """ Make target file a copy of the source file, with fixup applied.
+
+        The fixup is called with the filename to change in place, and the
+        fixup key must identify all it does, as it becomes part of the
+        store key for link modes.
+    """
+
+    link_mode = Options.getDistLinkMode()
+
+    if link_mode == "copy":
+        shutil.copy(source_filename, target_filename)
+
+        if fixup is not None:
+            fixup(target_filename)
+
+        return
+
+    store_filename = _getStoreFilename(
+        source_filename = source_filename,
+        fixup           = fixup,
+        fixup_key       = fixup_key
+    )
+
+    # Do not write through an existing link into the store.
+    if os.path.exists(target_filename):
+        os.unlink(target_filename)
+
+    if link_mode == "hardlink":
+        _hardlinkFile(store_filename, target_filename)
+    elif link_mode == "reflink":
+        _reflinkFile(store_filename, target_filename)
+    else:
+        assert False, link_mode
+
+
+def runParallel(jobs):
+    """ Run the given functions in parallel, up to the job limit.
+
+        These are used for fixups of installed files, which are mostly
+        waiting for external programs, so threads are good enough. The
+        first error is raised again, which includes "sys.exit" calls.
+    """
+
+    jobs = list(jobs)
+    jobs.reverse()
+
+    job_limit = min(Options.getJobLimit(), len(jobs))
+
+    if job_limit <= 1:
+        while jobs:
+            jobs.pop()()
+
+        return
+
+    lock = threading.Lock()
+    errors = []
+
+    def runJobs():
+        while True:
+            with lock:
+                if errors or not jobs:
+                    return
+
+                job = jobs.pop()
+
+            try:
+                job()
+            except BaseException: # Re-raised, pylint: disable=broad-except
+                with lock:
+                    errors.append(sys.exc_info()[1])
+
+    threads = [
+        threading.Thread(target = runJobs)
+        for _count in range(job_limit)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
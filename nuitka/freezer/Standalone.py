@@ -22,9 +22,9 @@ MacOS, Windows, and Linux. Patches for other platforms are
 very welcome.
 """
 
+import functools
 import marshal
 import os
-import shutil
 import subprocess
 import sys
 from logging import debug, info, warning
@@ -55,6 +55,7 @@ from nuitka.utils.FileOperations import (
 from nuitka.utils.Timing import TimerReport
 
 from .DependsExe import getDependsExePath
+from .DistFiles import installDistFile, runParallel
 
 
 def loadCodeObjectData(precompiled_filename):
@@ -982,6 +983,14 @@ def copyUsedDLLs(dist_dir, standalone_entry_points):
 
     used_dlls = detectUsedDLLs(standalone_entry_points)
 
+    # DLLs found in the dist folder itself were put there for an earlier
+    # build, e.g. the one for PGO training, and are in place already.
+    dist_dir_prefix = os.path.join(os.path.abspath(dist_dir), "")
+
+    for dll_filename in tuple(used_dlls):
+        if os.path.abspath(dll_filename).startswith(dist_dir_prefix):
+            del used_dlls[dll_filename]
+
     # Fist make checks and remove some.
     for dll_filename1, sources1 in tuple(iterItems(used_dlls)):
         for dll_filename2, sources2 in tuple(iterItems(used_dlls)):
@@ -1038,16 +1047,6 @@ different from
     for dll_filename, sources in iterItems(used_dlls):
         dll_name = os.path.basename(dll_filename)
 
-        target_path = os.path.join(
-            dist_dir,
-            dll_name
-        )
-
-        shutil.copy(
-            dll_filename,
-            target_path
-        )
-
         dll_map.append(
             (dll_filename, dll_name)
         )
@@ -1063,32 +1062,59 @@ different from
     if Utils.getOS() == "Darwin":
         # For MacOS, the binary and the DLLs needs to be changed to reflect
         # the relative DLL location in the ".dist" folder.
-        for standalone_entry_point in standalone_entry_points:
-            fixupBinaryDLLPaths(
-                binary_filename = standalone_entry_point[1],
-                is_exe          = standalone_entry_point is standalone_entry_points[0],
-                dll_map         = dll_map
-            )
-
-        for _original_path, dll_filename in dll_map:
-            fixupBinaryDLLPaths(
-                binary_filename = os.path.join(
-                    dist_dir,
-                    dll_filename
-                ),
-                is_exe          = False,
-                dll_map         = dll_map
-            )
+        fixupBinaryDLLPaths(
+            binary_filename = standalone_entry_points[0][1],
+            is_exe          = True,
+            dll_map         = dll_map
+        )
 
-    if Utils.getOS() == "Linux":
+        fixup = functools.partial(
+            fixupBinaryDLLPaths,
+            is_exe  = False,
+            dll_map = dll_map
+        )
+        fixup_key = repr(dll_map)
+    elif Utils.getOS() == "Linux":
         # For Linux, the "rpath" of libraries may be an issue and must be
         # removed.
-        for _original_path, dll_filename in dll_map:
-            removeSharedLibraryRPATH(
-                os.path.join(dist_dir, dll_filename)
+        fixup = removeSharedLibraryRPATH
+        fixup_key = "rpath"
+    else:
+        fixup = None
+        fixup_key = None
+
+    jobs = []
+
+    for dll_filename, dll_name in dll_map:
+        jobs.append(
+            functools.partial(
+                installDistFile,
+                source_filename = dll_filename,
+                target_filename = os.path.join(dist_dir, dll_name),
+                fixup           = fixup,
+                fixup_key       = fixup_key
             )
+        )
 
+    # The extension modules are already installed, but not yet fixed up.
+    if fixup is not None:
         for standalone_entry_point in standalone_entry_points[1:]:
-            removeSharedLibraryRPATH(
-                standalone_entry_point[1]
-            )
+            if Options.getDistLinkMode() == "copy":
+                jobs.append(
+                    functools.partial(
+                        fixup,
+                        standalone_entry_point[1]
+                    )
+                )
+            else:
+                jobs.append(
+                    functools.partial(
+                        installDistFile,
+                        source_filename = standalone_entry_point[0],
+                        target_filename = standalone_entry_point[1],
+                        fixup           = fixup,
+                        fixup_key       = fixup_key
+                    )
+                )
+
+    runParallel(jobs)
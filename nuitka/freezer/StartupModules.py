@@ -0,0 +1,108 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Modules imported at startup, in the order they are imported.
+
+Programs import most of their modules at startup, through imports at module
+level, starting from the main module. These modules are found from the node
+tree for compiled modules, and from the recorded uses for bytecode modules,
+which is an approximation, as e.g. imports under conditions are included too.
+That is good enough for laying out their data in the binary, because nothing
+is executed early due to it.
+"""
+
+from nuitka import ModuleRegistry
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+
+
+class _ModuleLevelImportsCollector(VisitorNoopMixin):
+    def __init__(self):
+        self.module_names = []
+
+    def onEnterNode(self, node):
+        if node.isExpressionBuiltinImport():
+            imported_module = node.getImportedModule()
+
+            if imported_module is not None:
+                self.module_names.append(imported_module.getFullName())
+                self.module_names.extend(node.getImportListModules())
+        elif node.isExpressionImportModuleHard():
+            self.module_names.append(node.getModuleName())
+
+
+def _getImportedModuleNames(module):
+    if module.isCompiledPythonModule():
+        # Function bodies are not visited, as these are not children of the
+        # module, which limits this to imports done at module level.
+        collector = _ModuleLevelImportsCollector()
+        visitTree(module, collector)
+
+        return collector.module_names
+    elif module.isUncompiledPythonModule():
+        return list(module.getUsedModules())
+    else:
+        return ()
+
+
+def getStartupModules(main_module):
+    """ Modules imported at startup of the program, in import order.
+
+    The technical modules come first, as these are loaded by the Python
+    initialization already, then the main module and its imports, depth
+    first.
+    """
+
+    result = []
+    seen = set()
+
+    def addModule(module):
+        if module is None or module in seen:
+            return
+
+        seen.add(module)
+
+        # The package is imported before its modules.
+        if module.getPackage() is not None:
+            addModule(ModuleRegistry.getModuleByName(module.getPackage()))
+
+        # The module is read before it is executed, and imports others.
+        result.append(module)
+
+        for module_name in _getImportedModuleNames(module):
+            addModule(ModuleRegistry.getModuleByName(module_name))
+
+    for module in ModuleRegistry.getUncompiledTechnicalModules():
+        addModule(module)
+
+    addModule(main_module)
+
+    return result
+
+
+def getModulesInStartupOrder(modules, startup_modules):
+    """ Sort modules, with the ones imported at startup first, in order. """
+
+    startup_order = dict(
+        (module, count)
+        for count, module in
+        enumerate(startup_modules)
+    )
+
+    return sorted(
+        modules,
+        key = lambda module: startup_order.get(module, len(startup_order))
+    )
@@ -33,17 +33,26 @@ from nuitka.utils.FileOperations import relpath
 imported_modules = {}
 imported_by_name = {}
 
-def addImportedModule(imported_module):
+# Index by the relative path only, for the first module registered with it,
+# to avoid scanning all entries.
+imported_by_path = {}
+
+
+def _getModuleKey(imported_module):
     module_filename = relpath(imported_module.getFilename())
 
     if os.path.basename(module_filename) == "__init__.py":
         module_filename = os.path.dirname(module_filename)
 
-    key = (
+    return (
         module_filename,
         imported_module.getFullName()
     )
 
+
+def addImportedModule(imported_module):
+    key = _getModuleKey(imported_module)
+
     if key in imported_modules:
         assert imported_module is imported_modules[key], key
     else:
@@ -51,17 +60,14 @@ def addImportedModule(imported_module):
 
     imported_modules[key] = imported_module
     imported_by_name[imported_module.getFullName()] = imported_module
+    imported_by_path.setdefault(key[0], imported_module)
 
     # We don't expect that to happen.
     assert not imported_module.isMainModule()
 
 
 def isImportedModuleByPath(module_relpath):
-    for key in imported_modules:
-        if key[0] == module_relpath:
-            return True
-
-    return False
+    return module_relpath in imported_by_path
 
 
 def isImportedModuleByName(full_name):
@@ -73,24 +79,17 @@ def getImportedModuleByName(full_name):
 
 
 def getImportedModuleByPath(module_relpath):
-    for key in imported_modules:
-        if key[0] == module_relpath:
-            return imported_modules[key]
-
-    raise KeyError(module_relpath)
+    return imported_by_path[module_relpath]
 
 
 def replaceImportedModule(old, new):
-    for key, value in imported_by_name.items():
-        if value == old:
-            imported_by_name[key] = new
-            break
-    else:
-        assert False
+    key = _getModuleKey(old)
 
-    for key, value in imported_modules.items():
-        if value == old:
-            imported_modules[key] = new
-            break
-    else:
-        assert False
+    assert imported_by_name[key[1]] is old
+    imported_by_name[key[1]] = new
+
+    assert imported_modules[key] is old
+    imported_modules[key] = new
+
+    if imported_by_path.get(key[0]) is old:
+        imported_by_path[key[0]] = new
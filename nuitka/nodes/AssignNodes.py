@@ -376,10 +376,14 @@ Removed assignment of %s from itself which is known to be defined.""" % variable
                                        self.getVariableName()
                                     )
                                 )
-                    else:
-                        # Something might be possible still.
-
-                        pass
+                    elif source.isExpressionConstantRef():
+                        # Mutable constants, that are only looked at, can be
+                        # used without copying them.
+                        source.setNonEscaping(
+                            not variable.isModuleVariable() and \
+                            not provider.isExpressionClassBody() and \
+                            variable.hasReadOnlyUsagesOnly() is True
+                        )
                 elif False and Options.isExperimental("unnamed_yet") and \
                     source.isExpressionFunctionCreation() and \
                     source.getFunctionRef().getFunctionBody().isExpressionFunctionBody() and \
@@ -35,6 +35,7 @@ and annotation is happening in the nodes that implement these compute slots.
 """
 
 from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
+from nuitka.optimizations.TypeFeedback import getAttributeTypeFeedbackShape
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeBases import StatementChildrenHavingBase
@@ -229,6 +230,124 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
         # either return a new node, or a decision maker.
         return None
 
+    def getTypeFeedbackShape(self):
+        return getAttributeTypeFeedbackShape(self)
+
+    def computeExpressionCall(self, call_node, call_args, call_kw,
+                              trace_collection):
+        new_node = _makeMethodCallNode(
+            source         = self.getLookupSource(),
+            attribute_name = self.getAttributeName(),
+            call_args      = call_args,
+            call_kw        = call_kw,
+            source_ref     = call_node.getSourceReference()
+        )
+
+        result = ExpressionChildrenHavingBase.computeExpressionCall(
+            self,
+            call_node        = call_node,
+            call_args        = call_args,
+            call_kw          = call_kw,
+            trace_collection = trace_collection
+        )
+
+        if new_node is None:
+            return result
+
+        return new_node, "new_expression", """\
+Method call '%s' of known type lowered to direct operation.""" % (
+            self.getAttributeName()
+        )
+
+
+_method_call_makers = None
+
+def _getMethodCallMakers():
+    # Lazy, the node modules import this one, pylint: disable=global-statement
+    global _method_call_makers
+
+    if _method_call_makers is None:
+        from .ContainerOperationNodes import (
+            ExpressionListOperationAppend,
+            ExpressionSetOperationAdd
+        )
+        from .DictionaryNodes import (
+            ExpressionDictOperationMethodGet,
+            ExpressionDictOperationSetdefault
+        )
+        from .StrNodes import (
+            ExpressionStrOperationEndswith,
+            ExpressionStrOperationJoin,
+            ExpressionStrOperationStartswith
+        )
+        from .shapes.BuiltinTypeShapes import (
+            ShapeTypeDict,
+            ShapeTypeList,
+            ShapeTypeSet,
+            ShapeTypeStr
+        )
+
+        # Keyed by shape of the called object, method name, and argument count.
+        _method_call_makers = {
+            (ShapeTypeList, "append", 1)     : ExpressionListOperationAppend,
+            (ShapeTypeSet, "add", 1)         : ExpressionSetOperationAdd,
+            (ShapeTypeDict, "get", 1)        : lambda dict_arg, key, source_ref:
+                ExpressionDictOperationMethodGet(dict_arg, key, None, source_ref),
+            (ShapeTypeDict, "get", 2)        : ExpressionDictOperationMethodGet,
+            (ShapeTypeDict, "setdefault", 1) : lambda dict_arg, key, source_ref:
+                ExpressionDictOperationSetdefault(dict_arg, key, None, source_ref),
+            (ShapeTypeDict, "setdefault", 2) : ExpressionDictOperationSetdefault,
+            (ShapeTypeStr, "startswith", 1)  : ExpressionStrOperationStartswith,
+            (ShapeTypeStr, "endswith", 1)    : ExpressionStrOperationEndswith,
+            (ShapeTypeStr, "join", 1)        : ExpressionStrOperationJoin,
+        }
+
+    return _method_call_makers
+
+
+def _makeMethodCallNode(source, attribute_name, call_args, call_kw, source_ref):
+    """ Make a direct operation node for a method call if possible.
+
+    This only works for calls without keyword arguments, and where the shape of
+    the called object is known to be of exactly a built-in type. Returns None
+    if there is no dedicated node for the call.
+    """
+
+    if call_kw is not None and \
+       (not call_kw.isExpressionConstantRef() or call_kw.getConstant()):
+        return None
+
+    if call_args is None:
+        args = ()
+    elif call_args.isExpressionMakeTuple():
+        args = call_args.getElements()
+    elif call_args.isExpressionConstantRef():
+        from .ConstantRefNodes import makeConstantRefNode
+
+        args = tuple(
+            makeConstantRefNode(
+                constant   = arg,
+                source_ref = source_ref
+            )
+            for arg in
+            call_args.getConstant()
+        )
+    else:
+        return None
+
+    if source.hasShapeDictionaryExact():
+        from .shapes.BuiltinTypeShapes import ShapeTypeDict
+        shape = ShapeTypeDict
+    else:
+        shape = source.getTypeShape()
+
+    maker = _getMethodCallMakers().get((shape, attribute_name, len(args)))
+
+    if maker is None:
+        return None
+
+    return maker(source, *args, source_ref = source_ref)
+
 
 class ExpressionAttributeLookupSpecial(ExpressionAttributeLookup):
     """ Special lookup up an attribute of an object.
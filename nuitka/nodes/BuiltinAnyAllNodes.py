@@ -0,0 +1,44 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+""" Nodes for the calls to the 'any' and 'all' built-ins.
+
+These consume an iterable and stop at the first item with a deciding truth
+value. Generator expressions given to them are normally fused into a loop
+already during tree building, see "ReformulationContractionExpressions".
+"""
+
+from nuitka.optimizations import BuiltinOptimization
+
+from .ExpressionBases import ExpressionBuiltinSingleArgBase
+from .shapes.BuiltinTypeShapes import ShapeTypeBool
+
+
+class ExpressionBuiltinAnyAllBase(ExpressionBuiltinSingleArgBase):
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+
+class ExpressionBuiltinAny(ExpressionBuiltinAnyAllBase):
+    kind = "EXPRESSION_BUILTIN_ANY"
+
+    builtin_spec = BuiltinOptimization.builtin_any_spec
+
+
+class ExpressionBuiltinAll(ExpressionBuiltinAnyAllBase):
+    kind = "EXPRESSION_BUILTIN_ALL"
+
+    builtin_spec = BuiltinOptimization.builtin_all_spec
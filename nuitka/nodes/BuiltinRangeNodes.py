@@ -26,6 +26,7 @@ result of it can be predicted still, and these are interesting for warnings.
 import math
 
 from nuitka.optimizations import BuiltinOptimization
+from nuitka.optimizations.ComputationCache import getBuiltinCallKey
 from nuitka.PythonVersions import python_version
 
 from .ExpressionBases import ExpressionChildrenHavingBase
@@ -104,12 +105,16 @@ class ExpressionBuiltinRangeBase(ExpressionChildrenHavingBase):
             return self, None, None
 
         return trace_collection.getCompileTimeComputationResult(
-            node        = self,
-            computation = lambda : self.builtin_spec.simulateCall(
+            node            = self,
+            computation     = lambda : self.builtin_spec.simulateCall(
                 given_values
             ),
-            description = "Built-in call to '%s' computed." % (
+            description     = "Built-in call to '%s' computed." % (
                 self.builtin_spec.getName()
+            ),
+            computation_key = getBuiltinCallKey(
+                self.builtin_spec,
+                given_values
             )
         )
 
@@ -472,12 +477,16 @@ class ExpressionBuiltinXrangeBase(ExpressionChildrenHavingBase):
             return self, None, None
 
         return trace_collection.getCompileTimeComputationResult(
-            node        = self,
-            computation = lambda : self.builtin_spec.simulateCall(
+            node            = self,
+            computation     = lambda : self.builtin_spec.simulateCall(
                 given_values
             ),
-            description = "Built-in call to '%s' computed." % (
+            description     = "Built-in call to '%s' computed." % (
                 self.builtin_spec.getName()
+            ),
+            computation_key = getBuiltinCallKey(
+                self.builtin_spec,
+                given_values
             )
         )
 
@@ -23,6 +23,7 @@ it that could be in-lined sometimes for more static analysis.
 """
 
 from nuitka.optimizations import BuiltinOptimization
+from nuitka.optimizations.ComputationCache import getBuiltinCallKey
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 
@@ -49,12 +50,16 @@ class ExpressionBuiltinSumBase(ExpressionChildrenHavingBase):
             return self, None, None
 
         return trace_collection.getCompileTimeComputationResult(
-            node        = self,
-            computation = lambda : self.builtin_spec.simulateCall(
+            node            = self,
+            computation     = lambda : self.builtin_spec.simulateCall(
                 given_values
             ),
-            description = "Built-in call to '%s' computed." % (
+            description     = "Built-in call to '%s' computed." % (
                 self.builtin_spec.getName()
+            ),
+            computation_key = getBuiltinCallKey(
+                self.builtin_spec,
+                given_values
             )
         )
 
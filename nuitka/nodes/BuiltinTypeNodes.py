@@ -40,7 +40,9 @@ from .shapes.BuiltinTypeShapes import (
     ShapeTypeBytearray,
     ShapeTypeBytes,
     ShapeTypeIntOrLong,
+    ShapeTypeList,
     ShapeTypeLong,
+    ShapeTypeSet,
     ShapeTypeStr,
     ShapeTypeUnicode
 )
@@ -105,12 +107,18 @@ class ExpressionBuiltinList(ExpressionBuiltinContainerBase):
 
     builtin_spec = BuiltinOptimization.builtin_list_spec
 
+    def getTypeShape(self):
+        return ShapeTypeList
+
 
 class ExpressionBuiltinSet(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_SET"
 
     builtin_spec = BuiltinOptimization.builtin_set_spec
 
+    def getTypeShape(self):
+        return ShapeTypeSet
+
 
 class ExpressionBuiltinFrozenset(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_FROZENSET"
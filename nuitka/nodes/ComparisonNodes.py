@@ -20,6 +20,7 @@
 """
 
 from nuitka import PythonOperators
+from nuitka.optimizations.ComputationCache import getComputationKey
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeMakingHelpers import (
@@ -87,13 +88,23 @@ class ExpressionComparisonBase(ExpressionChildrenHavingBase):
             left_value = left.getCompileTimeConstant()
             right_value = right.getCompileTimeConstant()
 
+            # Identity depends on the objects, not only on their values.
+            if self.comparator in ("Is", "IsNot"):
+                computation_key = None
+            else:
+                computation_key = getComputationKey(
+                    self.getSimulator(),
+                    (left_value, right_value)
+                )
+
             return trace_collection.getCompileTimeComputationResult(
-                node        = self,
-                computation = lambda : self.getSimulator()(
+                node            = self,
+                computation     = lambda : self.getSimulator()(
                     left_value,
                     right_value
                 ),
-                description = "Comparison of constant arguments."
+                description     = "Comparison of constant arguments.",
+                computation_key = computation_key
             )
 
         # The value of these nodes escaped and could change its contents.
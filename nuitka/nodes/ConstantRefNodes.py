@@ -66,8 +66,19 @@ from .shapes.BuiltinTypeShapes import (
 )
 
 
+def _hasMutableElements(constant):
+    if type(constant) is dict:
+        constant = constant.values()
+
+    for element in constant:
+        if isMutable(element):
+            return True
+
+    return False
+
+
 class ExpressionConstantRefBase(CompileTimeConstantExpressionBase):
-    __slots__ = "constant", "user_provided"
+    __slots__ = "constant", "user_provided", "non_escaping"
 
     def __init__(self, constant, source_ref, user_provided = False):
         CompileTimeConstantExpressionBase.__init__(
@@ -82,6 +93,9 @@ class ExpressionConstantRefBase(CompileTimeConstantExpressionBase):
         # Memory saving method, have the attribute only where necessary.
         self.user_provided = user_provided
 
+        # Mutable constants, that are known to not escape, need not be copied.
+        self.non_escaping = False
+
         if not user_provided and isDebug():
             try:
                 if type(constant) in (str, unicode):
@@ -162,6 +176,21 @@ class ExpressionConstantRefBase(CompileTimeConstantExpressionBase):
     def isMutable(self):
         return isMutable(self.constant)
 
+    def setNonEscaping(self, non_escaping):
+        """ Mark a mutable constant value as not escaping.
+
+            This is for values that are only looked up, checked for contained
+            values or iterated, and which therefore need not be copied. If
+            there are mutable elements, these could escape through that
+            though, so only immutable elements are allowed.
+        """
+        self.non_escaping = non_escaping and \
+                            type(self.constant) in (dict, list, set) and \
+                            not _hasMutableElements(self.constant)
+
+    def isNonEscaping(self):
+        return self.non_escaping
+
     def isKnownToBeHashable(self):
         return isHashable(self.constant)
 
@@ -364,6 +393,50 @@ Iteration over constant %s changed to tuple.""" % type(self.constant).__name__
 
         return iter_node, None, None
 
+    def computeExpressionSubscript(self, lookup_node, subscript, trace_collection):
+        # The constant is only looked up, and not mutated.
+        self.setNonEscaping(True)
+
+        return CompileTimeConstantExpressionBase.computeExpressionSubscript(
+            self,
+            lookup_node      = lookup_node,
+            subscript        = subscript,
+            trace_collection = trace_collection
+        )
+
+    def computeExpressionComparisonIn(self, in_node, value_node, trace_collection):
+        if type(self.constant) in (list, set, dict) and \
+           not value_node.isCompileTimeConstant():
+            if type(self.constant) is list:
+                constant = tuple(self.constant)
+            else:
+                constant = frozenset(self.constant)
+
+            result = makeConstantRefNode(
+                constant      = constant,
+                user_provided = self.user_provided,
+                source_ref    = self.getSourceReference()
+            )
+
+            self.replaceWith(result)
+
+            return (
+                in_node,
+                "new_constant", """\
+Check '%s' on constant %s changed to %s.""" % (
+                    in_node.comparator,
+                    type(self.constant).__name__,
+                    type(constant).__name__
+                )
+            )
+
+        return CompileTimeConstantExpressionBase.computeExpressionComparisonIn(
+            self,
+            in_node          = in_node,
+            value_node       = value_node,
+            trace_collection = trace_collection
+        )
+
 
 class ExpressionConstantNoneRef(ExpressionConstantRefBase):
     kind = "EXPRESSION_CONSTANT_NONE_REF"
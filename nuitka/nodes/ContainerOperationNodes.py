@@ -23,6 +23,7 @@ from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeBases import StatementChildrenHavingBase
+from .shapes.BuiltinTypeShapes import ShapeTypeNoneType
 
 
 class StatementListOperationAppend(StatementChildrenHavingBase):
@@ -63,6 +64,46 @@ class StatementListOperationAppend(StatementChildrenHavingBase):
         return self, None, None
 
 
+class ExpressionListOperationAppend(ExpressionChildrenHavingBase):
+    """ Call of "append" method of a list, with the value as result. """
+
+    kind = "EXPRESSION_LIST_OPERATION_APPEND"
+
+    named_children = (
+        "list",
+        "value"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, list_arg, value, source_ref):
+        assert list_arg is not None
+        assert value is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "list"  : list_arg,
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+    getList = ExpressionChildrenHavingBase.childGetter("list")
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+
+    def computeExpression(self, trace_collection):
+        trace_collection.removeKnowledge(self.getList())
+
+        return self, None, None
+
+    def getTypeShape(self):
+        return ShapeTypeNoneType
+
+    def mayRaiseException(self, exception_type):
+        return self.getList().mayRaiseException(exception_type) or \
+               self.getValue().mayRaiseException(exception_type)
+
+
 class ExpressionListOperationExtend(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_LIST_OPERATION_EXTEND"
 
@@ -165,6 +206,60 @@ class StatementSetOperationAdd(StatementChildrenHavingBase):
         return self, None, None
 
 
+class ExpressionSetOperationAdd(ExpressionChildrenHavingBase):
+    """ Call of "add" method of a set, with the value as result. """
+
+    kind = "EXPRESSION_SET_OPERATION_ADD"
+
+    named_children = (
+        "set",
+        "value"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, set_arg, value, source_ref):
+        assert set_arg is not None
+        assert value is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "set"   : set_arg,
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+    getSet = ExpressionChildrenHavingBase.childGetter(
+        "set"
+    )
+    getValue = ExpressionChildrenHavingBase.childGetter(
+        "value"
+    )
+
+    def computeExpression(self, trace_collection):
+        trace_collection.removeKnowledge(self.getSet())
+
+        if not self.getValue().isKnownToBeHashable():
+            # Any exception may be raised.
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        if not self.getValue().isKnownToBeHashable():
+            return True
+
+        for child in self.getVisitableNodes():
+            if child.mayRaiseException(exception_type):
+                return True
+
+        return False
+
+    def getTypeShape(self):
+        return ShapeTypeNoneType
+
+
 class ExpressionSetOperationUpdate(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_SET_OPERATION_UPDATE"
 
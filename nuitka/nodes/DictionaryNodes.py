@@ -449,11 +449,228 @@ class ExpressionDictOperationGet(ExpressionChildrenHavingBase):
     getKey = ExpressionChildrenHavingBase.childGetter("key")
 
     def computeExpression(self, trace_collection):
+        self.getDict().onContentReadOnlyUsage(trace_collection)
+
+        if getFetchingDictCheck(self) is not None:
+            result = ExpressionDictOperationGetFetched(
+                dict_arg   = self.getDict(),
+                key        = self.getKey(),
+                source_ref = self.getSourceReference()
+            )
+
+            return result, "new_expression", """\
+Dictionary look-up after 'in' check uses value found by the check."""
+
         trace_collection.onExceptionRaiseExit(BaseException)
 
         return self, None, None
 
 
+class ExpressionDictOperationGetFetched(ExpressionDictOperationGet):
+    """ Dictionary look-up of a value found by a preceding 'in' check.
+
+    This is the first thing done in the "yes" branch of a conditional
+    statement, that checks the same key in the same dictionary, so the
+    value found there is used without looking it up again. The code for
+    that branch takes it from the check, see "generateDictFetchedBranchCode".
+    """
+
+    kind = "EXPRESSION_DICT_OPERATION_GET_FETCHED"
+
+    def computeExpression(self, trace_collection):
+        self.getDict().onContentReadOnlyUsage(trace_collection)
+
+        # Other optimization may have changed the surroundings, in which case
+        # it has to become a normal look-up again.
+        if getFetchingDictCheck(self) is None:
+            result = ExpressionDictOperationGet(
+                dict_arg   = self.getDict(),
+                key        = self.getKey(),
+                source_ref = self.getSourceReference()
+            )
+
+            return result, "new_expression", """\
+Dictionary look-up no longer follows its 'in' check."""
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return False
+
+
+def _isSameVariableRef(node1, node2):
+    if not node1.isExpressionVariableRef() and \
+       not node1.isExpressionTempVariableRef():
+        return False
+
+    if not node2.isExpressionVariableRef() and \
+       not node2.isExpressionTempVariableRef():
+        return False
+
+    return node1.getVariable() is node2.getVariable()
+
+
+def getFetchingDictCheck(lookup_node):
+    """ Find the dictionary 'in' check that may provide the looked up value.
+
+    This is for code like "if k in d: v = d[k]", where the look-up is done
+    directly after the check, using the same variables. Returns None if
+    that is not the case.
+    """
+
+    statement = lookup_node.getParent()
+
+    if statement.isStatementAssignmentVariable():
+        if statement.getAssignSource() is not lookup_node:
+            return None
+    elif statement.isStatementReturn():
+        if statement.getExpression() is not lookup_node:
+            return None
+    else:
+        return None
+
+    statements = statement.getParent()
+
+    if statements.isStatementsFrame() or \
+       statements.getStatements()[0] is not statement:
+        return None
+
+    conditional = statements.getParent()
+
+    if not conditional.isStatementConditional() or \
+       conditional.getBranchYes() is not statements:
+        return None
+
+    condition = conditional.getCondition()
+
+    if not condition.isExpressionDictOperationIn():
+        return None
+
+    if not _isSameVariableRef(condition.getDict(), lookup_node.getDict()) or \
+       not _isSameVariableRef(condition.getKey(), lookup_node.getKey()):
+        return None
+
+    return condition
+
+
+class ExpressionDictOperationMethodGet(ExpressionChildrenHavingBase):
+    """ Call of "get" method of a dictionary, default is optional. """
+
+    kind = "EXPRESSION_DICT_OPERATION_METHOD_GET"
+
+    named_children = (
+        "dict",
+        "key",
+        "default"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, dict_arg, key, default, source_ref):
+        assert dict_arg is not None
+        assert key is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "dict"    : dict_arg,
+                "key"     : key,
+                "default" : default
+            },
+            source_ref = source_ref
+        )
+
+    getDict = ExpressionChildrenHavingBase.childGetter("dict")
+    getKey = ExpressionChildrenHavingBase.childGetter("key")
+    getDefault = ExpressionChildrenHavingBase.childGetter("default")
+
+    def computeExpression(self, trace_collection):
+        dict_arg = self.getDict()
+        key = self.getKey()
+        default = self.getDefault()
+
+        if dict_arg.isCompileTimeConstant() and \
+           key.isCompileTimeConstant() and \
+           (default is None or default.isCompileTimeConstant()):
+            return trace_collection.getCompileTimeComputationResult(
+                node        = self,
+                computation = lambda : dict_arg.getCompileTimeConstant().get(
+                    key.getCompileTimeConstant(),
+                    None if default is None else default.getCompileTimeConstant()
+                ),
+                description = "Dictionary 'get' method call with constant arguments."
+            )
+
+        dict_arg.onContentReadOnlyUsage(trace_collection)
+
+        if not key.isKnownToBeHashable():
+            # Any exception may be raised.
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        key = self.getKey()
+
+        if not key.isKnownToBeHashable():
+            return True
+
+        for child in self.getVisitableNodes():
+            if child.mayRaiseException(exception_type):
+                return True
+
+        return False
+
+
+class ExpressionDictOperationSetdefault(ExpressionChildrenHavingBase):
+    """ Call of "setdefault" method of a dictionary, default is optional. """
+
+    kind = "EXPRESSION_DICT_OPERATION_SETDEFAULT"
+
+    named_children = (
+        "dict",
+        "key",
+        "default"
+    )
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, dict_arg, key, default, source_ref):
+        assert dict_arg is not None
+        assert key is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "dict"    : dict_arg,
+                "key"     : key,
+                "default" : default
+            },
+            source_ref = source_ref
+        )
+
+    getDict = ExpressionChildrenHavingBase.childGetter("dict")
+    getKey = ExpressionChildrenHavingBase.childGetter("key")
+    getDefault = ExpressionChildrenHavingBase.childGetter("default")
+
+    def computeExpression(self, trace_collection):
+        trace_collection.removeKnowledge(self.getDict())
+
+        if not self.getKey().isKnownToBeHashable():
+            # Any exception may be raised.
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        if not self.getKey().isKnownToBeHashable():
+            return True
+
+        for child in self.getVisitableNodes():
+            if child.mayRaiseException(exception_type):
+                return True
+
+        return False
+
+
 class StatementDictOperationUpdate(StatementChildrenHavingBase):
     kind = "STATEMENT_DICT_OPERATION_UPDATE"
 
@@ -524,10 +741,39 @@ class ExpressionDictOperationIn(ExpressionChildrenHavingBase):
     getKey = ExpressionChildrenHavingBase.childGetter("key")
 
     def computeExpression(self, trace_collection):
+        self.getDict().onContentReadOnlyUsage(trace_collection)
+
         trace_collection.onExceptionRaiseExit(BaseException)
 
         return self, None, None
 
+    def isValueFetched(self):
+        """ Is the value found by this check used by a following look-up.
+
+        See "getFetchingDictCheck" for when that is the case.
+        """
+        conditional = self.getParent()
+
+        if not conditional.isStatementConditional() or \
+           conditional.getCondition() is not self:
+            return False
+
+        yes_branch = conditional.getBranchYes()
+
+        if yes_branch is None:
+            return False
+
+        statement = yes_branch.getStatements()[0]
+
+        if statement.isStatementAssignmentVariable():
+            lookup_node = statement.getAssignSource()
+        elif statement.isStatementReturn():
+            lookup_node = statement.getExpression()
+        else:
+            return False
+
+        return lookup_node.isExpressionDictOperationGetFetched()
+
 
 class ExpressionDictOperationNOTIn(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_DICT_OPERATION_NOT_IN"
@@ -557,6 +803,8 @@ class ExpressionDictOperationNOTIn(ExpressionChildrenHavingBase):
     getKey = ExpressionChildrenHavingBase.childGetter("key")
 
     def computeExpression(self, trace_collection):
+        self.getDict().onContentReadOnlyUsage(trace_collection)
+
         trace_collection.onExceptionRaiseExit(BaseException)
 
         return self, None, None
@@ -26,6 +26,7 @@ abstract execution, and different from statements.
 from abc import abstractmethod
 
 from nuitka.Constants import isCompileTimeConstantValue
+from nuitka.optimizations.ComputationCache import getBuiltinCallKey
 
 from .NodeBases import ChildrenHavingMixin, NodeBase
 from .NodeMakingHelpers import (
@@ -51,6 +52,14 @@ class ExpressionBase(NodeBase):
         # Virtual method, pylint: disable=no-self-use
         return ShapeUnknown
 
+    def getTypeFeedbackShape(self):
+        """ The shape expected from type feedback, or the known one.
+
+            Unlike "getTypeShape", this can be wrong, and code using it must
+            check the type at run time.
+        """
+        return self.getTypeShape()
+
     def getValueShape(self):
         return self
 
@@ -483,6 +492,9 @@ class ExpressionBase(NodeBase):
     def onContentEscapes(self, trace_collection):
         pass
 
+    def onContentReadOnlyUsage(self, trace_collection):
+        pass
+
     def mayRaiseExceptionBool(self, exception_type):
         """ Unless we are told otherwise, everything may raise being checked. """
         # Virtual method, pylint: disable=no-self-use,unused-argument
@@ -860,10 +872,14 @@ class ExpressionSpecBasedComputationBase(ExpressionChildrenHavingBase):
             return self, None, None
 
         return trace_collection.getCompileTimeComputationResult(
-            node        = self,
-            computation = lambda : self.builtin_spec.simulateCall(given_values),
-            description = "Built-in call to '%s' pre-computed." % (
+            node            = self,
+            computation     = lambda : self.builtin_spec.simulateCall(given_values),
+            description     = "Built-in call to '%s' pre-computed." % (
                 self.builtin_spec.getName()
+            ),
+            computation_key = getBuiltinCallKey(
+                self.builtin_spec,
+                given_values
             )
         )
 
@@ -23,6 +23,8 @@ in-lining of "exec" statements with their own future imports, or in-lining of
 code from other modules.
 """
 
+import __future__
+
 from nuitka.PythonVersions import python_version
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
@@ -116,6 +118,30 @@ class FutureSpec(object):
 
         return tuple(result)
 
+    def asCompilerFlags(self):
+        """ Create the flags value for the "compile" built-in.
+
+            This is for compiling code at compile time, that at run time
+            would inherit the future flags of the calling code.
+        """
+
+        result = 0
+
+        for flag in self.asFlags():
+            result |= getattr(__future__, _compiler_flag_features[flag]).compiler_flag
+
+        return result
+
+
+_compiler_flag_features = {
+    "CO_FUTURE_DIVISION"         : "division",
+    "CO_FUTURE_UNICODE_LITERALS" : "unicode_literals",
+    "CO_FUTURE_ABSOLUTE_IMPORT"  : "absolute_import",
+    "CO_FUTURE_PRINT_FUNCTION"   : "print_function",
+    "CO_FUTURE_BARRY_AS_BDFL"    : "barry_as_FLUFL",
+    "CO_FUTURE_GENERATOR_STOP"   : "generator_stop",
+}
+
 
 def fromFlags(flags):
     flags = flags.split(',')
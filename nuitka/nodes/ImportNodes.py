@@ -132,6 +132,12 @@ class ExpressionBuiltinImport(ExpressionChildrenHavingBase):
     getLocals = ExpressionChildrenHavingBase.childGetter("locals")
     getLevel = ExpressionChildrenHavingBase.childGetter("level")
 
+    def getImportedModule(self):
+        return self.imported_module
+
+    def getImportListModules(self):
+        return self.import_list_modules
+
     def _consider(self, trace_collection, module_filename, module_package):
         assert module_package is None or \
               (type(module_package) is str and module_package != ""), repr(module_package)
@@ -30,6 +30,7 @@ from logging import warning
 
 from nuitka.Builtins import builtin_names
 from nuitka.Constants import isConstant
+from nuitka.optimizations.ComputationCache import getCachedComputationResult
 from nuitka.Options import isDebug, shallWarnImplicitRaises
 
 
@@ -184,15 +185,20 @@ def makeCompileTimeConstantReplacementNode(value, node):
         return node
 
 
-def getComputationResult(node, computation, description):
+def getComputationResult(node, computation, description, computation_key = None):
     """ With a computation function, execute it and return constant result or
         exception node.
 
+        With a computation key, the result is taken from the cache of compile
+        time computations if possible.
     """
 
     # Try and turn raised exceptions into static raises. pylint: disable=broad-except
     try:
-        result = computation()
+        if computation_key is None:
+            result = computation()
+        else:
+            result = getCachedComputationResult(computation_key, computation)
     except Exception as e:
         new_node = makeRaiseExceptionReplacementExpressionFromInstance(
             expression = node,
@@ -24,6 +24,8 @@ no real difference.
 import math
 
 from nuitka import PythonOperators
+from nuitka.optimizations.ComputationCache import getComputationKey
+from nuitka.optimizations.TypeFeedback import getOperationTypeFeedbackShape
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .shapes.BuiltinTypeShapes import ShapeTypeTuple
@@ -114,12 +116,16 @@ class ExpressionOperationBinary(ExpressionOperationBase):
             right_value = right.getCompileTimeConstant()
 
             return trace_collection.getCompileTimeComputationResult(
-                node        = self,
-                computation = lambda : self.getSimulator()(
+                node            = self,
+                computation     = lambda : self.getSimulator()(
                     left_value,
                     right_value
                 ),
-                description = "Operator '%s' with constant arguments." % operator
+                description     = "Operator '%s' with constant arguments." % operator,
+                computation_key = getComputationKey(
+                    self.getSimulator(),
+                    (left_value, right_value)
+                )
             )
 
         # TODO: May go down to MemoryError for compile time constant overflow
@@ -138,6 +144,20 @@ class ExpressionOperationBinary(ExpressionOperationBase):
     def getOperands(self):
         return (self.subnode_left, self.subnode_right)
 
+    def getTypeFeedbackOperandShape(self):
+        """ The shape both operands are expected to have, or ShapeUnknown.
+
+            The operands give it, if they agree, otherwise the type feedback
+            recorded for the operation itself is used.
+        """
+        left_shape = self.subnode_left.getTypeFeedbackShape()
+
+        if left_shape is not ShapeUnknown and \
+           left_shape is self.subnode_right.getTypeFeedbackShape():
+            return left_shape
+
+        return getOperationTypeFeedbackShape(self)
+
     getLeft = ExpressionChildrenHavingBase.childGetter("left")
     getRight = ExpressionChildrenHavingBase.childGetter("right")
 
@@ -181,12 +201,16 @@ class ExpressionOperationBinaryAdd(ExpressionOperationBinary):
                     return self, None, None
 
             return trace_collection.getCompileTimeComputationResult(
-                node        = self,
-                computation = lambda : self.getSimulator()(
+                node            = self,
+                computation     = lambda : self.getSimulator()(
                     left_value,
                     right_value
                 ),
-                description = "Operator '%s' with constant arguments." % operator
+                description     = "Operator '%s' with constant arguments." % operator,
+                computation_key = getComputationKey(
+                    self.getSimulator(),
+                    (left_value, right_value)
+                )
             )
 
         # The value of these nodes escaped and could change its contents.
@@ -302,12 +326,16 @@ class ExpressionOperationBinaryMult(ExpressionOperationBinary):
                         return self, None, None
 
             return trace_collection.getCompileTimeComputationResult(
-                node        = self,
-                computation = lambda : self.getSimulator()(
+                node            = self,
+                computation     = lambda : self.getSimulator()(
                     left_value,
                     right_value
                 ),
-                description = "Operator '*' with constant arguments."
+                description     = "Operator '*' with constant arguments.",
+                computation_key = getComputationKey(
+                    self.getSimulator(),
+                    (left_value, right_value)
+                )
             )
 
         # The value of these nodes escaped and could change its contents.
@@ -409,11 +437,15 @@ class ExpressionOperationUnary(ExpressionOperationBase):
             operand_value = operand.getCompileTimeConstant()
 
             return trace_collection.getCompileTimeComputationResult(
-                node        = self,
-                computation = lambda : self.getSimulator()(
+                node            = self,
+                computation     = lambda : self.getSimulator()(
                     operand_value,
                 ),
-                description = "Operator '%s' with constant argument." % operator
+                description     = "Operator '%s' with constant argument." % operator,
+                computation_key = getComputationKey(
+                    self.getSimulator(),
+                    (operand_value,)
+                )
             )
         else:
             # TODO: May go down to MemoryError for compile time constant overflow
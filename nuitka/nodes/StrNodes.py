@@ -0,0 +1,112 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for calls of methods of "str" objects.
+
+These are created for method calls, where the "str" shape of the called
+object is known, so the method lookup can be avoided and the C-API used
+directly. With constant arguments, they are computed at compile time.
+"""
+
+from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
+from nuitka.PythonVersions import python_version
+
+from .ExpressionBases import ExpressionChildrenHavingBase
+from .shapes.BuiltinTypeShapes import ShapeTypeBool, ShapeTypeStr
+
+if python_version < 300:
+    from .shapes.BuiltinTypeShapes import ShapeTypeStrOrUnicode
+
+
+class ExpressionStrOperationBase(ExpressionChildrenHavingBase):
+    named_children = (
+        "str",
+        "value"
+    )
+
+    # Method name, for compile time computation.
+    method_name = None
+
+    @calledWithBuiltinArgumentNamesDecorator
+    def __init__(self, str_arg, value, source_ref):
+        assert str_arg is not None
+        assert value is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "str"   : str_arg,
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+    getStr = ExpressionChildrenHavingBase.childGetter("str")
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+
+    def computeExpression(self, trace_collection):
+        str_arg = self.getStr()
+        value = self.getValue()
+
+        if str_arg.isCompileTimeConstant() and value.isCompileTimeConstant():
+            return trace_collection.getCompileTimeComputationResult(
+                node        = self,
+                computation = lambda : getattr(
+                    str_arg.getCompileTimeConstant(),
+                    self.method_name
+                )(value.getCompileTimeConstant()),
+                description = "String '%s' method call with constant arguments." % (
+                    self.method_name
+                )
+            )
+
+        # Wrong argument types, or for "join", iteration of anything.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class ExpressionStrOperationStartswith(ExpressionStrOperationBase):
+    kind = "EXPRESSION_STR_OPERATION_STARTSWITH"
+
+    method_name = "startswith"
+
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+
+class ExpressionStrOperationEndswith(ExpressionStrOperationBase):
+    kind = "EXPRESSION_STR_OPERATION_ENDSWITH"
+
+    method_name = "endswith"
+
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+
+class ExpressionStrOperationJoin(ExpressionStrOperationBase):
+    kind = "EXPRESSION_STR_OPERATION_JOIN"
+
+    method_name = "join"
+
+    def getTypeShape(self):
+        # Unicode elements make a unicode result for Python2.
+        if python_version < 300:
+            return ShapeTypeStrOrUnicode
+        else:
+            return ShapeTypeStr
@@ -23,12 +23,28 @@ Manual for how this maps to try/finally and try/except as in Python.
 """
 
 from nuitka.optimizations.TraceCollections import TraceCollectionBranch
+from nuitka.PythonVersions import python_version
 
 from .Checkers import checkStatementsSequence, checkStatementsSequenceOrNone
+from .ConditionalNodes import StatementConditional
+from .DictionaryNodes import ExpressionDictOperationIn
 from .NodeBases import StatementChildrenHavingBase
 from .StatementNodes import StatementsSequence
 
 
+def _usesCaughtException(node):
+    if node.isExpressionCaughtExceptionTypeRef() or \
+       node.isExpressionCaughtExceptionValueRef() or \
+       node.isExpressionCaughtExceptionTracebackRef():
+        return True
+
+    for child in node.getVisitableNodes():
+        if _usesCaughtException(child):
+            return True
+
+    return False
+
+
 class StatementTry(StatementChildrenHavingBase):
     kind = "STATEMENT_TRY"
 
@@ -268,6 +284,16 @@ class StatementTry(StatementChildrenHavingBase):
            return_handler is None:
             return tried, "new_statements", "Removed useless try, all handlers removed."
 
+        if except_handler is not None and \
+           break_handler is None and \
+           continue_handler is None and \
+           return_handler is None:
+            result = self._getDictLookupReplacement()
+
+            if result is not None:
+                return result, "new_statements", """\
+Dictionary look-up with 'KeyError' handler replaced by 'in' check."""
+
         tried_statements = tried.getStatements()
 
         pre_statements = []
@@ -364,6 +390,124 @@ class StatementTry(StatementChildrenHavingBase):
 
         return self, None, None
 
+    def _getDictLookupReplacement(self):
+        """ Replace "try: v = d[k] except KeyError: ..." with an "in" check.
+
+        The look-up of the value is then done by the check, so no exception
+        is raised, which is expensive compared to the look-up. This applies
+        only if the handler cannot observe the exception, neither directly
+        nor through "sys.exc_info()". For Python2, the caught exception
+        remains visible after the handler, so it is never done there.
+
+        Hashing the key, or comparing it with a stored key, may still raise
+        "KeyError", so the handler is kept around the check.
+        """
+
+        # This is matching a lot of structure, pylint: disable=too-many-return-statements
+        if python_version < 300:
+            return None
+
+        tried_statements = self.getBlockTry().getStatements()
+
+        if len(tried_statements) != 1:
+            return None
+
+        assignment = tried_statements[0]
+
+        if not assignment.isStatementAssignmentVariable():
+            return None
+
+        lookup = assignment.getAssignSource()
+
+        if not lookup.isExpressionDictOperationGet() or \
+           lookup.isExpressionDictOperationGetFetched():
+            return None
+
+        dict_arg = lookup.getDict()
+        key = lookup.getKey()
+
+        for value in (dict_arg, key):
+            if not value.isExpressionVariableRef() and \
+               not value.isExpressionTempVariableRef():
+                return None
+
+            if value.mayRaiseException(BaseException):
+                return None
+
+        # Expecting the re-formulation of an exception handler for Python3,
+        # see "buildTryExceptionNode", with only the one exception handler.
+        handler_statements = self.getBlockExceptHandler().getStatements()
+
+        if len(handler_statements) < 3 or \
+           not handler_statements[0].isStatementPreserveFrameException() or \
+           not handler_statements[1].isStatementPublishException() or \
+           not handler_statements[2].isStatementTry():
+            return None
+
+        for statement in handler_statements[3:]:
+            if not statement.isStatementRestoreFrameException():
+                return None
+
+        handler_statements = handler_statements[2].getBlockTry().getStatements()
+
+        if len(handler_statements) != 1 or \
+           not handler_statements[0].isStatementConditional():
+            return None
+
+        condition = handler_statements[0].getCondition()
+
+        if not condition.isExpressionComparisonExceptionMatch() or \
+           not condition.getLeft().isExpressionCaughtExceptionTypeRef() or \
+           not condition.getRight().isExpressionBuiltinExceptionRef() or \
+           condition.getRight().getExceptionName() != "KeyError":
+            return None
+
+        no_branch = handler_statements[0].getBranchNo()
+
+        if no_branch is None or \
+           len(no_branch.getStatements()) != 1 or \
+           not no_branch.getStatements()[0].isStatementReraiseException():
+            return None
+
+        handler = handler_statements[0].getBranchYes()
+
+        if handler is not None:
+            # Code that may raise, may also call arbitrary code, which could
+            # look at the exception.
+            if handler.mayRaiseException(BaseException):
+                return None
+
+            if _usesCaughtException(handler):
+                return None
+
+        # The "__hash__" of the key, or the "__eq__" of it or of a key stored
+        # in the dictionary, may raise "KeyError", which the handler still
+        # needs to catch then.
+        return StatementTry(
+            tried            = StatementsSequence(
+                statements = (
+                    StatementConditional(
+                        condition  = ExpressionDictOperationIn(
+                            key        = key.makeClone(),
+                            dict_arg   = dict_arg.makeClone(),
+                            source_ref = lookup.getSourceReference()
+                        ),
+                        yes_branch = self.getBlockTry(),
+                        no_branch  = handler.makeClone()
+                                       if handler is not None else
+                                     None,
+                        source_ref = self.getSourceReference()
+                    ),
+                ),
+                source_ref = self.getSourceReference()
+            ),
+            except_handler   = self.getBlockExceptHandler(),
+            break_handler    = None,
+            continue_handler = None,
+            return_handler   = None,
+            source_ref       = self.getSourceReference()
+        )
+
     def mayReturn(self):
         # TODO: If we optimized return handler away, this would be not needed
         # or even non-optimal.
@@ -24,6 +24,7 @@ and its expressions, changing the meaning of course dramatically.
 
 from nuitka import Builtins, Variables
 from nuitka.ModuleRegistry import getOwnerFromCodeName
+from nuitka.optimizations.TypeFeedback import getVariableTypeFeedbackShape
 
 from .ConstantRefNodes import makeConstantRefNode
 from .DictionaryNodes import (
@@ -155,6 +156,14 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
         else:
             return ShapeUnknown
 
+    def getTypeFeedbackShape(self):
+        shape = self.getTypeShape()
+
+        if shape is ShapeUnknown:
+            shape = getVariableTypeFeedbackShape(self.variable)
+
+        return shape
+
     def computeExpressionRaw(self, trace_collection):
         variable = self.variable
         assert variable is not None
@@ -328,6 +337,9 @@ Subscript del to dictionary lowered to dictionary del."""
         tags = None
         message = None
 
+        # The value is only looked at.
+        self.onContentReadOnlyUsage(trace_collection)
+
         # Any code could be run, note that.
         trace_collection.onControlFlowEscape(self)
 
@@ -352,6 +364,9 @@ Subscript look-up to dictionary lowered to dictionary look-up."""
         tags = None
         message = None
 
+        # The value is only looked at.
+        self.onContentReadOnlyUsage(trace_collection)
+
         # Any code could be run, note that.
         trace_collection.onControlFlowEscape(in_node)
 
@@ -383,12 +398,25 @@ Check '%s' on dictionary lowered to dictionary '%s'.""" % (
 
         return in_node, tags, message
 
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        # The value is only looked at.
+        self.onContentReadOnlyUsage(trace_collection)
+
+        return ExpressionVariableRefBase.computeExpressionIter1(
+            self,
+            iter_node        = iter_node,
+            trace_collection = trace_collection
+        )
+
     def hasShapeDictionaryExact(self):
         return self.variable_trace.hasShapeDictionaryExact()
 
     def onContentEscapes(self, trace_collection):
         trace_collection.onVariableContentEscapes(self.variable)
 
+    def onContentReadOnlyUsage(self, trace_collection):
+        self.variable_trace.addReadOnlyUsage()
+
     def isKnownToBeIterable(self, count):
         return None
 
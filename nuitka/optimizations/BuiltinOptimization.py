@@ -323,6 +323,9 @@ builtin_format_spec = BuiltinParameterSpecNoKeywords("format", ("value", "format
 
 builtin_sum_spec = BuiltinParameterSpecNoKeywords("sum", ("sequence", "start"), 1)
 
+builtin_any_spec = BuiltinParameterSpecNoKeywords("any", ("iterable",), 0)
+builtin_all_spec = BuiltinParameterSpecNoKeywords("all", ("iterable",), 0)
+
 builtin_staticmethod_spec = BuiltinParameterSpecNoKeywords("staticmethod", ("function",), 0)
 builtin_classmethod_spec = BuiltinParameterSpecNoKeywords("classmethod", ("function",), 0)
 
@@ -0,0 +1,206 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Cache for compile time computations.
+
+Operators and built-in calls with constant arguments are computed at compile
+time. The same computation is often done again, for code that got duplicated,
+e.g. "finally" blocks, inlined functions, and unrolled loops, and in every
+pass for nodes whose result cannot become a constant. This remembers results
+by the operation and the exact values of the arguments.
+
+The cache is bounded, with sizes accounted in characters and elements of the
+arguments and results, the least recently used entries are dropped first.
+"""
+
+import math
+
+from nuitka.__past__ import long, unicode  # pylint: disable=I0021,redefined-builtin
+from nuitka.containers.odict import OrderedDict
+from nuitka.Constants import isConstant, isMutable
+
+_max_cache_size = 4 * 1024 * 1024
+
+# Entries larger than this are not cached, as they would evict too much.
+_max_entry_size = _max_cache_size // 16
+
+_cache = OrderedDict()
+_cache_size = 0
+
+_cache_hits = 0
+_cache_misses = 0
+
+_plain_types = (int, long, bool, str, unicode, bytes, type(None))
+
+
+def _getConstantKey(value):
+    """ Key for a constant value, or None if it cannot be cached.
+
+    Types are part of the key, as e.g. "1", "1.0" and "True" are equal, but
+    give different results. Floats use their representation, so that "-0.0"
+    and "nan" are handled correctly.
+    """
+
+    value_type = type(value)
+
+    if value_type in _plain_types:
+        return value_type, value
+    elif value_type is float:
+        return value_type, repr(value), math.copysign(1.0, value)
+    elif value_type is complex:
+        return (
+            value_type,
+            repr(value),
+            math.copysign(1.0, value.real),
+            math.copysign(1.0, value.imag)
+        )
+    elif value_type in (tuple, frozenset):
+        element_keys = []
+
+        for element in value:
+            element_key = _getConstantKey(element)
+
+            if element_key is None:
+                return None
+
+            element_keys.append(element_key)
+
+        return value_type, value_type(element_keys)
+    else:
+        return None
+
+
+def getComputationKey(operation, values):
+    """ Key for the computation of an operation with these constant values.
+
+    The operation can be any hashable object, typically the function doing
+    the computation. Returns None if the values cannot be used in a key.
+    """
+
+    value_keys = []
+
+    for value in values:
+        value_key = _getConstantKey(value)
+
+        if value_key is None:
+            return None
+
+        value_keys.append(value_key)
+
+    return operation, tuple(value_keys)
+
+
+def getBuiltinCallKey(builtin_spec, given_values):
+    """ Key for a built-in call, given values are nodes or None.
+
+    Calls with star arguments are not considered.
+    """
+
+    values = []
+
+    for given_value in given_values:
+        if given_value is None:
+            values.append(None)
+        elif type(given_value) in (tuple, list):
+            return None
+        else:
+            values.append(given_value.getCompileTimeConstant())
+
+    return getComputationKey(builtin_spec, values)
+
+
+def _getValueSize(value):
+    value_type = type(value)
+
+    if value_type in (str, unicode, bytes):
+        return 1 + len(value)
+    elif value_type in (tuple, frozenset):
+        return 1 + sum(_getValueSize(element) for element in value)
+    elif value_type in (int, long):
+        return len(hex(value)) // 16 + 1
+    else:
+        return 1
+
+
+def _getKeySize(key):
+    # The key holds the values in its second item, with their types.
+    return sum(_getValueSize(value_key[1]) for value_key in key[1])
+
+
+def _addCacheEntry(key, entry, size):
+    # Update the module level cache accounting, pylint: disable=global-statement
+    global _cache_size
+
+    if size > _max_entry_size:
+        return
+
+    _cache[key] = entry, size
+    _cache_size += size
+
+    while _cache_size > _max_cache_size:
+        _old_key, (_old_entry, old_size) = _cache.popitem(last = False)
+        _cache_size -= old_size
+
+
+def getCachedComputationResult(key, computation):
+    """ Execute the computation, unless already done for the same key.
+
+    Exceptions raised are remembered too, and raised again.
+    """
+
+    # Update the module level statistics, pylint: disable=global-statement
+    global _cache_hits, _cache_misses
+
+    if key in _cache:
+        _cache_hits += 1
+
+        # Move to the end, as it's the most recently used one now.
+        entry, size = _cache.pop(key)
+        _cache[key] = entry, size
+
+        is_exception, value = entry
+
+        if is_exception:
+            raise value
+        else:
+            return value
+
+    _cache_misses += 1
+
+    try:
+        result = computation()
+    except Exception as e:  # Re-raised, pylint: disable=broad-except
+        # Do not keep the frames of the computation alive.
+        e.__traceback__ = None
+
+        _addCacheEntry(key, (True, e), _getKeySize(key) + 1)
+
+        raise
+
+    # Mutable results must not be shared between nodes.
+    if isConstant(result) and not isMutable(result):
+        _addCacheEntry(
+            key,
+            (False, result),
+            _getKeySize(key) + _getValueSize(result)
+        )
+
+    return result
+
+
+def getComputationCacheStats():
+    return _cache_hits, _cache_misses, len(_cache), _cache_size
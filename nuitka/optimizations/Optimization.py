@@ -34,6 +34,7 @@ from nuitka.utils import MemoryUsage
 
 from . import Graphs, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
+from .ComputationCache import getComputationCacheStats
 from .Tags import TagSet
 
 _progress = Options.isShowProgress()
@@ -470,4 +471,16 @@ def optimize():
     while not finished:
         finished = makeOptimizationPass(True)
 
+    if _progress:
+        hits, misses, entries, size = getComputationCacheStats()
+
+        info(
+            "Compile time computations: %d cached, %d done, %d entries of size %d kept." % (
+                hits,
+                misses,
+                entries,
+                size
+            )
+        )
+
     Graphs.endGraph()
@@ -34,6 +34,10 @@ from nuitka.nodes.AttributeNodes import (
     ExpressionBuiltinHasattr,
     ExpressionBuiltinSetattr
 )
+from nuitka.nodes.BuiltinAnyAllNodes import (
+    ExpressionBuiltinAll,
+    ExpressionBuiltinAny
+)
 from nuitka.nodes.BuiltinDecodingNodes import (
     ExpressionBuiltinChr,
     ExpressionBuiltinOrd
@@ -309,6 +313,22 @@ def sum_extractor(node):
     )
 
 
+def any_extractor(node):
+    return BuiltinOptimization.extractBuiltinArgs(
+        node          = node,
+        builtin_class = ExpressionBuiltinAny,
+        builtin_spec  = BuiltinOptimization.builtin_any_spec
+    )
+
+
+def all_extractor(node):
+    return BuiltinOptimization.extractBuiltinArgs(
+        node          = node,
+        builtin_class = ExpressionBuiltinAll,
+        builtin_spec  = BuiltinOptimization.builtin_all_spec
+    )
+
+
 def dict_extractor(node):
     # The "dict" built-in is a bit strange in that it accepts a position
     # parameter, or not, but won't have a default value.
@@ -1267,6 +1287,8 @@ _dispatch_dict = {
     "iter"         : iter_extractor,
     "next"         : next_extractor,
     "sum"          : sum_extractor,
+    "any"          : any_extractor,
+    "all"          : all_extractor,
     "tuple"        : tuple_extractor,
     "list"         : list_extractor,
     "dict"         : dict_extractor,
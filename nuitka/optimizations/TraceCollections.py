@@ -28,6 +28,7 @@ from logging import debug
 
 from nuitka import Tracing, Variables
 from nuitka.__past__ import iterItems  # Python3 compatibility.
+from nuitka.containers.ldict import LayeredDict, getLayeredDictsDifferences
 from nuitka.containers.oset import OrderedSet
 from nuitka.importing.ImportCache import (
     getImportedModuleByName,
@@ -52,8 +53,9 @@ signalChange = None
 
 class CollectionTracingMixin(object):
     def __init__(self):
-        # For functions, when we are in here, the currently active one,
-        self.variable_actives = {}
+        # For functions, when we are in here, the currently active one, this
+        # is shared with branches on a copy on write basis.
+        self.variable_actives = LayeredDict()
 
     def getVariableCurrentTrace(self, variable):
         return self.getVariableTrace(
@@ -253,7 +255,7 @@ class CollectionStartpointMixin(object):
     def dumpActiveTraces(self):
         Tracing.printSeparator()
         Tracing.printLine("Active are:")
-        for variable, _version in sorted(self.variable_actives.iteritems()):
+        for variable, _version in sorted(iterItems(self.variable_actives)):
             self.getVariableCurrentTrace(variable).dump()
 
         Tracing.printSeparator()
@@ -605,21 +607,34 @@ class TraceCollectionBase(CollectionTracingMixin):
             self.replaceBranch(collections[0])
             return None
 
+        # Only variables set in one of the branches after their common layer
+        # can have differing versions, all others are taken over unchanged.
+        common, branch_changes = getLayeredDictsDifferences(
+            [
+                collection.variable_actives
+                for collection in
+                collections
+            ]
+        )
+
+        variables = set()
+        for changes in branch_changes:
+            variables.update(changes)
+
+        common_actives = LayeredDict(common)
+
         variable_versions = {}
 
-        for collection in collections:
-            for variable, version in iterItems(collection.variable_actives):
-                if variable not in variable_versions:
-                    variable_versions[variable] = set([version])
-                else:
-                    variable_versions[variable].add(version)
+        for variable in variables:
+            common_version = common_actives.get(variable, 0)
 
-        for collection in collections:
-            for variable, versions in iterItems(variable_versions):
-                if variable not in collection.variable_actives:
-                    versions.add(0)
+            variable_versions[variable] = set(
+                changes.get(variable, common_version)
+                for changes in
+                branch_changes
+            )
 
-        self.variable_actives = {}
+        self.variable_actives = LayeredDict(common)
 
 #         merge_traces = None
 
@@ -647,7 +662,22 @@ class TraceCollectionBase(CollectionTracingMixin):
 #         return merge_traces and tuple(merge_traces)
 
     def replaceBranch(self, collection_replace):
-        self.variable_actives.update(collection_replace.variable_actives)
+        variable_actives = self.variable_actives
+        replace_actives = collection_replace.variable_actives
+
+        _common, (own_changes, replace_changes) = getLayeredDictsDifferences(
+            (variable_actives, replace_actives)
+        )
+
+        for variable, version in iterItems(replace_changes):
+            variable_actives[variable] = version
+
+        # Changes only done here must be reverted where the replacing branch
+        # has other versions, coming from the common layer.
+        for variable in own_changes:
+            if variable not in replace_changes and variable in replace_actives:
+                variable_actives[variable] = replace_actives[variable]
+
         collection_replace.variable_actives = None
 
     def onLoopBreak(self, collection = None):
@@ -695,11 +725,13 @@ class TraceCollectionBase(CollectionTracingMixin):
             catch_exceptions = catch_exceptions
         )
 
-    def getCompileTimeComputationResult(self, node, computation, description):
+    def getCompileTimeComputationResult(self, node, computation, description,
+                                        computation_key = None):
         new_node, change_tags, message = getComputationResult(
-            node        = node,
-            computation = computation,
-            description = description
+            node            = node,
+            computation     = computation,
+            description     = description,
+            computation_key = computation_key
         )
 
         if change_tags == "new_raise":
@@ -732,7 +764,7 @@ class TraceCollectionBranch(TraceCollectionBase):
             parent = parent
         )
 
-        self.variable_actives = dict(parent.variable_actives)
+        self.variable_actives = parent.variable_actives.branch()
 
     def computeBranch(self, branch):
         if branch.isStatementsSequence():
@@ -763,7 +795,7 @@ class TraceCollectionBranch(TraceCollectionBase):
     def dumpActiveTraces(self):
         Tracing.printSeparator()
         Tracing.printLine("Active are:")
-        for variable, _version in sorted(self.variable_actives.iteritems()):
+        for variable, _version in sorted(iterItems(self.variable_actives)):
             self.getVariableCurrentTrace(variable).dump()
 
         Tracing.printSeparator()
@@ -0,0 +1,166 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Type feedback recorded by compiled programs.
+
+With "--type-feedback-record", the compiled program counts the exact built-in
+types it sees at sites, which are the operands of binary operations, the values
+of arguments and local variables, and the results of attribute look-ups. With
+"--type-feedback", the type that dominates a site is given to the nodes as a
+shape, see "getTypeFeedbackShape" of expressions.
+
+These shapes are only expected, not known, so they must not be used for
+anything but code that checks the types before relying on them.
+
+The sites are identified by module name, line, and what they are about, so the
+feedback is only good for unchanged source.
+"""
+
+from nuitka import Options
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    ShapeTypeBytes,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeList,
+    ShapeTypeLong,
+    ShapeTypeStr,
+    ShapeTypeTuple,
+    ShapeTypeUnicode
+)
+from nuitka.nodes.shapes.StandardShapes import ShapeUnknown
+from nuitka.PythonVersions import python_version
+
+# Share of all observations the dominant type must have.
+_dominance_ratio = 0.9
+
+# The shapes of the kinds recorded, the names are those of the types as seen
+# from Python code.
+if python_version < 300:
+    _kind_shapes = {
+        "int"     : ShapeTypeInt,
+        "long"    : ShapeTypeLong,
+        "float"   : ShapeTypeFloat,
+        "str"     : ShapeTypeStr,
+        "unicode" : ShapeTypeUnicode,
+        "list"    : ShapeTypeList,
+        "tuple"   : ShapeTypeTuple,
+    }
+else:
+    _kind_shapes = {
+        "int"     : ShapeTypeInt,
+        "float"   : ShapeTypeFloat,
+        "bytes"   : ShapeTypeBytes,
+        "str"     : ShapeTypeStr,
+        "list"    : ShapeTypeList,
+        "tuple"   : ShapeTypeTuple,
+    }
+
+_type_feedback = None
+
+def _getTypeFeedback():
+    # Lazy loading of the file, pylint: disable=global-statement
+    global _type_feedback
+
+    if _type_feedback is None:
+        _type_feedback = {}
+
+        with open(Options.getTypeFeedbackFilename()) as feedback_file:
+            for line in feedback_file:
+                site_name, kind, count = line.rstrip('\n').rsplit('\t', 2)
+
+                site_counts = _type_feedback.setdefault(site_name, {})
+                site_counts[kind] = site_counts.get(kind, 0) + int(count)
+
+    return _type_feedback
+
+
+def _getTypeFeedbackShape(site_name):
+    if not isTypeFeedbackUsed():
+        return ShapeUnknown
+
+    site_counts = _getTypeFeedback().get(site_name)
+
+    if not site_counts:
+        return ShapeUnknown
+
+    kind, count = max(site_counts.items(), key = lambda item: item[1])
+
+    if kind not in _kind_shapes or \
+       count < _dominance_ratio * sum(site_counts.values()):
+        return ShapeUnknown
+
+    return _kind_shapes[kind]
+
+
+def isTypeFeedbackRecording():
+    return Options.getTypeFeedbackRecordFilename() is not None
+
+
+def isTypeFeedbackUsed():
+    return Options.getTypeFeedbackFilename() is not None
+
+
+def getOperationSiteName(node):
+    return "%s:%d:operation:%s" % (
+        node.getParentModule().getFullName(),
+        node.getSourceReference().getLineNumber(),
+        node.getOperator()
+    )
+
+
+def getAttributeSiteName(node):
+    return "%s:%d:attribute:%s" % (
+        node.getParentModule().getFullName(),
+        node.getSourceReference().getLineNumber(),
+        node.getAttributeName()
+    )
+
+
+def getVariableSiteName(variable):
+    """ Site of a local variable, or None if it has none.
+
+        The arguments of functions are their parameter variables, and these
+        are recorded when the function is entered.
+    """
+
+    if not variable.isLocalVariable():
+        return None
+
+    owner = variable.getOwner()
+
+    return "%s:%d:variable:%s" % (
+        owner.getParentModule().getFullName(),
+        owner.getSourceReference().getLineNumber(),
+        variable.getName()
+    )
+
+
+def getOperationTypeFeedbackShape(node):
+    return _getTypeFeedbackShape(getOperationSiteName(node))
+
+
+def getAttributeTypeFeedbackShape(node):
+    return _getTypeFeedbackShape(getAttributeSiteName(node))
+
+
+def getVariableTypeFeedbackShape(variable):
+    site_name = getVariableSiteName(variable)
+
+    if site_name is None:
+        return ShapeUnknown
+
+    return _getTypeFeedbackShape(site_name)
@@ -48,7 +48,8 @@ class VariableTraceBase(object):
 
     __slots__ = (
         "owner", "variable", "version", "usage_count", "has_potential_usages",
-        "name_usages", "closure_usages", "is_escaped", "previous"
+        "name_usages", "closure_usages", "readonly_usages", "is_escaped",
+        "previous"
     )
 
     @InstanceCounters.counted_init
@@ -68,6 +69,10 @@ class VariableTraceBase(object):
 
         self.closure_usages = False
 
+        # Usages that only look at the value, but neither mutate it nor let
+        # it escape.
+        self.readonly_usages = 0
+
         # If False, this indicates that the value is not yet escaped.
         self.is_escaped = False
 
@@ -99,6 +104,9 @@ class VariableTraceBase(object):
         self.usage_count += 1
         self.name_usages += 1
 
+    def addReadOnlyUsage(self):
+        self.readonly_usages += 1
+
     def onValueEscape(self):
         self.is_escaped = True
 
@@ -117,6 +125,9 @@ class VariableTraceBase(object):
     def getNameUsageCount(self):
         return self.name_usages
 
+    def hasReadOnlyUsagesOnly(self):
+        return self.readonly_usages == self.usage_count
+
     def getPrevious(self):
         return self.previous
 
@@ -19,72 +19,181 @@
 
 This provides the capability of comparing performance results of Nuitka and
 CPython relatively to one another.
-"""
 
-# Note: This is currently severely broken.
+Compiled programs made with "--profile" write their samples when run with
+"NUITKA_PROFILE_SAMPLES" set to a filename. For CPython, the "--run" option
+samples a program in the same way. Both produce collapsed stacks, one per
+line with a count, as also used by flame graph tools, and these files are
+what is analysed here.
+"""
 
 from __future__ import print_function
 
+import os
 import runpy
+import signal
 import sys
-import tempfile
+from optparse import OptionParser
 
-import vmprof  # @UnresolvedImport pylint: disable=I0021,import-error
+from nuitka.utils.ProfileSamples import readSamples
 
 
-def _namelen(e):
-    if e.startswith("py:"):
-        return len(e.split(':')[1])
-    else:
-        return len(e)
+def _getFrameLabel(frame):
+    code = frame.f_code
 
-def show(stats):
-    p = stats.top_profile()
-    if not p:
-        print("no stats")
-        return
+    return "%s (%s:%d)" % (
+        code.co_name,
+        os.path.basename(code.co_filename),
+        code.co_firstlineno
+    )
 
-    p.sort(key = lambda x: x[1], reverse = True)
-    top = p[0][1]
 
-    max_len = max([_namelen(e[0]) for e in p])
+def runSampled(program, args, samples_filename, interval):
+    """ Run a Python program with CPython and sample its stack.
 
-    print(" vmprof output:")
-    print(" %:      name:" + ' ' * (max_len - 3) + "location:")
+    The output format is the same as for compiled programs, so the results
+    can be compared directly.
+    """
 
-    for k, v in p:
-        v = "%.1f%%" % (float(v) / top * 100)
-        if v == "0.0%":
-            v = "<0.1%"
-        if k.startswith("py:"):
-            _, func_name, lineno, filename = k.split(':', 3)
-            lineno = int(lineno)
-            print(" %s %s %s:%d" % (v.ljust(7), func_name.ljust(max_len + 1), filename, lineno))
-        else:
-            print(" %s %s" % (v.ljust(7), k.ljust(max_len + 1)))
+    samples = {}
 
+    def takeSample(signum, frame):
+        # Signal handler interface, pylint: disable=unused-argument
 
-def main():
-    with tempfile.NamedTemporaryFile() as prof_file:
-        vmprof.enable(prof_file.fileno(), 0.001)
-
-        try:
-            program = sys.argv[1]
-            del sys.argv[1]
-
-#            sys.argv = [args.program] + args.args
-            runpy.run_path(program, run_name = "__main__")
-        except BaseException as e:
-            if not isinstance(e, (KeyboardInterrupt, SystemExit)):
-                raise
-        vmprof.disable()
-
-        stats = vmprof.read_profile(
-            prof_file.name,
-            virtual_only = True
+        stack = []
+
+        while frame is not None:
+            stack.append(_getFrameLabel(frame))
+
+            # Stop at the main program, the frames of "runpy" and this tool
+            # are outside of it, and compiled programs have no such thing.
+            if frame.f_code.co_name == "<module>" and \
+               frame.f_globals.get("__name__") == "__main__":
+                break
+
+            frame = frame.f_back
+
+        stack = ';'.join(reversed(stack))
+
+        samples[stack] = samples.get(stack, 0) + 1
+
+    sys.argv = [program] + list(args)
+
+    signal.signal(signal.SIGPROF, takeSample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+
+    try:
+        runpy.run_path(program, run_name = "__main__")
+    except SystemExit:
+        pass
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_IGN)
+
+    with open(samples_filename, 'w') as samples_file:
+        for stack, count in samples.items():
+            samples_file.write("%s %d\n" % (stack, count))
+
+
+def showTop(samples, top):
+    total = sum(samples.values())
+
+    if not total:
+        print("No samples.")
+        return
+
+    self_counts = {}
+    inclusive_counts = {}
+
+    for stack, count in samples.items():
+        self_counts[stack[-1]] = self_counts.get(stack[-1], 0) + count
+
+        # Recursion must not count a function more than once per sample.
+        for label in set(stack):
+            inclusive_counts[label] = inclusive_counts.get(label, 0) + count
+
+    print("Total samples: %d" % total)
+    print()
+    print("   self%  incl%  function")
+
+    ranked = sorted(
+        inclusive_counts,
+        key     = lambda label: (self_counts.get(label, 0), inclusive_counts[label]),
+        reverse = True
+    )
+
+    for label in ranked[:top]:
+        print(
+            " %6.1f %6.1f  %s" % (
+                100.0 * self_counts.get(label, 0) / total,
+                100.0 * inclusive_counts[label] / total,
+                label
+            )
         )
 
-        show(stats)
+
+def main():
+    parser = OptionParser(
+        usage = """\
+%prog [options] samples-file
+       %prog --run program.py [program args] samples-file"""
+    )
+
+    parser.add_option(
+        "--run",
+        action  = "store",
+        dest    = "run",
+        default = None,
+        help    = """\
+        Run this program with CPython, writing its samples to the samples
+        file first. Default is to only analyse the samples file."""
+    )
+
+    parser.add_option(
+        "--interval",
+        action  = "store",
+        type    = "float",
+        dest    = "interval",
+        default = 0.001,
+        help    = """\
+        Sampling interval in seconds for "--run". Default is %default."""
+    )
+
+    parser.add_option(
+        "--top",
+        action  = "store",
+        type    = "int",
+        dest    = "top",
+        default = 30,
+        help    = """\
+        Number of functions to list. Default is %default."""
+    )
+
+    parser.disable_interspersed_args()
+
+    options, positional_args = parser.parse_args()
+
+    if not positional_args:
+        parser.print_help()
+        sys.exit(1)
+
+    samples_filename = positional_args[-1]
+
+    if options.run is not None:
+        runSampled(
+            program          = options.run,
+            args             = positional_args[:-1],
+            samples_filename = samples_filename,
+            interval         = options.interval
+        )
+    elif len(positional_args) != 1:
+        parser.print_help()
+        sys.exit(1)
+
+    showTop(
+        samples = readSamples(samples_filename),
+        top     = options.top
+    )
 
 
 if __name__ == "__main__":
@@ -865,22 +865,26 @@ def buildParseTree(provider, source_code, source_ref, is_module, is_main):
         )
 
     # The "__package__" attribute is set to proper value for 3.3 or higher even
-    # for normal modules, previously for packages only.
+    # for normal modules, previously for packages only. For top level modules,
+    # the import machinery makes that an empty string, but not for "__main__".
+    if provider.isCompiledPythonPackage():
+        if python_version < 330:
+            package_value = provider.getPackage()
+        else:
+            package_value = provider.getFullName()
+    elif python_version >= 330:
+        package_value = provider.getPackage()
+
+        if package_value is None and not provider.isMainModule():
+            package_value = ""
+    else:
+        package_value = None
+
     statements.append(
         StatementAssignmentVariableName(
             variable_name = "__package__",
             source        = makeConstantRefNode(
-                constant      = (
-                                  provider.getPackage()
-                                    if python_version < 330 else
-                                  provider.getFullName()
-                                )
-                                  if provider.isCompiledPythonPackage() else
-                                (
-                                    provider.getPackage()
-                                      if python_version >= 330 else
-                                    None
-                                ),
+                constant      = package_value,
                 source_ref    = internal_source_ref,
                 user_provided = True
             ),
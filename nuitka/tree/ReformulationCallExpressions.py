@@ -51,6 +51,12 @@ from .ComplexCallHelperFunctions import (
     getFunctionCallHelperStarList,
     getFunctionCallHelperStarListStarDict
 )
+from .ReformulationContractionExpressions import (
+    buildGeneratorExpressionConsumerNode,
+    buildLambdaConsumerNode,
+    isGeneratorExpressionConsumerCall,
+    isLambdaConsumerCall
+)
 from .ReformulationDictionaryCreation import buildDictionaryUnpackingArgs
 from .ReformulationSequenceCreation import buildListUnpacking
 from .TreeHelpers import (
@@ -198,7 +204,7 @@ def buildCallNode(provider, node, source_ref):
         list_star_arg = buildNode(provider, node.starargs, source_ref, True)
         dict_star_arg = buildNode(provider, node.kwargs, source_ref, True)
 
-    return _makeCallNode(
+    result = _makeCallNode(
         called          = called,
         positional_args = positional_args,
         keys            = keys,
@@ -208,6 +214,27 @@ def buildCallNode(provider, node, source_ref):
         source_ref      = source_ref,
     )
 
+    # Built-ins like "sum" consuming a generator expression can do the loop
+    # without a generator object, if it turns out to be the built-in.
+    if isGeneratorExpressionConsumerCall(provider, node):
+        result = buildGeneratorExpressionConsumerNode(
+            provider   = provider,
+            node       = node,
+            call_node  = result,
+            source_ref = source_ref
+        )
+    # Same for lambdas given to built-ins applying them to consumed items,
+    # where the lambda body can be done in the loop.
+    elif isLambdaConsumerCall(provider, node):
+        result = buildLambdaConsumerNode(
+            provider   = provider,
+            node       = node,
+            call_node  = result,
+            source_ref = source_ref
+        )
+
+    return result
+
 
 def _makeCallNode(called, positional_args, keys, values, list_star_arg,
                   dict_star_arg, source_ref):
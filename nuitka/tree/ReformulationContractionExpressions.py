@@ -22,20 +22,36 @@ source code comments with developer manual sections.
 
 """
 
+import ast
+
+from nuitka import Options
 from nuitka.nodes.AssignNodes import (
     StatementAssignmentVariable,
     StatementReleaseVariable
 )
 from nuitka.nodes.BuiltinIteratorNodes import ExpressionBuiltinIter1
 from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1
+from nuitka.nodes.BuiltinRefNodes import ExpressionBuiltinRef
+from nuitka.nodes.BuiltinTypeNodes import (
+    ExpressionBuiltinBool,
+    ExpressionBuiltinTuple
+)
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
-from nuitka.nodes.ConditionalNodes import StatementConditional
+from nuitka.nodes.ComparisonNodes import ExpressionComparisonIs
+from nuitka.nodes.ConditionalNodes import (
+    ExpressionConditional,
+    StatementConditional
+)
 from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
 from nuitka.nodes.ContainerOperationNodes import (
     StatementListOperationAppend,
     StatementSetOperationAdd
 )
 from nuitka.nodes.DictionaryNodes import StatementDictOperationSet
+from nuitka.nodes.ExceptionNodes import (
+    ExpressionBuiltinMakeException,
+    StatementRaiseException
+)
 from nuitka.nodes.FrameNodes import (
     StatementsFrameFunction,
     StatementsFrameGenerator
@@ -51,7 +67,14 @@ from nuitka.nodes.GeneratorNodes import (
     ExpressionMakeGeneratorObject
 )
 from nuitka.nodes.LoopNodes import StatementLoop, StatementLoopBreak
-from nuitka.nodes.NodeMakingHelpers import makeVariableRefNode
+from nuitka.nodes.NodeMakingHelpers import (
+    makeComparisonNode,
+    makeVariableRefNode
+)
+from nuitka.nodes.OperatorNodes import (
+    ExpressionOperationNOT,
+    makeBinaryOperationNode
+)
 from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
 from nuitka.nodes.ParameterSpecs import ParameterSpec
 from nuitka.nodes.ReturnNodes import StatementReturn
@@ -71,6 +94,7 @@ from .TreeHelpers import (
     buildNode,
     buildNodeList,
     getKind,
+    makeCallNode,
     makeStatementsSequenceFromStatement,
     makeStatementsSequenceFromStatements,
     mergeStatements
@@ -302,9 +326,679 @@ def buildGeneratorExpressionNode(provider, node, source_ref):
     return function_body
 
 
+# Built-ins consuming a generator expression given to them, completely, or in
+# case of "any" and "all" until the result is decided. For these, the loop of
+# the generator expression is done directly, without a generator object.
+_generator_consumer_names = (
+    "any", "all", "sum", "min", "max", "tuple", "list", "set", "sorted"
+)
+
+# The consumers, where nothing the consumer does can raise. For the others,
+# the exception traceback would show the "<genexpr>" frame, and that is not
+# done in full compatibility mode.
+_exact_generator_consumer_names = ("tuple", "list", "sorted")
+
+
+def _isBuiltinNameCheckable(provider):
+    while provider.isExpressionOutlineBody():
+        provider = provider.getParentVariableProvider()
+
+    # Class bodies may have arbitrary locals mappings, where looking up the
+    # built-in name twice would be visible. Same for "exec" using functions.
+    if provider.isExpressionClassBody():
+        return False
+
+    if not provider.isCompiledPythonModule() and provider.isUnoptimized():
+        return False
+
+    return True
+
+
+def _isGeneratorExpressionFusable(provider, node):
+    if not _isBuiltinNameCheckable(provider):
+        return False
+
+    # With "generator_stop", a "StopIteration" leaving the generator expression
+    # is to become a "RuntimeError".
+    if provider.getParentModule().getFutureSpec().isGeneratorStop():
+        return False
+
+    for generator in node.generators:
+        if getattr(generator, "is_async", False):
+            return False
+
+    for sub_node in ast.walk(node):
+        if getKind(sub_node) in ("Yield", "YieldFrom", "Await"):
+            return False
+
+    return True
+
+
+def isGeneratorExpressionConsumerCall(provider, node):
+    """ Is this call a built-in consuming a generator expression argument.
+
+    Only the plain form, e.g. "sum(x for x in y)" is considered, and which
+    built-in is called, can only be decided during optimization.
+    """
+
+    if getKind(node.func) != "Name" or \
+       node.func.id not in _generator_consumer_names:
+        return False
+
+    if len(node.args) != 1 or getKind(node.args[0]) != "GeneratorExp":
+        return False
+
+    if node.keywords or getattr(node, "starargs", None) or \
+       getattr(node, "kwargs", None):
+        return False
+
+    if Options.isFullCompat() and \
+       node.func.id not in _exact_generator_consumer_names:
+        return False
+
+    return _isGeneratorExpressionFusable(provider, node.args[0])
+
+
+def _buildGeneratorExpressionConsumerLoop(provider, node, consumer_name,
+                                          source_ref, function_name = "<genexpr>",
+                                          key = None, stop_iteration_ends = True):
+    # Each consumer has its own loop body and end, pylint: disable=too-many-locals
+
+    if consumer_name in ("tuple", "sorted"):
+        values = _buildGeneratorExpressionConsumerLoop(
+            provider            = provider,
+            node                = node,
+            consumer_name       = "list",
+            source_ref          = source_ref,
+            function_name       = function_name,
+            stop_iteration_ends = stop_iteration_ends
+        )
+
+        if consumer_name == "tuple":
+            return ExpressionBuiltinTuple(
+                value      = values,
+                source_ref = source_ref
+            )
+        else:
+            return makeCallNode(
+                ExpressionBuiltinRef(
+                    builtin_name = "sorted",
+                    source_ref   = source_ref
+                ),
+                values,
+                source_ref
+            )
+
+    function_body, iter_tmp, code_object = _makeContractionFunctionBody(
+        provider   = provider,
+        name       = function_name,
+        source_ref = source_ref
+    )
+
+    result_tmp = function_body.allocateTempVariable(
+        temp_scope = None,
+        name       = "contraction_result"
+    )
+
+    def makeResultRef():
+        return ExpressionTempVariableRef(
+            variable   = result_tmp,
+            source_ref = source_ref
+        )
+
+    def makeReturnConstant(constant):
+        return StatementReturn(
+            expression = makeConstantRefNode(
+                constant   = constant,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+
+    def makeReturnResult():
+        return StatementReturn(
+            expression = makeResultRef(),
+            source_ref = source_ref
+        )
+
+    init_statements = []
+    extra_tmps = []
+
+    if consumer_name == "list":
+        start_value = makeConstantRefNode(
+            constant   = [],
+            source_ref = source_ref
+        )
+        emit_class = StatementListOperationAppend
+        makeEndStatements = makeReturnResult
+    elif consumer_name == "set":
+        start_value = makeConstantRefNode(
+            constant   = set(),
+            source_ref = source_ref
+        )
+        emit_class = StatementSetOperationAdd
+        makeEndStatements = makeReturnResult
+    elif consumer_name == "sum":
+        start_value = makeConstantRefNode(
+            constant   = 0,
+            source_ref = source_ref
+        )
+
+        def makeSumStep(result_ref, value, source_ref):
+            return StatementAssignmentVariable(
+                variable   = result_tmp,
+                source     = makeBinaryOperationNode(
+                    operator   = "Add",
+                    left       = result_ref,
+                    right      = value,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+
+        emit_class = makeSumStep
+        makeEndStatements = makeReturnResult
+    elif consumer_name in ("any", "all"):
+        start_value = None
+        stop_truth = consumer_name == "any"
+
+        def makeAnyAllStep(value, source_ref):
+            if not stop_truth:
+                value = ExpressionOperationNOT(
+                    operand    = value,
+                    source_ref = source_ref
+                )
+
+            return StatementConditional(
+                condition  = value,
+                yes_branch = makeStatementsSequenceFromStatement(
+                    statement = makeReturnConstant(stop_truth)
+                ),
+                no_branch  = None,
+                source_ref = source_ref
+            )
+
+        def makeAnyAllEnd():
+            return makeReturnConstant(not stop_truth)
+
+        emit_class = makeAnyAllStep
+        makeEndStatements = makeAnyAllEnd
+    else:
+        assert consumer_name in ("min", "max"), consumer_name
+
+        start_value = None
+
+        first_tmp = function_body.allocateTempVariable(
+            temp_scope = None,
+            name       = "first"
+        )
+        value_tmp = function_body.allocateTempVariable(
+            temp_scope = None,
+            name       = "value"
+        )
+        extra_tmps += [result_tmp, first_tmp, value_tmp]
+
+        # With a key, that is what is compared, and the best key is kept too.
+        if key is not None:
+            key_tmp = function_body.allocateTempVariable(
+                temp_scope = None,
+                name       = "key"
+            )
+            result_key_tmp = function_body.allocateTempVariable(
+                temp_scope = None,
+                name       = "result_key"
+            )
+            extra_tmps += [key_tmp, result_key_tmp]
+        else:
+            key_tmp = value_tmp
+            result_key_tmp = result_tmp
+
+        def makeFirstRef():
+            return ExpressionTempVariableRef(
+                variable   = first_tmp,
+                source_ref = source_ref
+            )
+
+        def makeValueRef():
+            return ExpressionTempVariableRef(
+                variable   = value_tmp,
+                source_ref = source_ref
+            )
+
+        def makeResultAssignment():
+            statements = [
+                StatementAssignmentVariable(
+                    variable   = result_tmp,
+                    source     = makeValueRef(),
+                    source_ref = source_ref
+                )
+            ]
+
+            if key is not None:
+                statements.append(
+                    StatementAssignmentVariable(
+                        variable   = result_key_tmp,
+                        source     = ExpressionTempVariableRef(
+                            variable   = key_tmp,
+                            source_ref = source_ref
+                        ),
+                        source_ref = source_ref
+                    )
+                )
+
+            return makeStatementsSequenceFromStatements(*statements)
+
+        init_statements.append(
+            StatementAssignmentVariable(
+                variable   = first_tmp,
+                source     = makeConstantRefNode(
+                    constant   = True,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+
+        # Same as the built-in, the new item is the left operand.
+        def makeMinMaxStep(value, source_ref):
+            statements = [
+                StatementAssignmentVariable(
+                    variable   = value_tmp,
+                    source     = value,
+                    source_ref = source_ref
+                )
+            ]
+
+            if key is not None:
+                statements.append(
+                    StatementAssignmentVariable(
+                        variable   = key_tmp,
+                        source     = buildNode(
+                            provider   = function_body,
+                            node       = key,
+                            source_ref = source_ref
+                        ),
+                        source_ref = source_ref
+                    )
+                )
+
+            statements.append(
+                StatementConditional(
+                    condition  = makeFirstRef(),
+                    yes_branch = makeStatementsSequenceFromStatements(
+                        StatementAssignmentVariable(
+                            variable   = first_tmp,
+                            source     = makeConstantRefNode(
+                                constant   = False,
+                                source_ref = source_ref
+                            ),
+                            source_ref = source_ref
+                        ),
+                        makeResultAssignment()
+                    ),
+                    no_branch  = makeStatementsSequenceFromStatement(
+                        statement = StatementConditional(
+                            condition  = makeComparisonNode(
+                                left       = ExpressionTempVariableRef(
+                                    variable   = key_tmp,
+                                    source_ref = source_ref
+                                ),
+                                right      = ExpressionTempVariableRef(
+                                    variable   = result_key_tmp,
+                                    source_ref = source_ref
+                                ),
+                                comparator = "Lt" if consumer_name == "min" else "Gt",
+                                source_ref = source_ref
+                            ),
+                            yes_branch = makeResultAssignment(),
+                            no_branch  = None,
+                            source_ref = source_ref
+                        )
+                    ),
+                    source_ref = source_ref
+                )
+            )
+
+            return makeStatementsSequenceFromStatements(*statements)
+
+        def makeMinMaxEnd():
+            return makeStatementsSequenceFromStatements(
+                StatementConditional(
+                    condition  = makeFirstRef(),
+                    yes_branch = makeStatementsSequenceFromStatement(
+                        statement = StatementRaiseException(
+                            exception_type  = ExpressionBuiltinMakeException(
+                                exception_name = "ValueError",
+                                args           = (
+                                    makeConstantRefNode(
+                                        constant      = "%s() arg is an empty sequence" % consumer_name,
+                                        source_ref    = source_ref,
+                                        user_provided = True
+                                    ),
+                                ),
+                                source_ref     = source_ref
+                            ),
+                            exception_value = None,
+                            exception_trace = None,
+                            exception_cause = None,
+                            source_ref      = source_ref
+                        )
+                    ),
+                    no_branch  = None,
+                    source_ref = source_ref
+                ),
+                makeReturnResult()
+            )
+
+        emit_class = makeMinMaxStep
+        makeEndStatements = makeMinMaxEnd
+
+    statements, release_statements = _buildContractionBodyNode(
+        function_body   = function_body,
+        provider        = provider,
+        node            = node,
+        emit_class      = emit_class,
+        iter_tmp        = iter_tmp,
+        temp_scope      = None,
+        start_value     = start_value,
+        container_tmp   = result_tmp if start_value is not None else None,
+        assign_provider = False,
+        source_ref      = source_ref,
+        # A "StopIteration" raised by the generator expression only ends it,
+        # and with that the consumption, but not one raised by the consumer.
+        stop_handler    = makeEndStatements if stop_iteration_ends else None
+    )
+
+    release_statements += [
+        StatementReleaseVariable(
+            variable   = extra_tmp,
+            source_ref = source_ref
+        )
+        for extra_tmp in
+        extra_tmps
+    ]
+
+    statements = init_statements + statements + [
+        makeEndStatements()
+    ]
+
+    statements = (
+        makeTryFinallyStatement(
+            provider   = function_body,
+            tried      = statements,
+            final      = release_statements,
+            source_ref = source_ref.atInternal()
+        ),
+    )
+
+    return _makeContractionFunctionCall(
+        provider      = provider,
+        node          = node,
+        function_body = function_body,
+        code_object   = code_object,
+        statements    = statements,
+        source_ref    = source_ref
+    )
+
+
+def _makeBuiltinNamesCheck(provider, name_nodes, source_ref):
+    return buildAndNode(
+        values     = [
+            ExpressionComparisonIs(
+                left       = buildNode(provider, name_node, source_ref),
+                right      = ExpressionBuiltinRef(
+                    builtin_name = name_node.id,
+                    source_ref   = source_ref
+                ),
+                source_ref = source_ref
+            )
+            for name_node in
+            name_nodes
+        ],
+        source_ref = source_ref
+    )
+
+
+def buildGeneratorExpressionConsumerNode(provider, node, call_node,
+                                         source_ref):
+    """ Build a call of a built-in consuming a generator expression.
+
+    The name might not refer to the built-in at run time, so the loop is
+    guarded by an identity check, and the normal call is the alternative.
+    Optimization will decide the check for the usual case.
+    """
+
+    consumer_name = node.func.id
+
+    return ExpressionConditional(
+        condition      = _makeBuiltinNamesCheck(
+            provider   = provider,
+            name_nodes = (node.func,),
+            source_ref = source_ref
+        ),
+        expression_yes = _buildGeneratorExpressionConsumerLoop(
+            provider      = provider,
+            node          = node.args[0],
+            consumer_name = consumer_name,
+            source_ref    = source_ref
+        ),
+        expression_no  = call_node,
+        source_ref     = source_ref
+    )
+
+
+# Names that give access to the local variables, these would see those of
+# the loop rather than the ones of the lambda.
+_lambda_locals_names = ("locals", "vars", "dir", "eval", "exec")
+
+
+def _getInlinableLambdaArgName(node):
+    """ Name of the only argument of a lambda, if its body can be in-lined.
+
+    The body becomes part of a loop, with the argument as the loop variable,
+    and nothing in it must see that it's not a call of its own.
+    """
+
+    if getKind(node) != "Lambda":
+        return None
+
+    args = node.args
+
+    if len(args.args) != 1 or args.defaults or args.vararg or args.kwarg or \
+       getattr(args, "kwonlyargs", None):
+        return None
+
+    if python_version < 300:
+        # Tuple parameters are unpacked, not worth it.
+        if getKind(args.args[0]) != "Name":
+            return None
+
+        arg_name = args.args[0].id
+    else:
+        arg_name = args.args[0].arg
+
+    for sub_node in ast.walk(node.body):
+        kind = getKind(sub_node)
+
+        # Closures taken would share the loop variable, where each call of
+        # the lambda has its own.
+        if kind in ("Lambda", "GeneratorExp", "ListComp", "SetComp",
+                    "DictComp"):
+            return None
+
+        # These make it a generator or coroutine function.
+        if kind in ("Yield", "YieldFrom", "Await"):
+            return None
+
+        if kind == "Name" and sub_node.id in _lambda_locals_names:
+            return None
+
+    return arg_name
+
+
+def _makeLambdaLoopNode(lambda_node, arg_name, iterable, element, condition):
+    def makeName(context):
+        return ast.copy_location(
+            ast.Name(
+                id  = arg_name,
+                ctx = context
+            ),
+            lambda_node
+        )
+
+    return ast.copy_location(
+        ast.GeneratorExp(
+            elt        = element if element is not None else makeName(ast.Load()),
+            generators = [
+                ast.comprehension(
+                    target = makeName(ast.Store()),
+                    iter   = iterable,
+                    ifs    = [condition] if condition is not None else []
+                )
+            ]
+        ),
+        lambda_node
+    )
+
+
+def _hasPlainArgs(node, count):
+    if len(node.args) != count:
+        return False
+
+    for arg in node.args:
+        if getKind(arg) == "Starred":
+            return False
+
+    return not getattr(node, "starargs", None) and \
+           not getattr(node, "kwargs", None)
+
+
+def _getLambdaConsumerCallDetails(node):
+    # Only few forms of calls are matched, pylint: disable=too-many-return-statements
+
+    if getKind(node.func) != "Name":
+        return None
+
+    # The key function of "min" and "max" is called on each item, e.g.
+    # "max(x, key = lambda v: v[1])".
+    if node.func.id in ("min", "max"):
+        if not _hasPlainArgs(node, 1) or len(node.keywords) != 1 or \
+           node.keywords[0].arg != "key":
+            return None
+
+        lambda_node = node.keywords[0].value
+        arg_name = _getInlinableLambdaArgName(lambda_node)
+
+        if arg_name is None:
+            return None
+
+        loop_node = _makeLambdaLoopNode(
+            lambda_node = lambda_node,
+            arg_name    = arg_name,
+            iterable    = node.args[0],
+            element     = None,
+            condition   = None
+        )
+
+        # A "StopIteration" from the key function is not the end of the
+        # iteration.
+        return (node.func,), loop_node, lambda_node.body, False
+
+    # For Python3, "map" and "filter" are iterators, when consumed right away,
+    # e.g. "sum(map(lambda v: v*2, x))", their loop can be that of the
+    # consumer. For Python2, these create a list of their own and are not
+    # considered.
+    if python_version < 300 or \
+       node.func.id not in _generator_consumer_names or \
+       not _hasPlainArgs(node, 1) or node.keywords:
+        return None
+
+    inner_node = node.args[0]
+
+    if getKind(inner_node) != "Call" or \
+       getKind(inner_node.func) != "Name" or \
+       inner_node.func.id not in ("map", "filter") or \
+       not _hasPlainArgs(inner_node, 2) or inner_node.keywords:
+        return None
+
+    lambda_node = inner_node.args[0]
+    arg_name = _getInlinableLambdaArgName(lambda_node)
+
+    if arg_name is None:
+        return None
+
+    if inner_node.func.id == "map":
+        element = lambda_node.body
+        condition = None
+    else:
+        element = None
+        condition = lambda_node.body
+
+    loop_node = _makeLambdaLoopNode(
+        lambda_node = lambda_node,
+        arg_name    = arg_name,
+        iterable    = inner_node.args[1],
+        element     = element,
+        condition   = condition
+    )
+
+    # A "StopIteration" from the lambda ends the iterator, same as one
+    # from the generator expression does.
+    return (node.func, inner_node.func), loop_node, None, True
+
+
+def isLambdaConsumerCall(provider, node):
+    """ Is this call a built-in applying a lambda to items it consumes.
+
+    For full compatibility, this is not done, as the traceback would not
+    be the same, e.g. for errors during iteration.
+    """
+
+    if Options.isFullCompat():
+        return False
+
+    if _getLambdaConsumerCallDetails(node) is None:
+        return False
+
+    return _isBuiltinNameCheckable(provider)
+
+
+def buildLambdaConsumerNode(provider, node, call_node, source_ref):
+    """ Build a call of a built-in applying a lambda to consumed items.
+
+    The lambda body is done in the loop of the consumer, so no function
+    object is created and called for each item. Like for generator
+    expressions given to built-ins, the names are checked to be the
+    built-ins at run time.
+    """
+
+    name_nodes, loop_node, key, stop_iteration_ends = \
+      _getLambdaConsumerCallDetails(node)
+
+    return ExpressionConditional(
+        condition      = _makeBuiltinNamesCheck(
+            provider   = provider,
+            name_nodes = name_nodes,
+            source_ref = source_ref
+        ),
+        expression_yes = _buildGeneratorExpressionConsumerLoop(
+            provider            = provider,
+            node                = loop_node,
+            consumer_name       = node.func.id,
+            source_ref          = source_ref,
+            function_name       = "<lambda>",
+            key                 = key,
+            stop_iteration_ends = stop_iteration_ends
+        ),
+        expression_no  = call_node,
+        source_ref     = source_ref
+    )
+
+
 def _buildContractionBodyNode(provider, node, emit_class, start_value,
                               container_tmp, iter_tmp, temp_scope,
-                              assign_provider, function_body, source_ref):
+                              assign_provider, function_body, source_ref,
+                              stop_handler = None):
 
     # This uses lots of variables and branches. There is no good way
     # around that, and we deal with many cases, due to having generator
@@ -313,6 +1007,21 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
     # Note: The assign_provider is only to cover Python2 list contractions,
     # assigning one of the loop variables to the outside scope.
 
+    # Note: The stop_handler is only for generator expressions fused into a
+    # consumer, where a "StopIteration" raised by what the generator
+    # expression does, ends it, but not one raised by the consumer.
+
+    def wrapStopHandler(statement):
+        if stop_handler is None:
+            return statement
+
+        return makeTryExceptSingleHandlerNode(
+            tried          = statement,
+            exception_name = "StopIteration",
+            handler_body   = stop_handler(),
+            source_ref     = source_ref
+        )
+
     tmp_variables = []
 
     if assign_provider:
@@ -350,29 +1059,48 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
         )
 
 
+    element_statement = None
+
     if hasattr(node, "elt"):
+        element = buildNode(
+            provider   = function_body,
+            node       = node.elt,
+            source_ref = source_ref
+        )
+
+        if stop_handler is not None:
+            element_tmp = function_body.allocateTempVariable(
+                temp_scope = temp_scope,
+                name       = "element"
+            )
+
+            tmp_variables.append(element_tmp)
+
+            element_statement = wrapStopHandler(
+                StatementAssignmentVariable(
+                    variable   = element_tmp,
+                    source     = element,
+                    source_ref = source_ref
+                )
+            )
+
+            element = ExpressionTempVariableRef(
+                variable   = element_tmp,
+                source_ref = source_ref
+            )
+
         if start_value is not None:
             current_body = emit_class(
                 ExpressionTempVariableRef(
                     variable   = container_tmp,
                     source_ref = source_ref
                 ),
-                buildNode(
-                    provider   = function_body,
-                    node       = node.elt,
-                    source_ref = source_ref
-                ),
+                element,
                 source_ref = source_ref
             )
         else:
-            assert emit_class is ExpressionYield
-
             current_body = emit_class(
-                buildNode(
-                    provider   = function_body,
-                    node       = node.elt,
-                    source_ref = source_ref
-                ),
+                element,
                 source_ref = source_ref
             )
     else:
@@ -402,6 +1130,12 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
             source_ref = source_ref
         )
 
+    if element_statement is not None:
+        current_body = makeStatementsSequenceFromStatements(
+            element_statement,
+            current_body
+        )
+
     for count, qual in enumerate(reversed(node.generators)):
         tmp_value_variable = function_body.allocateTempVariable(
             temp_scope = temp_scope,
@@ -442,10 +1176,12 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
             tmp_variables.append(tmp_iter_variable)
 
             nested_statements = [
-                StatementAssignmentVariable(
-                    variable   = tmp_iter_variable,
-                    source     = value_iterator,
-                    source_ref = source_ref
+                wrapStopHandler(
+                    StatementAssignmentVariable(
+                        variable   = tmp_iter_variable,
+                        source     = value_iterator,
+                        source_ref = source_ref
+                    )
                 )
             ]
 
@@ -470,15 +1206,17 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
                 ),
                 source_ref     = source_ref
             ),
-            buildAssignmentStatements(
-                provider      = provider if assign_provider else function_body,
-                temp_provider = function_body,
-                node          = qual.target,
-                source        = ExpressionTempVariableRef(
-                    variable   = tmp_value_variable,
-                    source_ref = source_ref
-                ),
-                source_ref    = source_ref
+            wrapStopHandler(
+                buildAssignmentStatements(
+                    provider      = provider if assign_provider else function_body,
+                    temp_provider = function_body,
+                    node          = qual.target,
+                    source        = ExpressionTempVariableRef(
+                        variable   = tmp_value_variable,
+                        source_ref = source_ref
+                    ),
+                    source_ref    = source_ref
+                )
             )
         ]
 
@@ -489,12 +1227,42 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
         )
 
         if len(conditions) >= 1:
+            condition = buildAndNode(
+                values     = conditions,
+                source_ref = source_ref
+            )
+
+            # The truth check of the condition is also done by the generator
+            # expression, so do it in the handler too.
+            if stop_handler is not None:
+                condition_tmp = function_body.allocateTempVariable(
+                    temp_scope = temp_scope,
+                    name       = "condition_%d" % count
+                )
+
+                tmp_variables.append(condition_tmp)
+
+                loop_statements.append(
+                    wrapStopHandler(
+                        StatementAssignmentVariable(
+                            variable   = condition_tmp,
+                            source     = ExpressionBuiltinBool(
+                                value      = condition,
+                                source_ref = source_ref
+                            ),
+                            source_ref = source_ref
+                        )
+                    )
+                )
+
+                condition = ExpressionTempVariableRef(
+                    variable   = condition_tmp,
+                    source_ref = source_ref
+                )
+
             loop_statements.append(
                 StatementConditional(
-                    condition  = buildAndNode(
-                        values     = conditions,
-                        source_ref = source_ref
-                    ),
+                    condition  = condition,
                     yes_branch = makeStatementsSequenceFromStatement(
                         statement = current_body
                     ),
@@ -543,12 +1311,7 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
     return statements, release_statements
 
 
-def _buildContractionNode(provider, node, name, emit_class, start_value,
-                          source_ref):
-    # The contraction nodes are reformulated to function bodies, with loops as
-    # described in the developer manual. They use a lot of temporary names,
-    # nested blocks, etc. and so a lot of variable names.
-
+def _makeContractionFunctionBody(provider, name, source_ref):
     # TODO: No function ought to be necessary, only a variable scope is.
     function_body = ExpressionFunctionBody(
         provider   = provider,
@@ -586,6 +1349,59 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
         future_spec       = parent_module.getFutureSpec()
     )
 
+    return function_body, iter_tmp, code_object
+
+
+def _makeContractionFunctionCall(provider, node, function_body, code_object,
+                                 statements, source_ref):
+    function_body.setBody(
+        makeStatementsSequenceFromStatement(
+            statement = StatementsFrameFunction(
+                statements  = mergeStatements(statements, False),
+                code_object = code_object,
+                source_ref  = source_ref
+            )
+        )
+    )
+
+    return ExpressionFunctionCall(
+        function   = ExpressionFunctionCreation(
+            function_ref = ExpressionFunctionRef(
+                function_body = function_body,
+                source_ref    = source_ref
+            ),
+            code_object  = code_object,
+            defaults     = (),
+            kw_defaults  = None,
+            annotations  = None,
+            source_ref   = source_ref
+        ),
+        values     = (
+            ExpressionBuiltinIter1(
+                value      = buildNode(
+                    provider   = provider,
+                    node       = node.generators[0].iter,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            ),
+        ),
+        source_ref = source_ref
+    )
+
+
+def _buildContractionNode(provider, node, name, emit_class, start_value,
+                          source_ref):
+    # The contraction nodes are reformulated to function bodies, with loops as
+    # described in the developer manual. They use a lot of temporary names,
+    # nested blocks, etc. and so a lot of variable names.
+
+    function_body, iter_tmp, code_object = _makeContractionFunctionBody(
+        provider   = provider,
+        name       = name,
+        source_ref = source_ref
+    )
+
     container_tmp = function_body.allocateTempVariable(
         temp_scope = None,
         name       = "contraction_result"
@@ -625,37 +1441,11 @@ def _buildContractionNode(provider, node, name, emit_class, start_value,
         ),
     )
 
-    function_body.setBody(
-        makeStatementsSequenceFromStatement(
-            statement = StatementsFrameFunction(
-                statements  = mergeStatements(statements, False),
-                code_object = code_object,
-                source_ref  = source_ref
-            )
-        )
-    )
-
-    return ExpressionFunctionCall(
-        function   = ExpressionFunctionCreation(
-            function_ref = ExpressionFunctionRef(
-                function_body = function_body,
-                source_ref    = source_ref
-            ),
-            code_object  = code_object,
-            defaults     = (),
-            kw_defaults  = None,
-            annotations  = None,
-            source_ref   = source_ref
-        ),
-        values     = (
-            ExpressionBuiltinIter1(
-                value      = buildNode(
-                    provider   = provider,
-                    node       = node.generators[0].iter,
-                    source_ref = source_ref
-                ),
-                source_ref = source_ref
-            ),
-        ),
-        source_ref = source_ref
+    return _makeContractionFunctionCall(
+        provider      = provider,
+        node          = node,
+        function_body = function_body,
+        code_object   = code_object,
+        statements    = statements,
+        source_ref    = source_ref
     )
@@ -0,0 +1,64 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Samples of the profiler.
+
+Compiled programs made with "--profile" and the profiler tool write collapsed
+stacks, one per line with a count, the frames separated by ";" and labelled
+by code name, source file basename and first line number. These are read by
+the profiler tool, and by the compiler to find hot modules.
+"""
+
+
+def readSamples(filename):
+    """ Read a collapsed stack samples file.
+
+    Returns a dictionary of stacks, being tuples with the outermost frame
+    first, to their sample count.
+    """
+
+    result = {}
+
+    with open(filename) as samples_file:
+        for line in samples_file:
+            line = line.rstrip('\n')
+
+            if not line:
+                continue
+
+            stack, count = line.rsplit(' ', 1)
+            stack = tuple(stack.split(';'))
+
+            result[stack] = result.get(stack, 0) + int(count)
+
+    return result
+
+
+def parseFrameLabel(label):
+    """ Split a frame label into code name, file basename and line number.
+
+    Returns None for labels not made for code objects, e.g. the ones for
+    samples that could not be attributed.
+    """
+
+    if not label.endswith(')') or " (" not in label:
+        return None
+
+    code_name, location = label[:-1].rsplit(" (", 1)
+    filename, line_number = location.rsplit(':', 1)
+
+    return code_name, filename, int(line_number)
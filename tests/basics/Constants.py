@@ -164,3 +164,66 @@ min_signed_long = long(-(2**(8*8-1)-1)-1)
 print("Small long", min_signed_long, type(min_signed_long))
 min_signed_long = long(-(2**(8*4-1)-1)-1)
 print("Small long", min_signed_long, type(min_signed_long))
+
+# Mutable constants that are only looked at need no copy, but these must not
+# be shared otherwise, or else a second call would see the changes of the first.
+def mutableConstantLookedAt():
+    a = [1, 2]
+    print("Looked at only:", a[0], 2 in a, [x for x in a])
+
+def mutableConstantChangedThroughLocals():
+    a = [1, 2]
+    locals()['a'].append(3)
+    print("Changed through locals:", a[-1], [x for x in a])
+
+def mutableConstantChangedThroughAlias():
+    a = [1, 2]
+    alias = a
+    alias.append(3)
+    print("Changed through alias:", a[-1], [x for x in a])
+
+def appendTo(value):
+    value.append(3)
+
+def mutableConstantChangedByCallee():
+    a = [1, 2]
+    appendTo(a)
+    print("Changed by callee:", a[-1], [x for x in a])
+
+def mutableConstantChangedByClosure():
+    a = [1, 2]
+
+    def closure():
+        a.append(3)
+
+    closure()
+    print("Changed by closure:", a[-1], [x for x in a])
+
+def mutableConstantChangedInplace():
+    a = [1, 2]
+    a += [3]
+    print("Changed in-place:", a[-1], [x for x in a])
+
+    b = {1, 2}
+    b |= {3}
+    print("Changed in-place:", 3 in b, sorted(b))
+
+    c = {'a' : 1}
+    c['a'] += 1
+    print("Changed item in-place:", c['a'], sorted(c))
+
+def mutableConstantChangedAfterIteration():
+    a = [1, 2]
+    for x in a:
+        pass
+    a.append(3)
+    print("Changed after iteration:", a[-1], [x for x in a])
+
+for _count in range(2):
+    mutableConstantLookedAt()
+    mutableConstantChangedThroughLocals()
+    mutableConstantChangedThroughAlias()
+    mutableConstantChangedByCallee()
+    mutableConstantChangedByClosure()
+    mutableConstantChangedInplace()
+    mutableConstantChangedAfterIteration()
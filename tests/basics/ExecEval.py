@@ -325,3 +325,27 @@ if str is not bytes:
         return eval(memoryview(value))
 
     print "Eval with memory view:", evalMemoryView(b"27")
+
+def execConstantSources():
+    for count in range(3):
+        exec "z = 6 * 7"
+        print "Constant exec source in loop gives", z, eval("z // 2"), eval(compile("z + 1", "<constant>", "eval"))
+
+        exec "w = %d" % count
+        print "Changing exec source in loop gives", w
+
+execConstantSources()
+
+def execConstantSyntaxErrors():
+    for source, kind in (("z = (", "exec"), ("1 +", "eval"), ("def", "compile")):
+        try:
+            if kind == "exec":
+                exec "z = ("
+            elif kind == "eval":
+                eval("1 +")
+            else:
+                compile("def", "<constant>", "exec")
+        except SyntaxError as e:
+            print "Constant %s source %r gives" % (kind, source), type(e), e.msg, e.lineno, "raised at line", sys.exc_info()[2].tb_lineno
+
+execConstantSyntaxErrors()
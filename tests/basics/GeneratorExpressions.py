@@ -228,3 +228,34 @@ def strangeLambdaGeneratorExpression():
     print(list(x))
 
 strangeLambdaGeneratorExpression()
+
+
+def consumerStopIteration():
+    class AddStops(object):
+        def __init__(self, value):
+            self.value = value
+
+        def __add__(self, other):
+            raise StopIteration
+
+        __radd__ = __add__
+
+    class LessStops(object):
+        def __lt__(self, other):
+            raise StopIteration
+
+        __gt__ = __lt__
+
+    print("StopIteration from consumer of generator expression:")
+
+    try:
+        print(sum(AddStops(i) for i in range(3)))
+    except StopIteration:
+        print("sum raised StopIteration")
+
+    try:
+        print(min(LessStops() for i in range(3)))
+    except StopIteration:
+        print("min raised StopIteration")
+
+consumerStopIteration()
@@ -64,3 +64,39 @@ def lambdaDirectCall():
     print("Lambda direct call gave", x)
 
 lambdaDirectCall()
+
+def lambdaConsumerStopIteration():
+    class AddStops(object):
+        def __add__(self, other):
+            raise StopIteration
+
+        __radd__ = __add__
+
+    print("StopIteration from consumer of lambda results:")
+
+    try:
+        print(sum(map(lambda x: AddStops(), range(3))))
+    except StopIteration:
+        print("sum raised StopIteration")
+
+    def stopAt(value):
+        if value == 2:
+            raise StopIteration
+        return value
+
+    try:
+        print(max(range(5), key = lambda x: stopAt(x)))
+    except StopIteration:
+        print("max raised StopIteration from key")
+
+    try:
+        print(sum(map(lambda x: stopAt(x), range(5))))
+    except StopIteration:
+        print("sum raised StopIteration from map")
+
+    try:
+        print(list(filter(lambda x: stopAt(x), range(5))))
+    except StopIteration:
+        print("list raised StopIteration from filter")
+
+lambdaConsumerStopIteration()
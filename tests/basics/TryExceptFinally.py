@@ -99,3 +99,32 @@ def tryScope5():
         pass
 
 tryScope5()
+
+print('*' * 20)
+
+class HashRaisingKeyError(object):
+    def __hash__(self):
+        raise KeyError("from hash")
+
+class EqRaisingKeyError(object):
+    def __hash__(self):
+        return hash(1)
+
+    def __eq__(self, other):
+        raise KeyError("from eq")
+
+def tryDictLookup(key):
+    d = {1: "one", "two": 2}
+
+    try:
+        value = d[key]
+    except KeyError:
+        value = "missing"
+
+    print("Dictionary lookup of", type(key).__name__, "gave", value)
+
+tryDictLookup(1)
+tryDictLookup("two")
+tryDictLookup(3)
+tryDictLookup(HashRaisingKeyError())
+tryDictLookup(EqRaisingKeyError())
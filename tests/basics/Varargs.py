@@ -61,3 +61,37 @@ print("Function with plain arg, varargs list and varargs dict:")
 list_dict_args_function(2, z = 3)
 list_dict_args_function(2, 3)
 list_dict_args_function(a = 2, b = 3, c = 4)
+
+print("Star dict argument giving a keyword argument again:")
+try:
+    dict_args_function(a = 1, **{'a' : 2})
+except TypeError as e:
+    print(repr(e))
+
+try:
+    list_dict_args_function(1, b = 2, *(3,), **{'b' : 4, 'c' : 5})
+except TypeError as e:
+    print(repr(e))
+
+print("Star dict argument with non-string keys:")
+try:
+    dict_args_function(**{1 : 2})
+except TypeError as e:
+    print(repr(e))
+
+try:
+    list_dict_args_function(1, *(2,), **{None : 3})
+except TypeError as e:
+    print(repr(e))
+
+def modifying_dict_args_function(**arg_dict):
+    arg_dict['b'] = 2
+    del arg_dict['a']
+
+    return sorted(arg_dict.items())
+
+print("Star dict argument modified by the called function:")
+caller_dict = {'a' : 1}
+print(modifying_dict_args_function(**caller_dict), caller_dict)
+print(modifying_dict_args_function(c = 3, **caller_dict), caller_dict)
+print(modifying_dict_args_function(*(), **caller_dict), caller_dict)
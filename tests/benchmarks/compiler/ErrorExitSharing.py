@@ -0,0 +1,121 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+""" Size of the generated C code with and without shared error exits.
+
+Error checks that have the same clean-up jump to one shared exit code. This
+generates C code for the given Python files as modules, once normally and
+once with "--experimental=unshared_error_exits", and reports the sizes of the
+C files and the number of lines for each.
+
+Give some Python files as arguments, e.g. some of the Nuitka sources
+themselves.
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+nuitka_binary = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "..",
+        "bin",
+        "nuitka"
+    )
+)
+
+
+def getGeneratedCodeSize(filename, extra_options):
+    output_dir = tempfile.mkdtemp(prefix = "nuitka-error-exits-")
+
+    try:
+        subprocess.check_call(
+            [
+                sys.executable,
+                nuitka_binary,
+                "--module",
+                "--generate-c-only",
+                "--output-dir=" + output_dir,
+                filename
+            ] + extra_options
+        )
+
+        size = 0
+        lines = 0
+
+        for root, _dirnames, filenames in os.walk(output_dir):
+            for c_filename in filenames:
+                if not c_filename.endswith(".c"):
+                    continue
+
+                # Helpers and constants do not depend on the module code.
+                if c_filename.startswith("__"):
+                    continue
+
+                with open(os.path.join(root, c_filename)) as c_file:
+                    code = c_file.read()
+
+                size += len(code)
+                lines += code.count('\n')
+
+        return size, lines
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def main():
+    total_shared = total_unshared = 0
+
+    for filename in sys.argv[1:]:
+        shared_size, shared_lines = getGeneratedCodeSize(filename, [])
+        unshared_size, unshared_lines = getGeneratedCodeSize(
+            filename,
+            ["--experimental=unshared_error_exits"]
+        )
+
+        total_shared += shared_size
+        total_unshared += unshared_size
+
+        print(
+            "%-40s %9d -> %9d bytes, %7d -> %7d lines, %5.1f%% smaller" % (
+                os.path.basename(filename),
+                unshared_size,
+                shared_size,
+                unshared_lines,
+                shared_lines,
+                100.0 - 100.0 * shared_size / unshared_size
+            )
+        )
+
+    if total_unshared:
+        print(
+            "Total %d -> %d bytes, %.1f%% smaller" % (
+                total_unshared,
+                total_shared,
+                100.0 - 100.0 * total_shared / total_unshared
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+""" Scaling of the compiler module bookkeeping with many modules.
+
+Standalone builds can have many thousands of modules. This registers that many
+synthetic modules with the module registry and import cache, and then does
+the look-ups an optimization pass would do, for a growing number of modules.
+With indexed look-ups, the time per module is to stay about the same.
+
+Run with "PYTHONPATH" pointing to the Nuitka source directory.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+from nuitka import ModuleRegistry
+from nuitka.importing import ImportCache
+
+
+class SyntheticModule(object):
+    """ Just enough of the module interface for the bookkeeping. """
+
+    def __init__(self, package_name, count):
+        self.package_name = package_name
+        self.full_name = "%s.module_%d" % (package_name, count)
+        self.filename = os.path.join(
+            package_name.replace('.', os.path.sep),
+            "module_%d.py" % count
+        )
+
+    def getFullName(self):
+        return self.full_name
+
+    def getCodeName(self):
+        return self.full_name.replace('.', "__")
+
+    def getFilename(self):
+        return self.filename
+
+    @staticmethod
+    def isInternalModule():
+        return False
+
+    @staticmethod
+    def isMainModule():
+        return False
+
+    def startTraversal(self):
+        pass
+
+
+def makeModules(module_count):
+    return [
+        SyntheticModule("package_%d" % (count % 50), count)
+        for count in
+        range(module_count)
+    ]
+
+
+def simulateCompilation(modules, passes):
+    for module in modules:
+        ImportCache.addImportedModule(module)
+
+    ModuleRegistry.addRootModule(modules[0])
+
+    for _count in range(passes):
+        ModuleRegistry.startTraversal()
+
+        for module in modules:
+            ModuleRegistry.addUsedModule(module)
+
+        while True:
+            current_module = ModuleRegistry.nextModule()
+
+            if current_module is None:
+                break
+
+            # Package and imports resolution.
+            ModuleRegistry.getModuleByName(current_module.package_name)
+            ModuleRegistry.getModuleByName(current_module.getFullName())
+            ImportCache.isImportedModuleByPath(current_module.getFilename())
+
+        # Done after each pass.
+        ModuleRegistry.getDoneModules()
+        ModuleRegistry.getDoneModules()
+        ModuleRegistry.getDoneUserModules()
+
+
+def resetRegistry():
+    ModuleRegistry.root_modules.clear()
+    ModuleRegistry.root_modules_by_code_name.clear()
+    ImportCache.imported_modules.clear()
+    ImportCache.imported_by_name.clear()
+    ImportCache.imported_by_path.clear()
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    for module_count in (1000, 2000, 4000, 8000):
+        modules = makeModules(module_count)
+
+        start = time.time()
+        simulateCompilation(modules, passes)
+        took = time.time() - start
+
+        print(
+            "%5d modules: %.3fs, %.1fus per module and pass" % (
+                module_count,
+                took,
+                took * 1000000 / module_count / passes
+            )
+        )
+
+        resetRegistry()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#     Copyright 2017, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+""" Startup time of standalone binaries with and without startup layout.
+
+This compiles the given Python program in standalone mode, once normally and
+once with "--startup-layout", and runs each binary repeatedly, with the page
+cache warm, and with the files of the distribution folder dropped from the
+page cache before each run, which is what a cold start sees. Dropping them
+needs "os.posix_fadvise", i.e. Python3 on a POSIX system, otherwise only warm
+starts are measured.
+
+Give a Python program and optionally the number of runs as arguments, e.g. a
+program that imports a lot, and exits right away.
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+nuitka_binary = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "..",
+        "bin",
+        "nuitka"
+    )
+)
+
+
+def buildProgram(filename, output_dir, extra_options):
+    subprocess.check_call(
+        [
+            sys.executable,
+            nuitka_binary,
+            "--standalone",
+            "--output-dir=" + output_dir,
+            filename
+        ] + extra_options
+    )
+
+    dist_dir = os.path.join(
+        output_dir,
+        os.path.basename(filename)[:-3] + ".dist"
+    )
+
+    return dist_dir, os.path.join(
+        dist_dir,
+        os.path.basename(filename)[:-3] + ".exe"
+    )
+
+
+def dropFromPageCache(dist_dir):
+    for root, _dirnames, filenames in os.walk(dist_dir):
+        for filename in filenames:
+            fd = os.open(os.path.join(root, filename), os.O_RDONLY)
+
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+
+def measureStartup(dist_dir, binary, runs, cold):
+    timings = []
+
+    with open(os.devnull, 'w') as devnull:
+        # Warm up, or for cold starts, make sure it works at all.
+        subprocess.check_call([binary], stdout = devnull)
+
+        for _count in range(runs):
+            if cold:
+                dropFromPageCache(dist_dir)
+
+            start = time.time()
+            subprocess.check_call([binary], stdout = devnull)
+            timings.append(time.time() - start)
+
+    timings.sort()
+
+    return timings[len(timings) // 2]
+
+
+def main():
+    filename = sys.argv[1]
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    cold_modes = [False]
+    if hasattr(os, "posix_fadvise"):
+        cold_modes.append(True)
+
+    output_dir = tempfile.mkdtemp(prefix = "nuitka-startup-")
+
+    try:
+        results = {}
+
+        for layout in (False, True):
+            dist_dir, binary = buildProgram(
+                filename      = filename,
+                output_dir    = os.path.join(output_dir, str(layout)),
+                extra_options = ["--startup-layout"] if layout else []
+            )
+
+            for cold in cold_modes:
+                results[layout, cold] = measureStartup(
+                    dist_dir = dist_dir,
+                    binary   = binary,
+                    runs     = runs,
+                    cold     = cold
+                )
+
+        for cold in cold_modes:
+            print(
+                "%s start: %.1f ms -> %.1f ms with startup layout (median of %d)" % (
+                    "Cold" if cold else "Warm",
+                    1000 * results[False, cold],
+                    1000 * results[True, cold],
+                    runs
+                )
+            )
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == "__main__":
+    main()